@@ -1,12 +1,18 @@
 """The HED Lab Metadata class for storing HED (Hierarchical Event Descriptors) information."""
 
-from typing import Union
+import hashlib
+import threading
+from typing import List, Optional, Union
+import h5py
 from hdmf.utils import docval, popargs
-from hed.errors import get_printable_issue_string, ErrorSeverity
-from hed.schema import load_schema_version, HedSchema, HedSchemaGroup
+from hed.errors import get_printable_issue_string, ErrorSeverity, HedExceptions, HedFileError
+from hed.schema import HedSchema, HedSchemaGroup
 from hed.models import DefinitionDict
-from pynwb import register_class
+from hed.models.definition_entry import DefinitionEntry
+from pynwb import register_class, register_map
 from pynwb.file import LabMetaData
+from pynwb.io.core import NWBContainerMapper
+from .utils.schema_cache import get_schema_cache
 
 
 @register_class("HedLabMetaData", "ndx-hed")
@@ -14,6 +20,27 @@ class HedLabMetaData(LabMetaData):
     """
     Stores the HED schema version for the NWBFile. The object name is fixed to "hed_schema".
 
+    By default the HED schema is loaded and the definitions are parsed (and checked) when the object is
+    constructed, so writers get errors right away. An object read from a file (or constructed with
+    ``lazy=True``) defers both until the schema or definitions are first needed, by get_hed_schema(),
+    get_definition_dict(), the definitions, or validation, so opening a HED-annotated file for its other
+    data costs no schema load. Errors in the stored schema version or definitions are then raised (as
+    ValueError) on that first use.
+
+    The definitions are written as the ``definitions`` attribute (one string). With
+    ``use_definitions_table=True`` they are also written as the ``definitions_table`` dataset, one row of
+    (name, takes_value, contents, content_hash) per definition. A file with a definitions table is read with
+    ``use_definitions_table`` set and the definitions come from the table, the attribute (a copy kept for readers
+    of versions of the ndx-hed namespace before 1.1.0, which have no table) being ignored: the table stays unread
+    until the definitions are needed, each row is then checked against its content_hash (a mismatch raises
+    HedFileError) and parsed as its own definition, and get_definition() reads and parses just the definition it
+    is asked for.
+
+    The serialized definitions (see extract_definitions) are cached. A DefinitionDict normally only grows (a
+    duplicate definition is reported as an issue rather than replacing the original), so definitions added
+    later are serialized and appended to the cache rather than re-serializing all of them. The cache records
+    which definitions (names and entries, in order) it holds, and is rebuilt if the DefinitionDict changed in
+    any other way, e.g. a definition deleted or replaced directly in the DefinitionDict of get_definition_dict().
     """
 
     __nwbfields__ = ("_hed_schema", "hed_schema_version", "_definition_dict")
@@ -26,28 +53,136 @@ class HedLabMetaData(LabMetaData):
             "doc": "A string containing one or more HED definitions.",
             "default": None,
         },
+        {
+            "name": "definitions_table",
+            "type": ("array_data", "data"),
+            "doc": "The definitions as rows of (name, takes_value, contents, content_hash), as read from a file.",
+            "default": None,
+        },
+        {
+            "name": "use_definitions_table",
+            "type": bool,
+            "doc": "Also write the definitions as the definitions_table dataset (the attribute is always written).",
+            "default": False,
+        },
+        {
+            "name": "lazy",
+            "type": bool,
+            "doc": "Defer loading the schema and parsing the definitions until first use (always done on read).",
+            "default": False,
+        },
     )
     def __init__(self, **kwargs):
         hed_schema_version = popargs("hed_schema_version", kwargs)
         definitions = popargs("definitions", kwargs)
+        definitions_table = popargs("definitions_table", kwargs)
+        use_definitions_table = popargs("use_definitions_table", kwargs)
+        lazy = popargs("lazy", kwargs)
         kwargs["name"] = "hed_schema"
         super().__init__(**kwargs)
         self.hed_schema_version = hed_schema_version
-        self._init_internal(definitions)
+        self.use_definitions_table = use_definitions_table or definitions_table is not None
+        self._pending_definitions = definitions
+        self._stored_definitions_table = definitions_table
+        self._serialized_entries = []
+        self._serialized_definitions = []
+        self._definitions_string = None
+        # Serializes the deferred loading of this object's schema and definitions (see _ensure_loaded).
+        self._load_lock = threading.Lock()
+        if not (lazy or self._in_construct_mode):
+            self._ensure_loaded()
 
     @property
     def definitions(self):
         """Get the definitions as a string."""
-        if len(self._definition_dict.defs) == 0:
+        if len(self.get_definition_dict().defs) == 0:
             return None
         return self.extract_definitions()
 
+    @property
+    def is_loaded(self) -> bool:
+        """True if the HED schema has been loaded and the definitions parsed."""
+        return self._definition_dict is not None
+
+    def _ensure_loaded(self):
+        """Load the HED schema and parse the definitions if that was deferred (see the class documentation)."""
+        if self._definition_dict is not None:
+            return
+        with self._load_lock:
+            if self._definition_dict is None:
+                # A definitions attribute next to a definitions table is a copy of it for older readers.
+                definitions = self._pending_definitions
+                if self._stored_definitions_table is not None:
+                    definitions = definition_strings_from_table(self._stored_definitions_table)
+                self._init_internal(definitions)
+                self._pending_definitions = None
+                self._stored_definitions_table = None
+
+    @property
+    def definitions_table(self) -> Optional[list]:
+        """
+        The definitions as rows of (name, takes_value, contents, content_hash), or None if there are none.
+
+        The table read from a file is returned as is while the definitions have not been parsed.
+        """
+        if self._stored_definitions_table is not None:
+            return self._stored_definitions_table
+        rows = [definition_table_row(name, entry) for name, entry in self.get_definition_dict().items()]
+        return rows or None
+
+    @property
+    def _definitions_to_write(self) -> Optional[str]:
+        """The definitions attribute to write, which is always written (also next to a definitions table)."""
+        return self.definitions
+
+    @property
+    def _definitions_table_to_write(self) -> Optional[list]:
+        """The definitions table to write, if the definitions are written as a table."""
+        return self.definitions_table if self.use_definitions_table else None
+
+    def get_definition(self, name: str) -> Optional[DefinitionEntry]:
+        """
+        Get one definition by name.
+
+        If the definitions come from a definitions table and have not been parsed yet, only the row of this
+        definition is parsed (the parsed definitions are not kept); otherwise the DefinitionDict is used.
+
+        Parameters:
+            name (str): The name of the definition (case-insensitive).
+
+        Returns:
+            DefinitionEntry or None: The definition, or None if there is no definition with this name.
+
+        Raises:
+            ValueError: If the schema cannot be loaded or the definition cannot be parsed.
+        """
+        table = self._stored_definitions_table
+        if table is None or self.is_loaded:
+            return self.get_definition_dict().get(name)
+        dataset = _h5py_dataset(table)
+        names = dataset.fields("name")[()] if dataset is not None else [row[0] for row in table]
+        for index, row_name in enumerate(names):
+            if _text(row_name).casefold() == name.casefold():
+                try:
+                    hed_schema = get_schema_cache().get(self.hed_schema_version)
+                except Exception as e:
+                    raise ValueError(f"Failed to load HED schema version {self.hed_schema_version}: {e}") from e
+                row = dataset[index] if dataset is not None else table[index]
+                definition_dict = DefinitionDict(definition_strings_from_table([row]), hed_schema)
+                errors = [issue for issue in definition_dict.issues if issue["severity"] < ErrorSeverity.WARNING]
+                if errors:
+                    raise ValueError(f"Definition {name} has issues: {get_printable_issue_string(errors)}")
+                return definition_dict.get(name)
+        return None
+
     def _init_internal(self, original_definitions: Union[str, list, dict, None]):
         """
         Load the HED schema and initialize the internal DefinitionDict.
 
         This internal method is called during initialization to set up the
         HED schema object and create a DefinitionDict from any provided definitions.
+        The schema is taken from the process-wide schema cache (see utils.schema_cache),
+        so it is loaded once per version rather than once per HedLabMetaData.
 
         Parameters:
             original_definitions (str or list or Dict[str, DefinitionEntry] or None):
@@ -60,19 +195,22 @@ class HedLabMetaData(LabMetaData):
                        definitions cannot be parsed into a valid DefinitionDict.
         """
         try:
-            self._hed_schema = load_schema_version(self.hed_schema_version)
+            hed_schema = get_schema_cache().get(self.hed_schema_version)
         except Exception as e:
             raise ValueError(f"Failed to load HED schema version {self.hed_schema_version}: {e}") from e
 
         try:
-            self._definition_dict = DefinitionDict(original_definitions, self._hed_schema)
-            errors = [issue for issue in self._definition_dict.issues if issue["severity"] < ErrorSeverity.WARNING]
+            definition_dict = DefinitionDict(original_definitions, hed_schema)
+            errors = [issue for issue in definition_dict.issues if issue["severity"] < ErrorSeverity.WARNING]
             if errors:
-                raise ValueError(
-                    f"DefinitionDict has issues: {get_printable_issue_string(self._definition_dict.issues)}"
-                )
+                raise ValueError(f"DefinitionDict has issues: {get_printable_issue_string(definition_dict.issues)}")
         except Exception as e:
             raise ValueError(f"Failed to create DefinitionDict for HedLabMetaData: {e}") from e
+        self._hed_schema = hed_schema
+        self._definition_dict = definition_dict
+        self._serialized_entries = []
+        self._serialized_definitions = []
+        self._definitions_string = None
 
     def add_definitions(self, defs: Union[str, list, dict, None]):
         """
@@ -82,10 +220,15 @@ class HedLabMetaData(LabMetaData):
             defs (str or list or dict or None): A string containing one or more HED definitions,
                 a list of such strings, a dict of DefinitionEntry objects, or None.
                 If None or empty, no action is taken.
+
+        The cached definitions string (see extract_definitions) is extended with the new definitions only.
         """
         if not defs:
             return
+        self._ensure_loaded()
         self._definition_dict.add_definitions(defs, self._hed_schema)
+        if self._definitions_string is not None:
+            self.extract_definitions()
 
     def get_definition_dict(self) -> DefinitionDict:
         """
@@ -93,7 +236,11 @@ class HedLabMetaData(LabMetaData):
 
         Returns:
             DefinitionDict: The internal DefinitionDict containing all definitions.
+
+        Raises:
+            ValueError: If loading was deferred and the schema or definitions cannot be loaded.
         """
+        self._ensure_loaded()
         return self._definition_dict
 
     def get_hed_schema_version(self):
@@ -111,19 +258,152 @@ class HedLabMetaData(LabMetaData):
 
         Returns:
             HedSchema or HedSchemaGroup: The loaded HED schema object.
+
+        Raises:
+            ValueError: If loading was deferred and the schema or definitions cannot be loaded.
         """
+        self._ensure_loaded()
         return self._hed_schema
 
     def extract_definitions(self) -> str:
         """
         Extract definitions as string (for serialization).
 
+        The string is cached, and only the definitions added since the last call are serialized.
+
         Returns:
             str: A string representation of the definitions.
         """
-        def_list = []
-        for def_name, def_entry in self._definition_dict.items():
-            takes_value = "/#" if def_entry.takes_value else ""
-            def_str = f"(Definition/{def_name}{takes_value},{def_entry.contents})"
-            def_list.append(def_str)
-        return ",".join(def_list)
+        defs = self.get_definition_dict().defs
+        new_definitions = self._serialize_new_definitions(defs)
+        if self._definitions_string is None:
+            self._definitions_string = ",".join(self._serialized_definitions)
+        elif new_definitions:
+            self._definitions_string = ",".join([self._definitions_string] + new_definitions)
+        return self._definitions_string
+
+    def _serialize_new_definitions(self, defs: dict) -> List[str]:
+        """
+        Bring the cached definition strings up to date with the definitions of the DefinitionDict.
+
+        If the definitions cached are still the first ones of the DefinitionDict (the same names and entries, in
+        the same order), only the definitions after them are serialized and appended. Otherwise (a definition was
+        deleted, replaced, or reordered directly in the DefinitionDict) the cache, including the cached string,
+        is rebuilt from all the definitions.
+
+        Parameters:
+            defs (dict): The definitions of the DefinitionDict, by name.
+
+        Returns:
+            list of str: The strings of the definitions appended to the cache, in the order of the DefinitionDict.
+        """
+        entries = list(defs.items())
+        num_cached = len(self._serialized_entries)
+        if num_cached > len(entries) or any(
+            name != cached_name or entry is not cached_entry
+            for (name, entry), (cached_name, cached_entry) in zip(
+                entries[:num_cached], self._serialized_entries, strict=True
+            )
+        ):
+            self._serialized_entries = []
+            self._serialized_definitions = []
+            self._definitions_string = None
+            num_cached = 0
+        new_definitions = []
+        for def_name, def_entry in entries[num_cached:]:
+            new_definitions.append(definition_string(def_name, def_entry.takes_value, def_entry.contents))
+        self._serialized_entries = entries
+        self._serialized_definitions += new_definitions
+        return new_definitions
+
+
+@register_map(HedLabMetaData)
+class HedLabMetaDataMap(NWBContainerMapper):
+    """Writes the definitions of a HedLabMetaData as either the definitions attribute or the definitions table."""
+
+    def __init__(self, spec):
+        super().__init__(spec)
+        # The attribute is always written, the table only with HedLabMetaData.use_definitions_table.
+        self.map_attr("_definitions_to_write", spec.get_attribute("definitions"))
+        self.map_attr("_definitions_table_to_write", spec.get_dataset("definitions_table"))
+
+
+def definition_table_row(name: str, entry: DefinitionEntry) -> tuple:
+    """
+    Return the definitions table row of a definition.
+
+    Parameters:
+        name (str): The name of the definition.
+        entry (DefinitionEntry): The parsed definition.
+
+    Returns:
+        tuple: (name, takes_value, contents, content_hash), where content_hash is the SHA-256 hex digest of the
+               serialized definition.
+    """
+    contents = "" if entry.contents is None else str(entry.contents)
+    definition = definition_string(name, entry.takes_value, contents)
+    return name, bool(entry.takes_value), contents, _definition_hash(definition)
+
+
+def definition_strings_from_table(table) -> List[str]:
+    """
+    Return the definitions of a definitions table as one definition string per row.
+
+    The content_hash of each row is checked against the definition serialized from the row.
+
+    Parameters:
+        table: The rows of (name, takes_value, contents, content_hash), as a list or an HDF5 compound dataset.
+
+    Returns:
+        list of str: The definition strings, e.g. ``"(Definition/Go,(Sensory-event))"``.
+
+    Raises:
+        HedFileError: If the content_hash of a row does not match its definition.
+    """
+    dataset = _h5py_dataset(table)
+    rows = dataset[()] if dataset is not None else table
+    definitions = []
+    for row in rows:
+        name = _text(row[0])
+        definition = definition_string(name, bool(row[1]), _text(row[2]))
+        if _text(row[3]) != _definition_hash(definition):
+            raise HedFileError(
+                HedExceptions.INVALID_FILE_FORMAT,
+                f"The content_hash of definition '{name}' in the definitions table does not match its contents.",
+                "",
+            )
+        definitions.append(definition)
+    return definitions
+
+
+def definition_string(name: str, takes_value: bool, contents) -> str:
+    """
+    Return the serialized string of a definition, as written by HedLabMetaData.
+
+    Parameters:
+        name (str): The name of the definition.
+        takes_value (bool): Whether the definition takes a value (``Definition/name/#``).
+        contents (str or HedGroup or None): The contents of the definition; None or empty for none.
+
+    Returns:
+        str: ``(Definition/name,contents)``, or ``(Definition/name)`` if there are no contents.
+    """
+    contents = "" if contents is None else str(contents)
+    placeholder = "/#" if takes_value else ""
+    return f"(Definition/{name}{placeholder},{contents})" if contents else f"(Definition/{name}{placeholder})"
+
+
+def _definition_hash(definition: str) -> str:
+    """Return the content_hash of a serialized definition: its SHA-256 hex digest."""
+    return hashlib.sha256(definition.encode("utf-8")).hexdigest()
+
+
+def _h5py_dataset(table) -> Optional[h5py.Dataset]:
+    """Return the HDF5 dataset of a definitions table read from a file (possibly wrapped by hdmf), or None."""
+    dataset = getattr(table, "dataset", table)
+    return dataset if isinstance(dataset, h5py.Dataset) else None
+
+
+def _text(value) -> str:
+    """Return a text value read from HDF5 as a str (decoding bytes)."""
+    return value.decode("utf-8") if isinstance(value, bytes) else str(value)
@@ -3,8 +3,49 @@ from hdmf.utils import docval, getargs, get_docval
 from pynwb import register_class
 
 
+class _ValidationMarkMixin:
+    """
+    Tracks a validated high-water mark for a HED column: the number of leading rows already validated.
+
+    The mark is recorded with an opaque validation state supplied by the validator (identifying the schema,
+    definitions, and anything else the result depends on). It only counts while the state is unchanged and the
+    column still has at least that many rows, so rows appended with ``add_row`` are the only ones left to
+    validate. The mark is runtime bookkeeping and is not written to the file.
+    See HedNWBValidator.validate_new_rows.
+    """
+
+    def get_validated_rows(self, state) -> int:
+        """
+        Return the number of leading rows already validated under ``state``.
+
+        Parameters:
+            state: The validation state the rows must have been validated under.
+
+        Returns:
+            int: The number of validated rows, or 0 if the state changed or the column shrank.
+        """
+        mark = getattr(self, "_validation_mark", None)
+        if mark is None or mark[0] != state or mark[1] > len(self.data):
+            return 0
+        return mark[1]
+
+    def set_validated_rows(self, state, rows: int):
+        """
+        Record that the first ``rows`` rows have been validated under ``state``.
+
+        Parameters:
+            state: The validation state the rows were validated under.
+            rows (int): The number of leading rows validated.
+        """
+        self._validation_mark = (state, rows)
+
+    def reset_validation(self):
+        """Forget the validated high-water mark so that the next incremental validation checks every row."""
+        self._validation_mark = None
+
+
 @register_class("HedTags", "ndx-hed")
-class HedTags(VectorData):
+class HedTags(_ValidationMarkMixin, VectorData):
     """
     Column storing HED (Hierarchical Event Descriptors) annotations for a row. A HED string is a comma-separated,
     and possibly parenthesized list of HED tags selected from a valid HED vocabulary as specified by the
@@ -67,7 +108,7 @@ class HedTags(VectorData):
 
 
 @register_class("HedValueVector", "ndx-hed")
-class HedValueVector(VectorData):
+class HedValueVector(_ValidationMarkMixin, VectorData):
     """
     Column storing values and a single HED annotation that applies to all values in the column.
     A HED string is a comma-separated, and possibly parenthesized list of HED tags selected
@@ -0,0 +1,39 @@
+"""
+Helpers for running HED validation from asyncio code without blocking the event loop.
+"""
+
+import asyncio
+from concurrent.futures import Executor
+from typing import Any, Awaitable, Callable, List, Optional, Sequence
+
+
+async def run_offloaded(call, offload_executor: Optional[Executor], semaphore: Optional[asyncio.Semaphore]):
+    """Run a synchronous validation call in an executor, holding the semaphore (if any) while it runs."""
+    loop = asyncio.get_running_loop()
+    if semaphore is None:
+        return await loop.run_in_executor(offload_executor, call)
+    async with semaphore:
+        return await loop.run_in_executor(offload_executor, call)
+
+
+async def run_with_limit(
+    validate: Callable[[Any, asyncio.Semaphore], Awaitable], items: Sequence, max_concurrency: int
+) -> List:
+    """
+    Run ``validate(item, semaphore)`` for every item concurrently, sharing a semaphore of ``max_concurrency``.
+
+    Parameters:
+        validate (callable): Returns the awaitable validation of an item, holding the semaphore while it runs.
+        items (sequence): The items to validate.
+        max_concurrency (int): The maximum number of validations running at the same time.
+
+    Returns:
+        list: The results of the validations, in the order of ``items``.
+
+    Raises:
+        ValueError: If max_concurrency is not positive.
+    """
+    if max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be positive, but {max_concurrency} was given.")
+    semaphore = asyncio.Semaphore(max_concurrency)
+    return list(await asyncio.gather(*(validate(item, semaphore) for item in items)))
@@ -0,0 +1,255 @@
+"""
+DefinitionConsistencyChecker class for checking that the HED definitions stored in the files of a dataset agree.
+"""
+
+import hashlib
+from typing import List, Dict, Any, Iterable, Optional
+import h5py
+from pynwb import NWBFile
+from hed.errors import ErrorContext, ErrorSeverity, HedExceptions, HedFileError
+from hed.models import DefinitionDict
+from ..hed_lab_metadata import HedLabMetaData, definition_string
+from .hdf5_helpers import attr_str, stored_definitions
+from .schema_cache import _schema_version_key, _schema_version_string, get_schema_cache
+
+
+class DefinitionConsistencyChecker:
+    """
+    Checks that the HED definitions and schema versions stored in the HedLabMetaData of many NWB files agree.
+
+    A dataset usually stores the same definitions in every file, and they tend to drift apart as files are
+    re-exported or edited. Files are added with add_path() (which reads only the file's ``hed_schema`` group
+    with h5py, without constructing any NWB container) or with add_nwbfile(). Each file's
+    schema version and definitions string are hashed, and each distinct (schema version, definitions) set is
+    parsed into a DefinitionDict only once, so checking a dataset costs one parse per distinct set rather than
+    one per file. Parsed sets are kept, so a checker can be reused as files are added.
+
+    check() then reports, across all the files added:
+
+    - the errors of definition sets that do not parse (as HedLabMetaData would reject them), once for each file
+      with that set;
+    - ``DEFINITION_CONFLICT`` (error): a definition with different contents in different files;
+    - ``DEFINITION_MISSING`` (warning): a definition present in some files but not in others;
+    - ``SCHEMA_VERSION_MISMATCH`` (warning): files that use different HED schema versions.
+
+    Definitions are compared in the normalized form DefinitionDict gives them (short tags, sorted groups),
+    ignoring case, and schema versions in the form HedLabMetaData writes them (so ``"8.4.0"``, ``'"8.4.0"'``, and
+    ``" 8.4.0"`` are the same version), so only real differences are reported.
+    """
+
+    DEFINITION_CONFLICT = "DEFINITION_CONFLICT"
+    DEFINITION_MISSING = "DEFINITION_MISSING"
+    SCHEMA_VERSION_MISMATCH = "SCHEMA_VERSION_MISMATCH"
+
+    # The number of file names listed in an issue message before the rest are elided.
+    MAX_LISTED_FILES = 3
+
+    def __init__(self):
+        self._file_keys = {}
+        self._definition_sets = {}
+
+    @property
+    def files(self) -> List[str]:
+        """The names of the files added, in the order they were added."""
+        return list(self._file_keys)
+
+    @property
+    def num_definition_sets(self) -> int:
+        """The number of distinct (schema version, definitions) sets among the files added."""
+        return len(self._definition_sets)
+
+    def add_path(self, path: str) -> str:
+        """
+        Add an NWB file on disk, reading only its HedLabMetaData group (attributes and definitions table).
+
+        Parameters:
+            path (str): The path of the NWB (HDF5) file; also the name of the file in issues.
+
+        Returns:
+            str: The hash of the file's schema version and definitions.
+
+        Raises:
+            HedFileError: If the file does not have HedLabMetaData with a schema version.
+        """
+        with h5py.File(path, "r") as h5file:
+            metadata_group = self._find_metadata_group(h5file)
+            if metadata_group is None or "hed_schema_version" not in metadata_group.attrs:
+                raise HedFileError(
+                    HedExceptions.SCHEMA_INVALID, f"NWB file {path} does not have a valid HED schema", path
+                )
+            schema_version = attr_str(metadata_group.attrs["hed_schema_version"])
+            definitions = stored_definitions(metadata_group)
+        return self._add(path, schema_version, definitions)
+
+    def add_paths(self, paths: Iterable[str]) -> List[str]:
+        """
+        Add NWB files on disk (see add_path).
+
+        Parameters:
+            paths (iterable of str): The paths of the NWB files.
+
+        Returns:
+            list of str: The hash of each file's schema version and definitions.
+        """
+        return [self.add_path(path) for path in paths]
+
+    def add_nwbfile(self, nwbfile: NWBFile, name: Optional[str] = None) -> str:
+        """
+        Add an in-memory NWB file by its HedLabMetaData.
+
+        The metadata's DefinitionDict is already parsed, so it is used as is for a definition set not seen before.
+
+        Parameters:
+            nwbfile (NWBFile): The NWB file.
+            name (str, optional): The name of the file in issues (the file's identifier if None).
+
+        Returns:
+            str: The hash of the file's schema version and definitions.
+
+        Raises:
+            ValueError: If nwbfile is not a valid NWBFile instance.
+            HedFileError: If the file does not have HedLabMetaData.
+        """
+        if nwbfile is None or not isinstance(nwbfile, NWBFile):
+            raise ValueError("The provided nwbfile is not a valid NWBFile instance.")
+        name = nwbfile.identifier if name is None else name
+        hed_metadata = nwbfile.lab_meta_data.get("hed_schema")
+        if hed_metadata is None or not isinstance(hed_metadata, HedLabMetaData):
+            raise HedFileError(HedExceptions.SCHEMA_INVALID, f"NWB file {name} does not have a valid HED schema", "")
+        return self._add(name, hed_metadata.get_hed_schema_version(), hed_metadata.definitions, hed_metadata)
+
+    def check(self) -> List[Dict[str, Any]]:
+        """
+        Compare the definitions and schema versions of all the files added.
+
+        Issues about a single file have the file's name as ``ec_filename``. Dataset-level issues list the files
+        involved in the message and carry them in extra fields: ``definition`` and ``variants`` (a dict of each
+        normalized definition to its files) for DEFINITION_CONFLICT, ``definition`` and ``files`` (the files
+        without the definition) for DEFINITION_MISSING, and ``variants`` (each schema version to its files)
+        for SCHEMA_VERSION_MISMATCH.
+
+        Returns:
+            List[Dict[str, Any]]: The consistency issues (empty if all the files agree).
+        """
+        files_of = {}
+        for name, key in self._file_keys.items():
+            files_of.setdefault(key, []).append(name)
+
+        issues = []
+        for key, files in files_of.items():
+            for name in files:
+                issues += [{**issue, ErrorContext.FILE_NAME: name} for issue in self._definition_sets[key][2]]
+
+        versions = {}
+        for key, files in files_of.items():
+            versions.setdefault(self._definition_sets[key][0], []).extend(files)
+        if len(versions) > 1:
+            issues.append({
+                "code": self.SCHEMA_VERSION_MISMATCH,
+                "message": "Files use different HED schema versions: " + self._describe_variants(versions),
+                "severity": ErrorSeverity.WARNING,
+                "variants": versions,
+            })
+
+        variants_of = {}
+        for key, files in files_of.items():
+            for def_name, definition in self._definition_sets[key][1].items():
+                variants_of.setdefault(def_name, {}).setdefault(definition, []).extend(files)
+        num_files = len(self._file_keys)
+        for def_name in sorted(variants_of):
+            variants = variants_of[def_name]
+            if len(variants) > 1:
+                issues.append({
+                    "code": self.DEFINITION_CONFLICT,
+                    "message": f"Definition '{def_name}' differs across files: " + self._describe_variants(variants),
+                    "severity": ErrorSeverity.ERROR,
+                    "definition": def_name,
+                    "variants": variants,
+                })
+            defined_in = set().union(*variants.values())
+            if len(defined_in) < num_files:
+                missing = [name for name in self._file_keys if name not in defined_in]
+                issues.append({
+                    "code": self.DEFINITION_MISSING,
+                    "message": f"Definition '{def_name}' is defined in {len(defined_in)} of {num_files} files but "
+                    f"missing from {self._describe_files(missing)}",
+                    "severity": ErrorSeverity.WARNING,
+                    "definition": def_name,
+                    "files": missing,
+                })
+        return issues
+
+    def _add(
+        self,
+        name: str,
+        schema_version: str,
+        definitions: Optional[str],
+        hed_metadata: Optional[HedLabMetaData] = None,
+    ) -> str:
+        """Record a file's definition set under its hash, parsing the set if it has not been seen before."""
+        schema_version = _schema_version_string(_schema_version_key(schema_version))
+        key = hashlib.sha256(f"{schema_version}\0{definitions or ''}".encode("utf-8")).hexdigest()
+        if key not in self._definition_sets:
+            if hed_metadata is not None:
+                def_dict = hed_metadata.get_definition_dict()
+                self._definition_sets[key] = (schema_version, self._normalized_definitions(def_dict), [])
+            else:
+                self._definition_sets[key] = self._parse(schema_version, definitions)
+        self._file_keys[name] = key
+        return key
+
+    @classmethod
+    def _parse(cls, schema_version: str, definitions: Optional[str]) -> tuple:
+        """
+        Parse a definition set.
+
+        Returns:
+            tuple: (str, dict, list) the schema version, the normalized definitions keyed by name, and the errors
+                   found loading the schema or parsing the definitions.
+        """
+        try:
+            hed_schema = get_schema_cache().get(schema_version)
+        except Exception as e:
+            issue = {
+                "code": HedExceptions.SCHEMA_VERSION_INVALID,
+                "message": f"Failed to load HED schema version {schema_version}: {e}",
+                "severity": ErrorSeverity.ERROR,
+            }
+            return schema_version, {}, [issue]
+        def_dict = DefinitionDict(definitions, hed_schema)
+        errors = [issue for issue in def_dict.issues if issue["severity"] < ErrorSeverity.WARNING]
+        return schema_version, cls._normalized_definitions(def_dict), errors
+
+    @staticmethod
+    def _normalized_definitions(def_dict: DefinitionDict) -> Dict[str, str]:
+        """Return the definitions of a DefinitionDict as comparable strings, keyed by (casefolded) name."""
+        return {
+            def_name: definition_string(def_name, entry.takes_value, entry.contents).casefold()
+            for def_name, entry in def_dict.items()
+        }
+
+    @staticmethod
+    def _find_metadata_group(h5file: h5py.File) -> Optional[h5py.Group]:
+        """Return the HedLabMetaData group of an open NWB file (normally ``/general/hed_schema``), or None."""
+        general = h5file.get("general")
+        if not isinstance(general, h5py.Group):
+            return None
+        candidates = [general.get("hed_schema")] + [general.get(key) for key in general.keys()]
+        for group in candidates:
+            if isinstance(group, h5py.Group) and attr_str(group.attrs.get("neurodata_type")) == "HedLabMetaData":
+                return group
+        return None
+
+    @classmethod
+    def _describe_variants(cls, variants: Dict[str, List[str]]) -> str:
+        """Describe the files of each variant of a value, largest group first."""
+        ordered = sorted(variants.items(), key=lambda item: -len(item[1]))
+        return "; ".join(f"'{value}' in {cls._describe_files(files)}" for value, files in ordered)
+
+    @classmethod
+    def _describe_files(cls, files: List[str]) -> str:
+        """Describe a list of files by their count and the first few names."""
+        listed = ", ".join(files[: cls.MAX_LISTED_FILES])
+        if len(files) > cls.MAX_LISTED_FILES:
+            listed += f", ... ({len(files) - cls.MAX_LISTED_FILES} more)"
+        return f"{len(files)} file{'s' if len(files) != 1 else ''} ({listed})"
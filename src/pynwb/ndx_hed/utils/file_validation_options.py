@@ -0,0 +1,60 @@
+"""
+FileValidationOptions class holding the options of the file-level validation calls of HedNWBValidator.
+"""
+
+from concurrent.futures import Executor
+from typing import Callable, Optional
+from .validation_monitor import IssueBudget, ValidationMonitor
+
+
+class FileValidationOptions:
+    """
+    The options of validating the tables of an NWB file, given as keyword arguments (``**options``) to
+    HedNWBValidator.validate_file, HedNWBValidator.validate_path, and HedValidatorPool.validate_path.
+
+    The options are checked when they are collected, and each call collects its own, so the issue budget and
+    the progress and cancellation monitor built from them (``budget`` and ``monitor``) belong to that call.
+    See HedNWBValidator.validate_file for how the tables are validated with each option.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        max_issues: Optional[int] = None,
+        stop_on_first_error: bool = False,
+        progress: Optional[Callable[[Optional[str], Optional[str], int, int], None]] = None,
+        cancel=None,
+        chunk_size: Optional[int] = None,
+        threads: Optional[int] = None,
+    ):
+        """
+        Parameters:
+            workers (int, optional): If given, validate the tables in a process pool with this many workers.
+            executor (Executor, optional): An existing executor (e.g. a ProcessPoolExecutor) to validate the
+                                           tables with. Takes precedence over ``workers``.
+            max_issues (int, optional): Stop validating once this many issues have been found.
+            stop_on_first_error (bool): Stop validating at the first issue with error severity.
+            progress (callable, optional): Called as ``progress(table_name, None, rows_done, total_rows)``.
+            cancel (optional): A cancellation token such as a ``threading.Event``.
+            chunk_size (int, optional): Read and validate each table in blocks of about this many rows.
+            threads (int, optional): If given, validate the tables in a thread pool with this many threads.
+
+        Raises:
+            ValueError: If max_issues is not positive.
+            ValueError: If chunk_size is given with workers or executor.
+            ValueError: If threads is not positive or is given with workers or executor.
+        """
+        if chunk_size is not None and (workers is not None or executor is not None):
+            raise ValueError("chunk_size cannot be combined with workers or executor.")
+        if threads is not None:
+            if workers is not None or executor is not None:
+                raise ValueError("threads cannot be combined with workers or executor.")
+            if threads < 1:
+                raise ValueError(f"threads must be positive, but {threads} was given.")
+        self.workers = workers
+        self.executor = executor
+        self.chunk_size = chunk_size
+        self.threads = threads
+        self.budget = IssueBudget(max_issues, stop_on_first_error)
+        self.monitor = ValidationMonitor(progress, cancel)
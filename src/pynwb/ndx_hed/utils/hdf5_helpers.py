@@ -0,0 +1,36 @@
+"""
+Helpers for reading the HED metadata and the tables of an NWB file from its HDF5 groups, without constructing
+NWB containers (see HedNWBValidator.validate_path and DefinitionConsistencyChecker).
+"""
+
+from typing import List, Optional
+import h5py
+from ..hed_lab_metadata import definition_strings_from_table
+
+
+def attr_str(value) -> Optional[str]:
+    """Return an HDF5 attribute or scalar string value as a str (decoding bytes), or None if it is None."""
+    if isinstance(value, bytes):
+        return value.decode("utf-8")
+    return value if value is None else str(value)
+
+
+def stored_definitions(metadata_group: h5py.Group) -> Optional[str]:
+    """
+    Return the definitions stored in a HedLabMetaData group as one string.
+
+    The definitions table is used if present; the definitions attribute next to it is a copy for older readers.
+    """
+    table = metadata_group.get("definitions_table")
+    if isinstance(table, h5py.Dataset) and len(table):
+        return ",".join(definition_strings_from_table(table))
+    return attr_str(metadata_group.attrs.get("definitions"))
+
+
+def column_types(table_group: h5py.Group) -> List[Optional[str]]:
+    """Return the neurodata_type of each column dataset of a table's HDF5 group."""
+    types = []
+    for column in table_group.attrs["colnames"]:
+        dataset = table_group.get(attr_str(column))
+        types.append(None if dataset is None else attr_str(dataset.attrs.get("neurodata_type")))
+    return types
@@ -2,20 +2,48 @@
 HedValidator class for validating HED tags in NWB DynamicTable objects.
 """
 
-import io
+import asyncio
+import functools
+import hashlib
 import json
 import math
-from typing import List, Dict, Any, Optional
-from pynwb import NWBFile
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import List, Dict, Any, Callable, Optional, Sequence, Union
+import h5py
+import numpy as np
+import pandas as pd
+from pynwb import NWBFile, NWBHDF5IO
 from pynwb.core import DynamicTable
 from pynwb.event import EventsTable
 from hdmf.common import MeaningsTable
-from hed.errors import ErrorHandler, ErrorContext, HedExceptions, HedFileError
-from hed.errors.error_reporter import check_for_any_errors
-from hed.models import HedString, TabularInput, Sidecar
+from hdmf.utils import StrDataset
+from hed.errors import ErrorHandler, ErrorContext, ErrorSeverity, HedExceptions, HedFileError
+from hed.errors.error_reporter import check_for_any_errors, sort_issues
+from hed.models import DefinitionDict, HedGroup, HedString, HedTag, TabularInput, Sidecar
+from hed.validator import HedValidator
+from hed.validator.spreadsheet_validator import SpreadsheetValidator
+from hed.validator.util.class_util import UnitValueValidator
 from ..hed_lab_metadata import HedLabMetaData
 from ..hed_tags import HedTags, HedValueVector
-from .bids2nwb import get_bids_tabular
+from .async_validation import run_offloaded, run_with_limit
+from .bids2nwb import get_hed_tabular, _normalize_rows
+from .file_validation_options import FileValidationOptions
+from .hdf5_helpers import attr_str, column_types, stored_definitions
+from .schema_cache import _schema_version_key
+from .spreadsheet_validators import BlockSpreadsheetValidator, CachedSpreadsheetValidator
+from .validation_cache import ValidationCache, definitions_hash
+from .validation_monitor import (
+    TABULAR_ROW_OFFSET,
+    IssueBudget,
+    IssueBudgetExhaustedError,
+    MonitoredErrorHandler,
+    ValidationCancelledError,
+    ValidationMonitor,
+    copy_error_handler,
+)
+from .worker_pool import create_worker_pool, validate_tabular_in_worker
 
 
 class HedNWBValidator:
@@ -24,6 +52,22 @@ class HedNWBValidator:
 
     This class provides methods to validate HED tags in various NWB data structures
     using HED schema information stored in HedLabMetaData.
+
+    Validation methods keep no state in the validator between calls, except in the shared schema, the
+    DefinitionDict, and the optional ValidationCache (which has its own lock). One validator can therefore be
+    used by several threads (including on free-threaded Python builds) as long as concurrent calls do not share
+    an ErrorHandler, whose context stack every call pushes to and pops from. With ``thread_safe=True`` the
+    validator does not rely on the caller for that: each call works on a private copy of the ErrorHandler it is
+    given (the caller's handler is only read), and the validator keeps its own snapshot of the definitions
+    (used in this process and sent to worker processes alike), so definitions added to the HedLabMetaData later
+    do not change them during a validation. validate_file and validate_path can also validate the tables of a
+    file in a thread pool with ``threads=``. validate_new_rows is the exception: it records its progress on the
+    column it is given, so concurrent calls must not validate the same column, even with ``thread_safe=True``.
+
+    With a ValidationCache, the per-column methods (validate_table, validate_vector, validate_value_vector, and
+    validate_new_rows) look up each distinct HED string in the cache, and assembled validation looks up the
+    checks of each table cell (see CachedSpreadsheetValidator); the checks of the assembled rows (including the
+    temporal checks) always run.
     """
 
     # Sidecar error codes that indicate a structurally malformed sidecar (bad ``{column}`` braces or
@@ -31,7 +75,20 @@ class HedNWBValidator:
     # assembled-table validation would emit misleading downstream errors, so it is skipped.
     STRUCTURAL_SIDECAR_CODES = frozenset({"SIDECAR_BRACES_INVALID", "SIDECAR_INVALID"})
 
-    def __init__(self, hed_metadata: HedLabMetaData):
+    # Characters a HedValueVector value may contain and still be checked directly against the template's
+    # placeholder tag. Values with any other character (e.g. commas, parentheses, slashes, or braces that
+    # could change the structure of the substituted annotation) are substituted and fully parsed.
+    SAFE_VALUE_CHARS = frozenset("0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ.-+_: ")
+
+    # Default number of rows read per block from HDF5-backed column data (rounded to the dataset's chunking).
+    DEFAULT_CHUNK_SIZE = 65536
+
+    # TabularInput reports ``ec_row`` as the line number in a TSV file: 1-based, after the header line.
+    TABULAR_ROW_OFFSET = TABULAR_ROW_OFFSET
+
+    def __init__(
+        self, hed_metadata: HedLabMetaData, cache: Optional[ValidationCache] = None, thread_safe: bool = False
+    ):
         """
         Initialize the HedNWBValidator with HED metadata.
 
@@ -40,6 +97,15 @@ class HedNWBValidator:
                                           Must be a valid HedLabMetaData instance with a loaded
                                           HED schema. If the HedLabMetaData was constructed successfully,
                                           it is guaranteed to have a valid schema.
+            cache (ValidationCache, optional): A persistent cache of HED string validation results. If given,
+                                               the per-column methods take the issues of each string from it, and
+                                               assembled validation (validate_file, validate_path, validate_events)
+                                               takes the checks of each table cell from it; cached issues are
+                                               returned with the current error context. The cache is not used by
+                                               worker processes (``workers`` or ``executor``).
+            thread_safe (bool): If True, every call uses a private copy of its ErrorHandler and the validator
+                                validates against a snapshot of the metadata's definitions (see the class
+                                documentation).
 
         Raises:
             ValueError: If hed_metadata is not an instance of HedLabMetaData
@@ -54,150 +120,745 @@ class HedNWBValidator:
 
         self.hed_schema = hed_metadata.get_hed_schema()
         self.def_dict = hed_metadata.get_definition_dict()
+        self._definitions_snapshot = None
+        if thread_safe:
+            self._definitions_snapshot = hed_metadata.definitions
+            self.def_dict = DefinitionDict(self._definitions_snapshot, self.hed_schema)
+        self._hed_metadata = hed_metadata
+        self.cache = cache
+        self.thread_safe = thread_safe
+
+    def _call_error_handler(self, error_handler: Optional[ErrorHandler]) -> ErrorHandler:
+        """Return the ErrorHandler a validation call uses: a new one if None, a private copy in thread-safe mode."""
+        if error_handler is None:
+            return ErrorHandler(check_for_warnings=False)
+        return copy_error_handler(error_handler) if self.thread_safe else error_handler
 
-    def validate_table(self, table: DynamicTable, error_handler: Optional[ErrorHandler] = None) -> List[Dict[str, Any]]:
+    def validate_table(
+        self,
+        table: DynamicTable,
+        error_handler: Optional[ErrorHandler] = None,
+        chunk_size: Optional[int] = None,
+        max_issues: Optional[int] = None,
+        stop_on_first_error: bool = False,
+        rows: Union[slice, Sequence[int], None] = None,
+        columns: Optional[Sequence[str]] = None,
+        progress: Optional[Callable[[Optional[str], Optional[str], int, int], None]] = None,
+        cancel=None,
+    ) -> List[Dict[str, Any]]:
         """
         Validates all HedTags columns in a DynamicTable using the provided HED schema metadata.
 
+        Progress is reported and cancellation is checked for each column, between blocks of rows.
+
         Parameters:
             table (DynamicTable): The dynamic table to validate
             error_handler (ErrorHandler, optional): An ErrorHandler instance for collecting errors.
                                                    If None, a new instance will be created.
+            chunk_size (int, optional): The number of rows to read per block (see validate_vector).
+            max_issues (int, optional): Stop validating once this many issues have been found.
+            stop_on_first_error (bool): Stop validating at the first issue with error severity.
+            rows (slice or sequence of int, optional): Validate only these rows (see validate_vector).
+            columns (sequence of str, optional): Validate only the HED columns with these names.
+            progress (callable, optional): Called as ``progress(table_name, column_name, rows_done, total_rows)``
+                                           as validation advances (see validate_vector).
+            cancel (optional): A cancellation token such as a ``threading.Event``; validation raises
+                               ValidationCancelledError once ``cancel.is_set()`` is true.
 
         Returns:
-            List[Dict[str, Any]]: A consolidated list of validation issues from all HedTags columns
+            List[Dict[str, Any]]: A consolidated list of validation issues from all HedTags columns.
+                                  If validation stopped early, only the issues found up to that point.
+
+        Raises:
+            ValueError: If table is not a DynamicTable or max_issues is not positive.
+            ValueError: If a row index is out of range or a column is not in the table.
+            ValidationCancelledError: If the cancellation token is set during validation.
         """
         if table is None or not isinstance(table, DynamicTable):
             raise ValueError("The provided table is not a valid DynamicTable instance.")
-        if error_handler is None:
-            error_handler = ErrorHandler(check_for_warnings=False)
+        budget = IssueBudget(max_issues, stop_on_first_error)
+        monitor = ValidationMonitor(progress, cancel)
+        if rows is not None:
+            rows = _normalize_rows(rows, len(table))
+        if columns is not None:
+            unknown = [col_name for col_name in columns if col_name not in table.colnames]
+            if unknown:
+                raise ValueError(f"Columns {unknown} are not in table '{table.name}'.")
+        error_handler = self._call_error_handler(error_handler)
         issues = []
+        context_depth = len(error_handler.error_context)
         # TODO: FILE_NAME context needs to be replaced by TABLE context when available in hed-python
         error_handler.push_error_context(ErrorContext.FILE_NAME, table.name)
-        for col in table.columns:
-            if isinstance(col, HedTags):
-                error_handler.push_error_context(ErrorContext.COLUMN, col.name)
-                col_issues = self.validate_vector(col, error_handler)
-                issues += col_issues
-                error_handler.pop_error_context()
-            elif isinstance(col, HedValueVector):
-                error_handler.push_error_context(ErrorContext.COLUMN, col.name)
-                col_issues = self.validate_value_vector(col, error_handler)
-                issues += col_issues
-                error_handler.pop_error_context()
-
-        error_handler.pop_error_context()
+        try:
+            for col in table.columns:
+                if budget.exhausted:
+                    break
+                if columns is not None and col.name not in columns:
+                    continue
+                monitor.set_scope(table.name, col.name)
+                if isinstance(col, HedTags):
+                    error_handler.push_error_context(ErrorContext.COLUMN, col.name)
+                    col_issues = self._validate_tag_rows(col, error_handler, chunk_size, rows, budget, monitor)
+                    issues += col_issues
+                    error_handler.pop_error_context()
+                elif isinstance(col, HedValueVector):
+                    error_handler.push_error_context(ErrorContext.COLUMN, col.name)
+                    col_issues = self._validate_value_column(
+                        col, error_handler, True, chunk_size, budget, rows, monitor
+                    )
+                    issues += col_issues
+                    error_handler.pop_error_context()
+        finally:
+            # Restore the caller's context if validation was cancelled part way through a column.
+            del error_handler.error_context[context_depth:]
         return issues
 
-    def validate_vector(self, hed_tags: HedTags, error_handler: Optional[ErrorHandler] = None) -> List[Dict[str, Any]]:
+    def validate_vector(
+        self,
+        hed_tags: HedTags,
+        error_handler: Optional[ErrorHandler] = None,
+        chunk_size: Optional[int] = None,
+        max_issues: Optional[int] = None,
+        stop_on_first_error: bool = False,
+        rows: Union[slice, Sequence[int], None] = None,
+        progress: Optional[Callable[[Optional[str], Optional[str], int, int], None]] = None,
+        cancel=None,
+    ) -> List[Dict[str, Any]]:
         """
         Validates a HedTags column using the provided HED schema metadata.
 
+        The column is read and validated block by block (see _iter_blocks). When the data is an HDF5
+        dataset (e.g. a file opened with NWBHDF5IO), each block is a single read that is decoded in bulk,
+        rather than one read and decode per row, and only one block is held in memory at a time.
+
+        With ``max_issues`` or ``stop_on_first_error``, validation stops (and no further blocks are read)
+        as soon as the issue budget is used up, and the issues found up to that point are returned.
+
+        With ``rows``, only the selected rows are read and validated; issues keep the row index in the full
+        column as their ``ec_row``. Contiguous selections are read as a range; for an index array, the blocks
+        spanning the smallest to the largest index are read and the selected rows are taken from them.
+
+        If ``progress`` is given, it is called after each block with the name of the column's table (None if it
+        is not in a table), the column name, the number of selected rows read so far, and the number of selected
+        rows. If ``cancel`` is given, it is checked before each block and ValidationCancelledError is raised
+        once it is set. When either is given, in-memory data is also read in blocks (of DEFAULT_CHUNK_SIZE rows
+        unless ``chunk_size`` is given), so that progress and cancellation are not limited to HDF5 data.
+
         Parameters:
             hed_tags (HedTags): The HedTags column to validate
             error_handler (ErrorHandler, optional): An ErrorHandler instance for collecting errors.
                                                    If None, a new instance will be created.
+            chunk_size (int, optional): The number of rows to read per block. HDF5 datasets are read in
+                                        blocks of DEFAULT_CHUNK_SIZE rows if None; the block size is
+                                        rounded to a multiple of the dataset's HDF5 chunk length.
+            max_issues (int, optional): Stop validating once this many issues have been found.
+            stop_on_first_error (bool): Stop validating at the first issue with error severity.
+            rows (slice or sequence of int, optional): Validate only these rows: a slice, an array of row
+                                                       indices, or a boolean mask. All rows if None.
+            progress (callable, optional): Called as ``progress(table_name, column_name, rows_done, total_rows)``
+                                           after each block of rows.
+            cancel (optional): A cancellation token such as a ``threading.Event``, checked before each block.
 
         Returns:
             List[Dict[str, Any]]: A list of validation issues found in the HedTags column
+
+        Raises:
+            ValueError: If hed_tags is not a HedTags instance or max_issues is not positive.
+            ValueError: If a row index is out of range.
+            ValidationCancelledError: If the cancellation token is set during validation.
         """
         if hed_tags is None or not isinstance(hed_tags, HedTags):
             raise ValueError("The provided hed_tags is not a valid HedTags instance.")
-        if error_handler is None:
-            error_handler = ErrorHandler(check_for_warnings=False)
-        issues = []
+        budget = IssueBudget(max_issues, stop_on_first_error)
+        monitor = ValidationMonitor(progress, cancel, getattr(hed_tags.parent, "name", None), hed_tags.name)
+        if rows is not None:
+            rows = _normalize_rows(rows, len(hed_tags.data))
+        error_handler = self._call_error_handler(error_handler)
+        return self._validate_tag_rows(hed_tags, error_handler, chunk_size, rows, budget, monitor)
 
-        for index, tag in enumerate(hed_tags.data):
-            if tag is None or tag == "" or tag == "n/a":
+    def _validate_tag_rows(
+        self,
+        hed_tags: HedTags,
+        error_handler: ErrorHandler,
+        chunk_size: Optional[int] = None,
+        rows: Union[slice, np.ndarray, None] = None,
+        budget: Optional["IssueBudget"] = None,
+        monitor: Optional["ValidationMonitor"] = None,
+    ) -> List[Dict[str, Any]]:
+        """Validate the (normalized) selected rows of a HedTags column (see validate_vector)."""
+        row_strings = (
+            (indices[offset], tag)
+            for indices, block in self._iter_row_blocks(hed_tags.data, chunk_size, rows, monitor)
+            for offset, tag in enumerate(block)
+            if not (tag is None or tag in ("", "n/a"))
+        )
+        return self._validate_rows(row_strings, error_handler, budget=budget)
+
+    @classmethod
+    def _iter_row_blocks(
+        cls,
+        data,
+        chunk_size: Optional[int] = None,
+        rows: Union[slice, np.ndarray, None] = None,
+        monitor: Optional["ValidationMonitor"] = None,
+    ):
+        """
+        Yield (row indices, values) blocks of the selected rows of a column's data (see _iter_blocks).
+
+        If a monitor is given, cancellation is checked before each block is read and progress is reported
+        once the consumer asks for the next block (and at the end).
+
+        Parameters:
+            data: The column data (a list, NumPy array, or h5py dataset).
+            chunk_size (int, optional): The number of rows per block.
+            rows (slice or np.ndarray, optional): A selection normalized by _normalize_rows (all rows if None).
+            monitor (ValidationMonitor, optional): The progress and cancellation monitor of the validation call.
+
+        Yields:
+            tuple: (sequence of int, sequence) the row indices of the block and their values.
+        """
+        if monitor is None or not monitor.active:
+            yield from cls._iter_selected_blocks(data, chunk_size, rows)
+            return
+        if rows is None:
+            total = len(data)
+        elif isinstance(rows, slice):
+            total = min(rows.stop, len(data)) - rows.start
+        else:
+            total = len(rows)
+        done = 0
+        monitor.report(0, total)
+        for indices, block in cls._iter_selected_blocks(data, chunk_size or cls.DEFAULT_CHUNK_SIZE, rows, monitor):
+            yield indices, block
+            done += len(indices)
+            monitor.report(done, total)
+
+    @classmethod
+    def _iter_selected_blocks(cls, data, chunk_size, rows, monitor=None):
+        """Yield the (row indices, values) blocks of _iter_row_blocks, checking the monitor before each read."""
+        if rows is None or isinstance(rows, slice):
+            start, stop = (0, None) if rows is None else (rows.start, rows.stop)
+            for block_start, block in cls._iter_blocks(data, chunk_size, start, stop, monitor):
+                yield range(block_start, block_start + len(block)), block
+            return
+        if len(rows) == 0:
+            return
+        for block_start, block in cls._iter_blocks(data, chunk_size, int(rows[0]), int(rows[-1]) + 1, monitor):
+            first, last = np.searchsorted(rows, [block_start, block_start + len(block)])
+            if first == last:
                 continue
+            indices = rows[first:last]
+            offsets = indices - block_start
+            if isinstance(block, np.ndarray):
+                yield indices.tolist(), block[offsets]
+            else:
+                yield indices.tolist(), [block[offset] for offset in offsets.tolist()]
 
-            error_handler.push_error_context(ErrorContext.ROW, index)
-            hed_obj = HedString(tag, self.hed_schema, def_dict=self.def_dict)
-            row_issues = hed_obj.validate(allow_placeholders=False, error_handler=error_handler)
-            issues += row_issues
-            error_handler.pop_error_context()
+    @classmethod
+    def _iter_blocks(
+        cls,
+        data,
+        chunk_size: Optional[int] = None,
+        start: int = 0,
+        stop: Optional[int] = None,
+        monitor: Optional["ValidationMonitor"] = None,
+    ):
+        """
+        Yield (start row, values) blocks of rows ``start`` to ``stop`` of a column's data.
 
+        HDF5 datasets are sliced in blocks of ``chunk_size`` rows (DEFAULT_CHUNK_SIZE if None), rounded to a
+        multiple of the dataset's chunk length so that each HDF5 chunk is read once. String datasets are
+        decoded a block at a time. In-memory data is returned as a single block unless ``chunk_size`` is given.
+
+        Parameters:
+            data: The column data (a list, NumPy array, or h5py dataset).
+            chunk_size (int, optional): The number of rows per block.
+            start (int): The first row to read.
+            stop (int, optional): One past the last row to read (the end of the data if None).
+            monitor (ValidationMonitor, optional): If given, cancellation is checked before each block is read.
+
+        Yields:
+            tuple: (int, sequence) the index of the first row of the block and the block's values.
+        """
+        if isinstance(data, h5py.Dataset):
+            block_size = chunk_size or cls.DEFAULT_CHUNK_SIZE
+            if data.chunks:
+                block_size = max(1, round(block_size / data.chunks[0])) * data.chunks[0]
+            # StrDataset (returned by HDMF for text) already decodes each slice; plain string datasets are wrapped.
+            if not isinstance(data, StrDataset) and h5py.check_string_dtype(data.dtype) is not None:
+                data = data.asstr()
+        elif chunk_size is None:
+            if monitor is not None:
+                monitor.check()
+            if start == 0 and stop is None:
+                yield 0, data
+            else:
+                yield start, data[start:stop]
+            return
+        else:
+            block_size = chunk_size
+
+        stop = len(data) if stop is None else min(stop, len(data))
+        while start < stop:
+            # Blocks end on multiples of block_size so that a block never straddles an extra HDF5 chunk.
+            block_stop = min((start // block_size + 1) * block_size, stop)
+            if monitor is not None:
+                monitor.check()
+            yield start, data[start:block_stop]
+            start = block_stop
+
+    def _validate_rows(
+        self,
+        rows,
+        error_handler: ErrorHandler,
+        allow_placeholders: bool = False,
+        budget: Optional["IssueBudget"] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Validate (row index, HED string) pairs, parsing and validating each distinct string only once.
+
+        Columns typically repeat a small vocabulary of annotations over many rows. The first row carrying
+        a given string is validated with the row pushed onto the error context; every later row with the
+        same string receives copies of those issues with its own ``ErrorContext.ROW``. The cache lives
+        for a single call, so the schema and DefinitionDict are fixed while it is in use. If the validator
+        has a persistent ValidationCache, the first occurrence of each string is looked up there first.
+        If a budget is given, iteration stops (so no further rows are read) once it is used up.
+
+        Parameters:
+            rows (iterable of (int, str)): The row indices and HED strings to validate, in row order.
+            error_handler (ErrorHandler): The error handler collecting issues.
+            allow_placeholders (bool): Whether ``#`` placeholders are allowed in the strings.
+            budget (IssueBudget, optional): The issue budget of the current validation call.
+
+        Returns:
+            List[Dict[str, Any]]: The validation issues for all rows, in row order.
+        """
+        validator = HedValidator(self.hed_schema, def_dicts=self.def_dict)
+        cache_key = None
+        if self.cache is not None:
+            cache_key = (*self._validation_state(), allow_placeholders)
+        seen = {}
+        issues = []
+        for index, hed_string in rows:
+            string_issues = seen.get(hed_string)
+            if string_issues is None:
+                if cache_key is None:
+                    error_handler.push_error_context(ErrorContext.ROW, index)
+                    hed_obj = HedString(hed_string, self.hed_schema, def_dict=self.def_dict)
+                    string_issues = validator.validate(hed_obj, allow_placeholders, error_handler=error_handler)
+                    error_handler.pop_error_context()
+                else:
+                    string_issues = self._get_cached_issues(validator, hed_string, cache_key)
+                    string_issues = self._add_error_context(string_issues, error_handler, index)
+                seen[hed_string] = string_issues
+                row_issues = string_issues
+            elif string_issues:
+                row_issues = [{**issue, ErrorContext.ROW: index} for issue in string_issues]
+            else:
+                continue
+            if budget is not None:
+                issues += budget.take(row_issues)
+                if budget.exhausted:
+                    break
+            else:
+                issues += row_issues
+        if self.cache is not None:
+            self.cache.commit()
         return issues
 
+    def _get_cached_issues(self, validator: HedValidator, hed_string: str, cache_key: tuple) -> List[Dict[str, Any]]:
+        """
+        Return the context-free issues of a HED string from the persistent cache, validating and storing it on a miss.
+
+        Parameters:
+            validator (HedValidator): The validator to use on a cache miss.
+            hed_string (str): The HED string.
+            cache_key (tuple): (schema version, definitions hash, allow_placeholders) for the cache entry.
+
+        Returns:
+            List[Dict[str, Any]]: The issues of the string, with warnings and without error context.
+        """
+        string_issues = self.cache.get(*cache_key, hed_string)
+        if string_issues is None:
+            hed_obj = HedString(hed_string, self.hed_schema, def_dict=self.def_dict)
+            string_issues = validator.validate(
+                hed_obj, cache_key[2], error_handler=ErrorHandler(check_for_warnings=True)
+            )
+            string_issues = self.cache.put(*cache_key, hed_string, string_issues)
+        return string_issues
+
+    @staticmethod
+    def _add_error_context(issues: List[Dict[str, Any]], error_handler: ErrorHandler, row: int) -> List[Dict[str, Any]]:
+        """Add the handler's context and the row to context-free issues, filtering warnings if the handler does."""
+        check_for_warnings = getattr(error_handler, "_check_for_warnings", True)
+        context = dict(error_handler.error_context)
+        context[ErrorContext.ROW] = row
+        return [
+            {**issue, **context} for issue in issues if check_for_warnings or issue["severity"] < ErrorSeverity.WARNING
+        ]
+
+    def _definitions_hash(self) -> str:
+        """Return a hash of the validator's DefinitionDict (names, placeholders, and contents of all definitions)."""
+        return definitions_hash(self.def_dict)
+
     def validate_value_vector(
-        self, hed_values: HedValueVector, error_handler: Optional[ErrorHandler] = None
+        self,
+        hed_values: HedValueVector,
+        error_handler: Optional[ErrorHandler] = None,
+        template_fast_path: bool = True,
+        chunk_size: Optional[int] = None,
+        max_issues: Optional[int] = None,
+        stop_on_first_error: bool = False,
+        rows: Union[slice, Sequence[int], None] = None,
+        progress: Optional[Callable[[Optional[str], Optional[str], int, int], None]] = None,
+        cancel=None,
     ) -> List[Dict[str, Any]]:
         """
         Validates a HedValueVector column using the provided HED schema metadata.
 
+        The template is parsed and validated once. With ``template_fast_path`` (the default), each
+        distinct value is then checked against the value class and units of the template's placeholder
+        tag (vectorized over numeric NumPy data), and only values that fail that check, or that could
+        change the structure of the annotation, are substituted into the template and fully parsed.
+        Values that pass the check cannot produce issues in the full validation, so the issues
+        returned are the same in both modes.
+
         Parameters:
             hed_values (HedValueVector): The HedValueVector column to validate
             error_handler (ErrorHandler, optional): An ErrorHandler instance for collecting errors.
                                                    If None, a new instance will be created.
+            template_fast_path (bool): If False, every value is substituted into the template and the
+                                       resulting string is fully parsed and validated.
+            chunk_size (int, optional): The number of rows to read per block (see validate_vector).
+            max_issues (int, optional): Stop validating once this many issues have been found.
+            stop_on_first_error (bool): Stop validating at the first issue with error severity.
+            rows (slice or sequence of int, optional): Validate only these rows (see validate_vector).
+                                                       The template is always validated.
+            progress (callable, optional): Called as ``progress(table_name, column_name, rows_done, total_rows)``
+                                           as validation advances (see validate_vector).
+            cancel (optional): A cancellation token such as a ``threading.Event``; validation raises
+                               ValidationCancelledError once ``cancel.is_set()`` is true.
 
         Returns:
             List[Dict[str, Any]]: A list of validation issues found in the HedValueVector column
+
+        Raises:
+            ValueError: If hed_values is not a HedValueVector with a template or max_issues is not positive.
+            ValueError: If a row index is out of range.
+            ValidationCancelledError: If the cancellation token is set during validation.
         """
         if hed_values is None or not isinstance(hed_values, HedValueVector) or hed_values.hed is None:
             raise ValueError("The provided hed_values is not a valid HedValueVector instance.")
-        if error_handler is None:
-            error_handler = ErrorHandler(check_for_warnings=False)
+        budget = IssueBudget(max_issues, stop_on_first_error)
+        monitor = ValidationMonitor(progress, cancel, getattr(hed_values.parent, "name", None), hed_values.name)
+        if rows is not None:
+            rows = _normalize_rows(rows, len(hed_values.data))
+        error_handler = self._call_error_handler(error_handler)
+        return self._validate_value_column(
+            hed_values, error_handler, template_fast_path, chunk_size, budget, rows, monitor
+        )
 
-        issues = []
-        # Validate the HED template first
-        hed_template = HedString(hed_values.hed, self.hed_schema, def_dict=self.def_dict)
-        issues += hed_template.validate(allow_placeholders=True, error_handler=error_handler)
-        if check_for_any_errors(issues):
+    def _validate_value_column(
+        self,
+        hed_values: HedValueVector,
+        error_handler: ErrorHandler,
+        template_fast_path: bool,
+        chunk_size: Optional[int],
+        budget: "IssueBudget",
+        rows: Union[slice, np.ndarray, None] = None,
+        monitor: Optional["ValidationMonitor"] = None,
+    ) -> List[Dict[str, Any]]:
+        """Validate the template and then the rows of a HedValueVector (see validate_value_vector)."""
+        template_issues, hed_template = self._validate_template(hed_values, error_handler)
+        issues = budget.take(template_issues)
+        if check_for_any_errors(template_issues) or budget.exhausted:
             return issues
+        issues += self._validate_value_rows(
+            hed_values, hed_template, error_handler, template_fast_path, chunk_size, rows, budget, monitor
+        )
+        return issues
+
+    def _validate_template(self, hed_values: HedValueVector, error_handler: ErrorHandler) -> tuple:
+        """
+        Parse and validate the HED template of a HedValueVector (placeholders allowed).
+
+        Returns:
+            tuple: (list of template issues, the parsed template HedString).
+        """
+        hed_template = HedString(hed_values.hed, self.hed_schema, def_dict=self.def_dict)
+        issues = hed_template.validate(allow_placeholders=True, error_handler=error_handler)
+        return issues, hed_template
+
+    def _validate_value_rows(
+        self,
+        hed_values: HedValueVector,
+        hed_template: HedString,
+        error_handler: ErrorHandler,
+        template_fast_path: bool = True,
+        chunk_size: Optional[int] = None,
+        rows: Union[slice, np.ndarray, None] = None,
+        budget: Optional["IssueBudget"] = None,
+        monitor: Optional["ValidationMonitor"] = None,
+    ) -> List[Dict[str, Any]]:
+        """Validate the normalized selected rows of a HedValueVector with a template (see validate_value_vector)."""
+        placeholder_tag = self._get_placeholder_tag(hed_template) if template_fast_path else None
+        if placeholder_tag is None:
+            row_values = (
+                (indices[offset], str(value))
+                for indices, block in self._iter_row_blocks(hed_values.data, chunk_size, rows, monitor)
+                for offset, value in enumerate(block)
+                if not self._is_skipped_value(value)
+            )
+        else:
+            row_values = self._suspect_value_rows(hed_values.data, placeholder_tag, chunk_size, rows, monitor)
+
+        # Substitute each value into the template in place of # and validate the full annotation
+        row_strings = ((index, hed_values.hed.replace("#", value)) for index, value in row_values)
+        return self._validate_rows(row_strings, error_handler, budget=budget)
+
+    @staticmethod
+    def _is_skipped_value(value) -> bool:
+        """Return True if a HedValueVector value is missing (None, empty, n/a, or NaN) and is not validated."""
+        return value is None or (isinstance(value, float) and math.isnan(value)) or value in ("", "n/a")
+
+    @staticmethod
+    def _get_placeholder_tag(hed_template: HedString):
+        """
+        Return the tag of a validated template that holds the ``#`` placeholder, if values can be checked on it.
+
+        Returns None (values must be fully parsed) unless exactly one tag holds the placeholder and that tag
+        takes a schema value. Def and Def-expand tags are excluded because the validity of their value
+        depends on the definition, not on a value class. Templates with another tag of the same base tag
+        (e.g. ``Label/#, Label/foo``) are also excluded, because a value can make the substituted tag (or its
+        group) a repeat of the other one, which only the full validation reports.
+        """
+        all_tags = hed_template.get_all_tags()
+        tags = [tag for tag in all_tags if "#" in tag.extension]
+        if len(tags) != 1 or not tags[0].is_takes_value_tag():
+            return None
+        base_tag = tags[0].short_base_tag.casefold()
+        if base_tag in ("def", "def-expand", "definition"):
+            return None
+        if any(tag is not tags[0] and tag.short_base_tag.casefold() == base_tag for tag in all_tags):
+            return None
+        return tags[0]
+
+    def _suspect_value_rows(
+        self,
+        data,
+        placeholder_tag,
+        chunk_size: Optional[int] = None,
+        rows: Union[slice, np.ndarray, None] = None,
+        monitor: Optional["ValidationMonitor"] = None,
+    ):
+        """
+        Yield (row index, value string) for the values of a column that fail the placeholder tag check.
 
-        for index, tag in enumerate(hed_values.data):
-            if tag is None or tag == "" or tag == "n/a" or (isinstance(tag, float) and math.isnan(tag)):
+        Each distinct value is checked once against the placeholder tag's units and value class. The data is
+        read in blocks (see _iter_blocks); numeric blocks are deduplicated with ``np.unique`` and only the
+        rows holding a suspect value are visited.
+
+        Parameters:
+            data: The column data (a list, NumPy array, or h5py dataset).
+            placeholder_tag (HedTag): The template tag holding the ``#`` placeholder.
+            chunk_size (int, optional): The number of rows to read per block.
+            rows (slice or np.ndarray, optional): The selected rows, normalized by _normalize_rows (all if None).
+            monitor (ValidationMonitor, optional): The progress and cancellation monitor of the validation call.
+
+        Yields:
+            tuple: (int, str) the row index and the string form of its value.
+        """
+        unit_validator = UnitValueValidator(modern_allowed_char_rules=self.hed_schema.schema_83_props)
+        verdicts = {}
+
+        def is_suspect(value_str):
+            verdict = verdicts.get(value_str)
+            if verdict is not None:
+                return verdict
+            if not value_str or value_str != value_str.strip() or not self.SAFE_VALUE_CHARS.issuperset(value_str):
+                verdict = True
+            elif placeholder_tag.is_unit_class_tag():
+                value_text = placeholder_tag.extension.replace("#", value_str)
+                verdict = bool(
+                    unit_validator.check_tag_unit_class_units_are_valid(
+                        placeholder_tag, value_text, allow_placeholders=False
+                    )
+                )
+            else:
+                value_text = placeholder_tag.extension.replace("#", value_str)
+                verdict = bool(unit_validator.check_tag_value_class_valid(placeholder_tag, value_text))
+            verdicts[value_str] = verdict
+            return verdict
+
+        for indices, block in self._iter_row_blocks(data, chunk_size, rows, monitor):
+            if getattr(block, "dtype", None) is not None and block.dtype.kind in "iuf":
+                values = np.asarray(block)
+                present = ~np.isnan(values) if values.dtype.kind == "f" else np.ones(values.shape, dtype=bool)
+                unique_values, inverse = np.unique(values[present], return_inverse=True)
+                suspect = np.fromiter(
+                    (is_suspect(str(value)) for value in unique_values), dtype=bool, count=len(unique_values)
+                )
+                for offset in np.flatnonzero(present)[suspect[inverse]].tolist():
+                    yield indices[offset], str(values[offset])
                 continue
 
-            error_handler.push_error_context(ErrorContext.ROW, index)
-            # Substitute the tag value into the template in place of #
-            eval_tag = hed_values.hed.replace("#", str(tag))
-            hed_obj = HedString(eval_tag, self.hed_schema, def_dict=self.def_dict)
-            row_issues = hed_obj.validate(allow_placeholders=False, error_handler=error_handler)
-            issues += row_issues
-            error_handler.pop_error_context()
+            for offset, value in enumerate(block):
+                if self._is_skipped_value(value):
+                    continue
+                value_str = str(value)
+                if is_suspect(value_str):
+                    yield indices[offset], value_str
+
+    def validate_new_rows(
+        self,
+        column: Union[HedTags, HedValueVector],
+        error_handler: Optional[ErrorHandler] = None,
+        chunk_size: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Incrementally validates a HedTags or HedValueVector column, checking only rows added since the last call.
+
+        The column records a validated high-water mark together with the validation state (the schema version,
+        a hash of the DefinitionDict, and for a HedValueVector its template). Rows below the mark are skipped
+        and only the issues of the new rows are returned; the mark then moves to the end of the column. If the
+        state has changed (e.g. definitions were added) or the column shrank, the whole column is re-validated.
+        The template of a HedValueVector is reported only when the column is validated from the first row; while
+        the template has errors the mark does not move. Rows that are modified in place below the mark are not
+        detected; call ``column.reset_validation()`` after such a change.
+
+        Parameters:
+            column (HedTags or HedValueVector): The column to validate.
+            error_handler (ErrorHandler, optional): An ErrorHandler instance for collecting errors.
+                                                   If None, a new instance will be created.
+            chunk_size (int, optional): The number of rows to read per block (see validate_vector).
+
+        Returns:
+            List[Dict[str, Any]]: The validation issues of the rows that had not been validated yet.
+
+        Raises:
+            ValueError: If column is not a HedTags or HedValueVector instance.
+        """
+        if not isinstance(column, (HedTags, HedValueVector)):
+            raise ValueError("The provided column is not a valid HedTags or HedValueVector instance.")
+        error_handler = self._call_error_handler(error_handler)
+
+        state = self._validation_state()
+        stop = len(column.data)
+        if isinstance(column, HedTags):
+            start = column.get_validated_rows(state)
+            issues = self._validate_tag_rows(column, error_handler, chunk_size, slice(start, stop))
+        else:
+            state += (column.hed,)
+            start = column.get_validated_rows(state)
+            template_issues, hed_template = self._validate_template(column, error_handler)
+            if check_for_any_errors(template_issues):
+                return template_issues
+            issues = template_issues if start == 0 else []
+            issues += self._validate_value_rows(
+                column, hed_template, error_handler, True, chunk_size, slice(start, stop)
+            )
+        column.set_validated_rows(state, stop)
         return issues
 
+    def _validation_state(self) -> tuple:
+        """Return the (schema version, definitions hash) pair that validation results depend on."""
+        return self._schema_version(), self._definitions_hash()
+
+    def _schema_version(self) -> str:
+        """Return the HED schema version of the validator's metadata."""
+        return self._hed_metadata.get_hed_schema_version()
+
+    def _definitions(self) -> Optional[str]:
+        """Return the definitions string def_dict was built from: the snapshot in thread-safe mode."""
+        return self._definitions_snapshot if self.thread_safe else self._hed_metadata.definitions
+
     def validate_events(
-        self, events: EventsTable, error_handler: Optional[ErrorHandler] = None
+        self,
+        events: EventsTable,
+        error_handler: Optional[ErrorHandler] = None,
+        max_issues: Optional[int] = None,
+        stop_on_first_error: bool = False,
+        rows: Union[slice, Sequence[int], None] = None,
+        columns: Optional[Sequence[str]] = None,
+        progress: Optional[Callable[[Optional[str], Optional[str], int, int], None]] = None,
+        cancel=None,
+        chunk_size: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """
         Validates HED tags in an EventsTable by converting it to BIDS format and validating the events.
 
-        This function extracts the BIDS-formatted DataFrame and JSON sidecar from the EventsTable
-        using get_bids_tabular(), then validates the HED tags contained within using the provided
+        This function extracts the HED-relevant BIDS-style DataFrame and sidecar from the EventsTable
+        using get_hed_tabular(), then validates the HED tags contained within using the provided
         HED schema metadata.
 
+        With ``rows`` and/or ``columns``, only those rows of the onset column and of the selected HED columns
+        (HedTags, HedValueVector, and MeaningsTable-annotated columns) are read and assembled. Issues report
+        the same ``ec_row`` as validation of the full table would. Temporal checks only see the selected rows,
+        so e.g. an Offset whose Onset lies outside the selection is reported.
+
+        With ``chunk_size`` (and no ``rows``), the table is read, assembled, and validated in blocks of about
+        ``chunk_size`` rows, so memory stays bounded for very long recordings. The temporal state (open Onset
+        definitions) and the categorical value checks are carried from block to block, so the issues are the
+        same as for the whole table (see _validate_assembled_in_blocks). Tables with unsorted or missing onsets
+        or with Delay tags are validated as a whole.
+
         Parameters:
             events (EventsTable): The EventsTable to validate containing HED tags
             error_handler (ErrorHandler, optional): An ErrorHandler instance for collecting errors.
                                                    If None, a new instance will be created.
+            max_issues (int, optional): Stop validating once this many issues have been found.
+            stop_on_first_error (bool): Stop validating at the first issue with error severity.
+            rows (slice or sequence of int, optional): Validate only these rows: a slice, an array of row
+                                                       indices, or a boolean mask. All rows if None.
+            columns (sequence of str, optional): Validate only the HED columns with these names.
+            progress (callable, optional): Called as ``progress(table_name, None, rows_done, total_rows)`` as the
+                                           assembled rows are validated (see _validate_tabular_input).
+            cancel (optional): A cancellation token such as a ``threading.Event``; validation raises
+                               ValidationCancelledError once ``cancel.is_set()`` is true.
+            chunk_size (int, optional): Validate the table in blocks of about this many rows.
 
         Returns:
             List[Dict[str, Any]]: A list of validation issues found in the EventsTable HED tags
 
         Raises:
             ValueError: If the EventsTable is invalid or cannot be converted to BIDS format
+            ValueError: If max_issues is not positive
+            ValueError: If a row index is out of range or a column is not in the table
+            ValueError: If chunk_size is not positive
+            ValidationCancelledError: If the cancellation token is set during validation
 
         Notes:
-            This function uses get_bids_tabular() to extract BIDS-formatted data from the EventsTable,
+            This function uses get_hed_tabular() to extract BIDS-formatted data from the EventsTable,
             then applies HED validation to the extracted event annotations. The validation follows
             BIDS-HED standards for event annotation validation.
         """
         if events is None or not isinstance(events, EventsTable):
             raise ValueError("The provided events is not a valid EventsTable instance.")
+        budget = IssueBudget(max_issues, stop_on_first_error)
 
-        if error_handler is None:
-            error_handler = ErrorHandler(check_for_warnings=False)
+        error_handler = self._call_error_handler(error_handler)
 
-        return self._validate_assembled(events, error_handler)
+        monitor = ValidationMonitor(progress, cancel)
+        if chunk_size is not None and rows is None:
+            return self._validate_assembled_in_blocks(events, error_handler, chunk_size, budget, columns, monitor)
+        return self._validate_assembled(events, error_handler, budget, rows, columns, monitor)
 
-    def _validate_assembled(self, table: DynamicTable, error_handler: ErrorHandler) -> List[Dict[str, Any]]:
+    def _validate_assembled(
+        self,
+        table: DynamicTable,
+        error_handler: ErrorHandler,
+        budget: Optional["IssueBudget"] = None,
+        rows: Union[slice, Sequence[int], None] = None,
+        columns: Optional[Sequence[str]] = None,
+        monitor: Optional["ValidationMonitor"] = None,
+    ) -> List[Dict[str, Any]]:
         """
         Assembled (BIDS-style) validation of a DynamicTable.
 
-        The table is converted to a BIDS-format dataframe + JSON sidecar with get_bids_tabular().
-        The sidecar (column metadata: value templates and categorical Levels/HED) is validated first
+        The HED-relevant columns of the table are assembled into a BIDS-style dataframe + sidecar
+        dictionary with get_hed_tabular(), which reads only those columns (not ``to_dataframe()``); the
+        Sidecar is built from the dictionary directly rather than by re-parsing serialized JSON. The
+        sidecar (column metadata: value templates and categorical Levels/HED) is validated first
         with Sidecar.validate(), then the assembled per-row annotations are validated with
         TabularInput.validate(). Both steps are required: TabularInput.validate() does NOT re-run the
         sidecar's brace-structure / column-reference checks (self, nested, invalid, or malformed
@@ -211,67 +872,373 @@ class HedNWBValidator:
         dataframe has an ``onset`` column, TabularInput performs temporal (timeline) validation;
         otherwise it performs non-temporal (per-row) validation.
 
+        If a budget is given, the assembled-table step stops as soon as the budget is used up (see
+        MonitoredErrorHandler) and the issues found up to that point are returned.
+
+        If ``rows`` is given, only those rows are assembled; they are validated as a table of their own and
+        the ``ec_row`` of each issue is then mapped back to the row's position in the full table.
+
         Parameters:
             table (DynamicTable): The table to validate.
             error_handler (ErrorHandler): The error handler collecting issues.
+            budget (IssueBudget, optional): The issue budget of the current validation call.
+            rows (slice or sequence of int, optional): The rows to validate (all rows if None).
+            columns (sequence of str, optional): The HED columns to validate (all columns if None).
+            monitor (ValidationMonitor, optional): The progress and cancellation monitor of the validation call.
 
         Returns:
             List[Dict[str, Any]]: Validation issues for the table.
         """
-        df, json_data = get_bids_tabular(table)
+        if monitor is not None:
+            monitor.set_scope(table.name, None)
+            monitor.check()
+        if rows is None:
+            df, json_data = get_hed_tabular(table, columns=columns)
+            return self._validate_tabular(df, json_data, table.name, error_handler, budget, monitor)
+
+        rows = _normalize_rows(rows, len(table))
+        df, json_data = get_hed_tabular(table, rows, columns)
+        # TabularInput needs a default index for temporal validation, so rows are renumbered and mapped back.
+        issues = self._validate_tabular(
+            df.reset_index(drop=True), json_data, table.name, error_handler, budget, monitor
+        )
+        positions = np.arange(rows.start, rows.stop) if isinstance(rows, slice) else rows
+        for issue in issues:
+            row = issue.get(ErrorContext.ROW)
+            if isinstance(row, (int, np.integer)) and 0 <= row - self.TABULAR_ROW_OFFSET < len(positions):
+                issue[ErrorContext.ROW] = int(positions[row - self.TABULAR_ROW_OFFSET]) + self.TABULAR_ROW_OFFSET
+        return issues
+
+    def _validate_assembled_in_blocks(
+        self,
+        table: DynamicTable,
+        error_handler: ErrorHandler,
+        chunk_size: int,
+        budget: Optional["IssueBudget"] = None,
+        columns: Optional[Sequence[str]] = None,
+        monitor: Optional["ValidationMonitor"] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Assembled validation of a DynamicTable in blocks of about ``chunk_size`` rows, with bounded memory.
+
+        Only one block of rows is assembled at a time. The sidecar is validated once, and the blocks are then
+        validated in order by one BlockSpreadsheetValidator, which carries the state of temporal validation
+        (the Onset/Inset definitions still open) from each block to the next. Block boundaries are moved forward
+        to the next gap between onsets larger than SpreadsheetValidator.ONSET_TOLERANCE, so rows that
+        TabularInput merges or compares because their onsets coincide are always in the same block. The issues
+        are the same as for _validate_assembled, in the same order.
+
+        Tables whose onsets are not sorted or include missing values, and tables with Delay tags (which move
+        annotations to later onsets, possibly into a later block), cannot be validated this way; they are
+        validated with _validate_assembled as a whole. A table without an onset column has no temporal state
+        and is split every ``chunk_size`` rows. All tables are validated as a whole if the installed hedtools
+        lacks the internals BlockSpreadsheetValidator relies on (see BlockSpreadsheetValidator.supported).
+
+        Parameters:
+            table (DynamicTable): The table to validate.
+            error_handler (ErrorHandler): The error handler collecting issues.
+            chunk_size (int): The number of rows per block (blocks may be longer to keep equal onsets together).
+            budget (IssueBudget, optional): The issue budget of the current validation call.
+            columns (sequence of str, optional): The HED columns to validate (all columns if None).
+            monitor (ValidationMonitor, optional): The progress and cancellation monitor of the validation call.
+
+        Returns:
+            List[Dict[str, Any]]: Validation issues for the table.
+
+        Raises:
+            ValueError: If chunk_size is not positive.
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, but {chunk_size} was given.")
+        if budget is None:
+            budget = IssueBudget()
+        if monitor is None:
+            monitor = ValidationMonitor()
+        if not BlockSpreadsheetValidator.supported():
+            return self._validate_assembled(table, error_handler, budget, columns=columns, monitor=monitor)
+        monitor.set_scope(table.name, None)
+        monitor.check()
+
+        num_rows = len(table)
+        onset_df, _ = get_hed_tabular(table, columns=[])
+        onsets = None
+        if "onset" in onset_df.columns:
+            onsets = pd.to_numeric(onset_df["onset"], errors="coerce").to_numpy(dtype=float)
+            if np.isnan(onsets).any() or np.any(np.diff(onsets) < 0) or self._has_delay_tags(table, chunk_size):
+                return self._validate_assembled(table, error_handler, budget, columns=columns, monitor=monitor)
+        del onset_df
+
+        spreadsheet_validator = BlockSpreadsheetValidator(self.hed_schema, self.cache, self._schema_version())
+        json_data = None
+        sidecar = None
+        sidecar_issues = []
+        present = {}
+        issues = []
+        for start, stop in self._block_bounds(num_rows, chunk_size, onsets):
+            if budget.exhausted:
+                break
+            monitor.check()
+            df, block_json_data = get_hed_tabular(table, slice(start, stop), columns)
+            if json_data is None:
+                # The sidecar does not depend on the rows, so it is built and validated with the first block.
+                json_data = block_json_data
+                if df.columns.difference(["onset"]).empty:
+                    return []
+                if json_data:
+                    sidecar, sidecar_issues = self._validate_sidecar(json_data, table.name, error_handler)
+                    if any(issue.get("code") in self.STRUCTURAL_SIDECAR_CODES for issue in sidecar_issues):
+                        return budget.take(sidecar_issues)
+            tab_input = TabularInput(file=df.reset_index(drop=True), sidecar=sidecar, name=table.name)
+            block_issues = self._validate_tabular_input(
+                tab_input, error_handler, budget, monitor, spreadsheet_validator, start, num_rows
+            )
+            for issue in block_issues:
+                row = issue.get(ErrorContext.ROW)
+                if isinstance(row, (int, np.integer)) and 0 <= row - self.TABULAR_ROW_OFFSET < stop - start:
+                    issue[ErrorContext.ROW] = int(row) + start
+            issues += block_issues
+            if json_data:
+                self._categorical_values_present(df, json_data, present)
+
+        if not budget.exhausted:
+            issues += budget.take(spreadsheet_validator.deferred_issues(error_handler, table.name))
+        issues = sort_issues(issues)
+        if json_data and not budget.exhausted:
+            issues += budget.take(self._unused_categorical_level_issues(sidecar_issues, present, json_data))
+        return issues
+
+    @staticmethod
+    def _block_bounds(num_rows: int, chunk_size: int, onsets: Optional[np.ndarray] = None):
+        """
+        Yield the (start, stop) rows of the blocks of a table validated in blocks.
+
+        Each block has ``chunk_size`` rows, except that with (sorted) onsets a block is extended to the next
+        row whose onset is more than SpreadsheetValidator.ONSET_TOLERANCE after the previous row's.
+        """
+        boundaries = None
+        if onsets is not None:
+            boundaries = np.flatnonzero(np.diff(onsets) > SpreadsheetValidator.ONSET_TOLERANCE) + 1
+        start = 0
+        while start < num_rows:
+            stop = min(start + chunk_size, num_rows)
+            if boundaries is not None and stop < num_rows:
+                index = np.searchsorted(boundaries, stop)
+                stop = int(boundaries[index]) if index < len(boundaries) else num_rows
+            yield start, stop
+            start = stop
+
+    def _has_delay_tags(self, table: DynamicTable, chunk_size: Optional[int] = None) -> bool:
+        """
+        Return True if any HED of a table (its HedTags columns, value templates, or meanings) has a Delay tag.
+
+        The HED sources are checked for the same ``delay/`` substring TabularInput looks for in the assembled
+        strings; HedTags columns are read in blocks of ``chunk_size`` rows.
+        """
+        hed_columns = [col for col in table.columns if isinstance(col, HedTags)]
+        for col in table.columns:
+            if isinstance(col, HedValueVector) and col.hed and "delay/" in col.hed.casefold():
+                return True
+        for meanings_table in table.meanings_tables.values():
+            if "HED" in meanings_table.colnames:
+                hed_columns.append(meanings_table["HED"])
+        for col in hed_columns:
+            for _, block in self._iter_blocks(col.data, chunk_size):
+                if any(isinstance(value, str) and "delay/" in value.casefold() for value in block):
+                    return True
+        return False
+
+    def _validate_tabular(
+        self,
+        df,
+        json_data: dict,
+        name: str,
+        error_handler: ErrorHandler,
+        budget: Optional["IssueBudget"] = None,
+        monitor: Optional["ValidationMonitor"] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Validate an assembled BIDS-style dataframe and sidecar produced by get_hed_tabular() (or get_bids_tabular()).
+
+        This is the part of _validate_assembled that does not touch the NWB table, so it can also run
+        in a worker process (see validate_file).
+
+        Parameters:
+            df (pd.DataFrame): The BIDS-style dataframe for the table.
+            json_data (dict): The sidecar JSON data for the table.
+            name (str): The name of the table (used as the sidecar/tabular name in issues).
+            error_handler (ErrorHandler): The error handler collecting issues.
+            budget (IssueBudget, optional): The issue budget of the current validation call.
+            monitor (ValidationMonitor, optional): The progress and cancellation monitor of the validation call.
+
+        Returns:
+            List[Dict[str, Any]]: Validation issues for the table.
+        """
+        if budget is None:
+            budget = IssueBudget()
+        if monitor is None:
+            monitor = ValidationMonitor()
+
+        # Nothing to validate (no HED columns, at most an onset column).
+        if df.columns.difference(["onset"]).empty:
+            return []
 
         # No sidecar metadata: validate the assembled table on its own (e.g. only a direct HED column).
         if not json_data:
-            tab_input = TabularInput(file=df, name=table.name)
-            return tab_input.validate(self.hed_schema, extra_def_dicts=self.def_dict, error_handler=error_handler)
-
-        # Step 1: validate the sidecar metadata explicitly. Only Sidecar.validate() performs the
-        # brace-structure / column-reference checks; it also validates the HED of every categorical
-        # level even those not present in the data.
-        sidecar = Sidecar(io.StringIO(json.dumps(json_data)), name=table.name)
-        sidecar_issues = sidecar.validate(self.hed_schema, extra_def_dicts=self.def_dict, error_handler=error_handler)
-        for issue in sidecar_issues:
-            if not issue.get("ec_filename"):
-                issue["ec_filename"] = table.name
+            tab_input = TabularInput(file=df, name=name)
+            return self._validate_tabular_input(tab_input, error_handler, budget, monitor)
+
+        # Step 1: validate the sidecar metadata explicitly (see _validate_sidecar).
+        sidecar, sidecar_issues = self._validate_sidecar(json_data, name, error_handler)
 
         # If the sidecar is structurally malformed (bad braces / invalid sidecar), the assembled-table
         # step would miss it and emit misleading downstream errors, so stop and report the structure.
         if any(issue.get("code") in self.STRUCTURAL_SIDECAR_CODES for issue in sidecar_issues):
-            return sidecar_issues
+            return budget.take(sidecar_issues)
 
         # Step 2: validate the assembled table. This carries full context (ec_filename / ec_column /
         # ec_row) and performs temporal (timeline) validation when an ``onset`` column is present. It
         # re-reports the categorical/value HED errors for values that occur in the data, so those are
         # taken from here (with context) rather than from the sidecar step.
-        tab_input = TabularInput(file=df, sidecar=sidecar, name=table.name)
-        issues = tab_input.validate(self.hed_schema, extra_def_dicts=self.def_dict, error_handler=error_handler)
+        tab_input = TabularInput(file=df, sidecar=sidecar, name=name)
+        issues = self._validate_tabular_input(tab_input, error_handler, budget, monitor)
 
         # TabularInput only sees categorical values that occur in the data, so add the sidecar errors
         # for categorical levels that never appear (otherwise they would be missed).
-        issues += self._unused_categorical_level_issues(sidecar_issues, df, json_data)
+        if not budget.exhausted:
+            present = self._categorical_values_present(df, json_data)
+            issues += budget.take(self._unused_categorical_level_issues(sidecar_issues, present, json_data))
         return issues
 
+    def _validate_sidecar(self, json_data: dict, name: str, error_handler: ErrorHandler) -> tuple:
+        """
+        Build the Sidecar of an assembled table from its sidecar dictionary and validate it.
+
+        Only Sidecar.validate() performs the brace-structure / column-reference checks; it also validates the
+        HED of every categorical level, even those not present in the data.
+
+        Tables with the same column metadata (e.g. one EventsTable per run) have identical sidecars, so the
+        context-free issues of a sidecar are memoized process-wide (see clear_sidecar_memo), keyed by a hash of
+        its canonical JSON, the schema version, and the definitions. A sidecar seen before, in this or another
+        file, is not validated again; its issues are returned with the current error context and table name.
+
+        Parameters:
+            json_data (dict): The sidecar JSON data for the table.
+            name (str): The name of the table (used as ``ec_filename`` of issues without one).
+            error_handler (ErrorHandler): The error handler collecting issues.
+
+        Returns:
+            tuple: (Sidecar, list) the sidecar and its validation issues.
+        """
+        sidecar = Sidecar(None, name=name)
+        sidecar.loaded_dict = json_data
+        memo_key = self._sidecar_key(json_data)
+        memo_issues = _sidecar_memo.get(memo_key)
+        if memo_issues is None:
+            memo_issues = sidecar.validate(
+                self.hed_schema, extra_def_dicts=self.def_dict, error_handler=ErrorHandler(check_for_warnings=True)
+            )
+            _sidecar_memo.put(memo_key, memo_issues)
+
+        check_for_warnings = getattr(error_handler, "_check_for_warnings", True)
+        context = dict(error_handler.error_context)
+        sidecar_issues = []
+        for issue in memo_issues:
+            if check_for_warnings or issue["severity"] < ErrorSeverity.WARNING:
+                issue = {**issue, **{key: value for key, value in context.items() if key not in issue}}
+                if not issue.get("ec_filename"):
+                    issue["ec_filename"] = name
+                sidecar_issues.append(issue)
+        return sidecar, sidecar_issues
+
+    def _sidecar_key(self, json_data: dict) -> str:
+        """Return the memo key of a sidecar: a hash of its canonical JSON, the schema version, and the definitions."""
+        digest = hashlib.sha256(json.dumps(json_data, sort_keys=True, separators=(",", ":"), default=str).encode())
+        for part in self._validation_state():
+            digest.update(f"\0{part}".encode("utf-8"))
+        return digest.hexdigest()
+
+    def _validate_tabular_input(
+        self,
+        tab_input: TabularInput,
+        error_handler: ErrorHandler,
+        budget: "IssueBudget",
+        monitor: "ValidationMonitor",
+        spreadsheet_validator: Optional[SpreadsheetValidator] = None,
+        first_row: int = 0,
+        total_rows: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Validate a TabularInput, stopping inside TabularInput.validate() once the issue budget is used up.
+
+        Without limits, progress, or cancellation, the error handler is used directly. Otherwise the rows
+        are validated with a MonitoredErrorHandler (a copy of the handler's context). It raises
+        IssueBudgetExhaustedError when the issues it has reported use up the budget, in which case the
+        issues reported until then are returned sorted the way TabularInput sorts them. It also follows
+        the rows TabularInput validates, reporting progress every PROGRESS_INTERVAL rows and raising
+        ValidationCancelledError if the cancellation token is set.
+
+        A block of a table validated in blocks (see _validate_assembled_in_blocks) is validated with the
+        table's ``spreadsheet_validator``, and its progress is reported as rows ``first_row`` onwards of
+        ``total_rows``.
+        """
+        if spreadsheet_validator is None:
+            spreadsheet_validator = CachedSpreadsheetValidator(self.hed_schema, self.cache, self._schema_version())
+        def_dicts = tab_input.get_def_dict(self.hed_schema, self.def_dict)
+        block_rows = len(tab_input.dataframe)
+        if total_rows is None:
+            total_rows = block_rows
+        if not budget.limited and not monitor.active:
+            return spreadsheet_validator.validate(tab_input, def_dicts, tab_input.name, error_handler=error_handler)
+        monitored_handler = MonitoredErrorHandler(error_handler, budget, monitor, total_rows, first_row)
+        if first_row == 0:
+            monitor.report(0, total_rows)
+        try:
+            issues = spreadsheet_validator.validate(
+                tab_input, def_dicts, tab_input.name, error_handler=monitored_handler
+            )
+        except IssueBudgetExhaustedError:
+            issues = sort_issues(monitored_handler.issues)
+        if monitored_handler.reported_rows < first_row + block_rows:
+            monitor.report(first_row + block_rows, total_rows)
+        return budget.take(issues)
+
     @staticmethod
-    def _unused_categorical_level_issues(sidecar_issues, df, json_data):
+    def _unused_categorical_level_issues(sidecar_issues, present, json_data):
         """Return the sidecar issues for categorical levels that do not occur in the data.
 
         TabularInput validates only values present in the data, so a bad HED annotation on a
         categorical level that is never used would be missed. Those sidecar issues are added back.
         Value-column (template) and data-column errors are excluded because TabularInput reports them.
+        ``present`` holds the values of each categorical column (see _categorical_values_present).
         """
         extra = []
         for issue in sidecar_issues:
             col = issue.get("ec_sidecarColumnName")
             key = issue.get("ec_sidecarKeyName")
-            if not col or key is None or col not in df.columns:
-                continue
-            if "Levels" not in json_data.get(col, {}):  # only categorical columns have levels
+            if not col or key is None or col not in present:
                 continue
-            present = {str(v) for v in df[col].tolist()}
-            if str(key) not in present:
+            if str(key) not in present[col]:
                 extra.append(issue)
         return extra
 
+    @staticmethod
+    def _categorical_values_present(df, json_data, present: Optional[Dict[str, set]] = None) -> Dict[str, set]:
+        """
+        Collect the values (as strings) of the categorical columns of an assembled dataframe.
+
+        Only categorical columns have per-level HED (a HED dictionary in the sidecar). Values are added to
+        ``present`` if it is given, so the values of a table validated in blocks can be accumulated.
+
+        Returns:
+            dict: The set of values of each categorical column, keyed by column name.
+        """
+        if present is None:
+            present = {}
+        for col in df.columns:
+            if isinstance(json_data.get(col, {}).get("HED"), dict):
+                present.setdefault(col, set()).update(str(value) for value in df[col].tolist())
+        return present
+
     def _check_meanings_table_rules(self, meanings_table: MeaningsTable) -> None:
         """
         Enforce structural rules on a MeaningsTable.
@@ -290,7 +1257,24 @@ class HedNWBValidator:
                     f"'{meanings_table.name}'; categorical HED must be stored in a HedTags column."
                 )
 
-    def validate_file(self, nwbfile: NWBFile, error_handler: Optional[ErrorHandler] = None) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _table_has_hed(table: DynamicTable) -> bool:
+        """
+        Return True if a table has HED content to validate, judged from its column types alone.
+
+        A table has HED if it has a HedTags column, a HedValueVector with a template, or a MeaningsTable
+        with a HED column. No column data is read, so the check is cheap for large tables.
+        """
+        for col in table.columns:
+            if isinstance(col, HedTags):
+                return True
+            if isinstance(col, HedValueVector) and col.hed not in ("", "n/a"):
+                return True
+        return any("HED" in meanings_table.colnames for meanings_table in table.meanings_tables.values())
+
+    def validate_file(
+        self, nwbfile: NWBFile, error_handler: Optional[ErrorHandler] = None, **options
+    ) -> List[Dict[str, Any]]:
         """
         Validates all HED tags in an NWB file by iterating through all DynamicTable objects.
 
@@ -301,24 +1285,59 @@ class HedNWBValidator:
         validation when the table has an ``onset`` column and non-temporal validation otherwise. A
         MeaningsTable is not validated on its own -- its categorical HED is validated as part of the
         table whose column it annotates -- but it is checked against the structural rule that it must
-        not contain a HedValueVector column (a violation raises ValueError).
+        not contain a HedValueVector column (a violation raises ValueError). Tables without HED (see
+        _table_has_hed), such as electrodes or units tables, are skipped without reading their data.
+
+        Tables are independent, so they can be validated in parallel. If ``workers`` or ``executor`` is
+        given, each table is assembled in this process and its dataframe + sidecar is validated by a
+        worker, which loads its own HED schema and DefinitionDict the first time it is used. The issues
+        are merged back in table order, so the result is the same as for serial validation except that
+        HED tag and string objects in the issues (e.g. ``source_tag``) are returned as strings.
+
+        For a quick valid/invalid answer (e.g. in CI), pass ``max_issues`` or ``stop_on_first_error``:
+        validation then stops as soon as that many issues (or the first error) have been found, within
+        the table being validated and across tables, and the issues found up to that point are returned.
+        In parallel mode each worker stops early on its own table, and tables that have not started when
+        the budget is used up are cancelled.
+
+        ``progress`` is called as ``progress(table_name, None, rows_done, total_rows)`` for each table as its
+        rows are validated, and ``cancel`` (e.g. a ``threading.Event``) is checked between tables and between
+        blocks of rows; once it is set, ValidationCancelledError is raised. In parallel mode, progress is
+        reported when each table's result is collected and cancellation is checked between tables (tables
+        that have not started are cancelled).
+
+        With ``chunk_size``, each table is read and validated in blocks of about ``chunk_size`` rows (see
+        validate_events), so memory stays bounded for very long tables. Blocks are validated serially, so
+        ``chunk_size`` cannot be combined with ``workers`` or ``executor``.
+
+        With ``threads``, the tables are validated by this validator in a thread pool with that many threads,
+        each table with a private copy of the error handler, so no process is started and no schema is loaded
+        again. The issues are the same as for serial validation (HED tag and string objects included). This
+        pays off on free-threaded Python builds; with the GIL, threads mostly overlap the HDF5 reads. Progress
+        is reported as each table finishes, and ``threads`` cannot be combined with ``workers`` or ``executor``.
 
         Parameters:
             nwbfile (NWBFile): The NWB file to validate
             error_handler (ErrorHandler, optional): An ErrorHandler instance for collecting errors.
                                                    If None, a new instance will be created.
+            **options: The file validation options, documented by FileValidationOptions: ``workers``,
+                       ``executor``, ``max_issues``, ``stop_on_first_error``, ``progress``, ``cancel``,
+                       ``chunk_size``, and ``threads``.
 
         Returns:
             List[Dict[str, Any]]: A consolidated list of validation issues from all tables in the file
 
         Raises:
             ValueError: If nwbfile is not a valid NWBFile instance
+            ValueError: If an option is invalid (see FileValidationOptions) or chunk_size is not positive
             ValueError: If a MeaningsTable contains a HedValueVector column
             HedFileError: If HedLabMetaData is missing or invalid in the NWB file
             HedFileError: If the HED schema version in the NWB file does not match the validator's schema version
+            ValidationCancelledError: If the cancellation token is set during validation
         """
         if nwbfile is None or not isinstance(nwbfile, NWBFile):
             raise ValueError("The provided nwbfile is not a valid NWBFile instance.")
+        options = FileValidationOptions(**options)
 
         # Check if HedLabMetaData is defined in the file and matches the validator's schema version
         hed_metadata = nwbfile.lab_meta_data.get("hed_schema")
@@ -327,31 +1346,550 @@ class HedNWBValidator:
                 HedExceptions.SCHEMA_INVALID, f"NWB file {nwbfile.identifier} does not have a valid HED schema", ""
             )
 
-        if hed_metadata.get_hed_schema_version() != self.hed_schema.version:
+        validator_version = self._hed_metadata.get_hed_schema_version()
+        if _schema_version_key(hed_metadata.get_hed_schema_version()) != _schema_version_key(validator_version):
             raise HedFileError(
                 HedExceptions.SCHEMA_VERSION_INVALID,
                 f"HED schema version in NWB file ({hed_metadata.get_hed_schema_version()})"
                 + " does not match validator schema version"
-                + f"({self.hed_schema.version})",
+                + f"({validator_version})",
                 "",
             )
 
-        if error_handler is None:
-            error_handler = ErrorHandler(check_for_warnings=False)
-
-        issues = []
+        error_handler = self._call_error_handler(error_handler)
 
-        error_handler.push_error_context(ErrorContext.FILE_NAME, nwbfile.identifier)
-        # Validate every DynamicTable with assembled (BIDS-style) validation, except MeaningsTables.
+        # Validate every DynamicTable with assembled (BIDS-style) validation, except MeaningsTables
+        # and tables without HED (which cannot have HED issues and are skipped without reading them).
         # A MeaningsTable is a lookup consumed during the assembly of the table whose column it
         # annotates, so it is not validated on its own; it is only checked against the structural
         # rule that it must not contain a HedValueVector column.
+        tables = []
         for obj in nwbfile.all_children():
             if not isinstance(obj, DynamicTable):
                 continue
             if isinstance(obj, MeaningsTable):
                 self._check_meanings_table_rules(obj)  # raises ValueError on a disallowed column
                 continue
-            issues.extend(self._validate_assembled(obj, error_handler))
-        error_handler.pop_error_context()
+            if self._table_has_hed(obj):
+                tables.append(obj)
+
+        return self._validate_file_tables(nwbfile.identifier, tables, error_handler, options)
+
+    @classmethod
+    def validate_path(
+        cls,
+        path: str,
+        error_handler: Optional[ErrorHandler] = None,
+        cache: Optional[ValidationCache] = None,
+        **options,
+    ) -> List[Dict[str, Any]]:
+        """
+        Validates the HED in an NWB file on disk, reading only the HED metadata and the tables with HED.
+
+        This is a one-call alternative to reading the file with NWBHDF5IO, constructing a HedNWBValidator
+        from its HedLabMetaData, and calling validate_file. The file is opened read-only and its HDF5 groups
+        are scanned by their attributes alone (no dataset is read) to find the ``hed_schema`` lab metadata and
+        the tables with HED (see _table_has_hed). The validator is constructed from that metadata, and only
+        the tables with HED (plus any MeaningsTable holding a HedValueVector, to check it against the
+        MeaningsTable rules) are constructed as NWB containers, with their column data read lazily. Other
+        objects, such as acquisition series, electrodes, or units tables, are never constructed or read,
+        and a file without tables with HED is checked without constructing any container.
+
+        The tables are validated as in validate_file (assembled validation, with ``ec_filename`` set to the
+        file's identifier), so the issues are the same except for their order, which follows the layout of
+        the file.
+
+        Parameters:
+            path (str): The path of the NWB (HDF5) file.
+            error_handler (ErrorHandler, optional): An ErrorHandler instance for collecting errors.
+                                                   If None, a new instance will be created.
+            cache (ValidationCache, optional): A persistent cache of HED string validation results, used by the
+                                               validator constructed for the file (not in worker processes).
+            **options: The file validation options, as for validate_file (see FileValidationOptions).
+
+        Returns:
+            List[Dict[str, Any]]: A consolidated list of validation issues from all tables in the file.
+
+        Raises:
+            HedFileError: If the file does not have valid HedLabMetaData.
+            ValueError: If a MeaningsTable contains a HedValueVector column.
+            ValueError: If an option is invalid (see FileValidationOptions) or chunk_size is not positive.
+            ValidationCancelledError: If the cancellation token is set during validation.
+        """
+
+        def get_validator(hed_schema_version: str, definitions: Optional[str]) -> "HedNWBValidator":
+            return cls(HedLabMetaData(hed_schema_version=hed_schema_version, definitions=definitions), cache=cache)
+
+        return cls._validate_path(path, get_validator, error_handler, FileValidationOptions(**options))
+
+    @classmethod
+    def _validate_path(
+        cls,
+        path: str,
+        get_validator: Callable[[str, Optional[str]], "HedNWBValidator"],
+        error_handler: Optional[ErrorHandler],
+        options: FileValidationOptions,
+    ) -> List[Dict[str, Any]]:
+        """
+        Validate an NWB file on disk (see validate_path) with the validator returned for its HED metadata.
+
+        Parameters:
+            path (str): The path of the NWB (HDF5) file.
+            get_validator (callable): Called as ``get_validator(hed_schema_version, definitions)`` with the
+                                      attributes of the file's HedLabMetaData group; returns the validator to
+                                      use (see HedValidatorPool). A ValueError it raises becomes a HedFileError.
+            error_handler (ErrorHandler, optional): The error handler collecting issues.
+            options (FileValidationOptions): The options of the validation call.
+
+        Returns:
+            List[Dict[str, Any]]: A consolidated list of validation issues from all tables in the file.
+
+        Raises:
+            HedFileError: If the file does not have valid HedLabMetaData.
+        """
+        with h5py.File(path, "r") as h5file:
+            metadata_group, table_paths, meanings_paths = cls._scan_hed_groups(h5file)
+            if metadata_group is None:
+                raise HedFileError(
+                    HedExceptions.SCHEMA_INVALID, f"NWB file {path} does not have a valid HED schema", path
+                )
+            try:
+                validator = get_validator(
+                    attr_str(metadata_group.attrs["hed_schema_version"]), stored_definitions(metadata_group)
+                )
+            except (KeyError, ValueError) as e:
+                raise HedFileError(
+                    HedExceptions.SCHEMA_INVALID, f"NWB file {path} does not have a valid HED schema: {e}", path
+                ) from e
+            error_handler = validator._call_error_handler(error_handler)
+            identifier = attr_str(h5file["identifier"][()]) if "identifier" in h5file else path
+            if not table_paths and not meanings_paths:
+                return []
+
+            with NWBHDF5IO(file=h5file, mode="r", load_namespaces=True) as io:
+                # Builders are read for the whole file (attributes only; datasets stay lazy), but
+                # containers are constructed only for the tables with HED.
+                io.read_builder()
+                for meanings_path in meanings_paths:
+                    validator._check_meanings_table_rules(io.get_container(h5file[meanings_path]))
+                tables = [io.get_container(h5file[table_path]) for table_path in table_paths]
+                return validator._validate_file_tables(identifier, tables, error_handler, options)
+
+    @classmethod
+    def _scan_hed_groups(cls, h5file: h5py.File) -> tuple:
+        """
+        Find the HED metadata and the tables with HED in an open NWB file from the HDF5 attributes alone.
+
+        Groups are walked recursively (links are not followed and the cached specifications are skipped).
+        A group with a ``colnames`` attribute is a table: it has HED if one of its columns is a HedTags or
+        a HedValueVector with a template, or one of its meanings tables has a HED column (the same test as
+        _table_has_hed, without constructing the table).
+
+        Parameters:
+            h5file (h5py.File): The open NWB file.
+
+        Returns:
+            tuple: (h5py.Group or None, list of str, list of str) the HedLabMetaData group, the paths of the
+                   tables with HED (MeaningsTables excluded), and the paths of the MeaningsTables that hold
+                   a HedValueVector column.
+        """
+        metadata_group = None
+        table_paths = []
+        meanings_paths = []
+        skipped = set()
+        specloc = h5file.attrs.get(".specloc")
+        if specloc is not None:
+            skipped.add(h5file[specloc].name)
+        stack = [h5file]
+        while stack:
+            group = stack.pop()
+            for key in sorted(group.keys(), reverse=True):
+                if not isinstance(group.get(key, getlink=True), h5py.HardLink):
+                    continue
+                if group.get(key, getclass=True) is not h5py.Group:
+                    continue
+                child = group[key]
+                if child.name in skipped:
+                    continue
+                stack.append(child)
+                neurodata_type = attr_str(child.attrs.get("neurodata_type"))
+                if neurodata_type == "HedLabMetaData":
+                    metadata_group = child
+                elif "colnames" not in child.attrs:
+                    continue
+                elif neurodata_type == "MeaningsTable":
+                    if "HedValueVector" in column_types(child):
+                        meanings_paths.append(child.name)
+                elif cls._group_has_hed(child):
+                    table_paths.append(child.name)
+        return metadata_group, table_paths, meanings_paths
+
+    @staticmethod
+    def _group_has_hed(table_group: h5py.Group) -> bool:
+        """Return True if a table's HDF5 group has HED content to validate (see _table_has_hed)."""
+        for column in table_group.attrs["colnames"]:
+            dataset = table_group.get(attr_str(column))
+            if dataset is None:
+                continue
+            neurodata_type = attr_str(dataset.attrs.get("neurodata_type"))
+            if neurodata_type == "HedTags":
+                return True
+            if neurodata_type == "HedValueVector" and attr_str(dataset.attrs.get("hed")) not in ("", "n/a"):
+                return True
+        meanings_tables = table_group.get("meanings_tables")
+        if not isinstance(meanings_tables, h5py.Group):
+            return False
+        return any(
+            "HED" in [attr_str(name) for name in meanings_table.attrs.get("colnames", [])]
+            for meanings_table in meanings_tables.values()
+            if isinstance(meanings_table, h5py.Group)
+        )
+
+    def _validate_file_tables(
+        self,
+        identifier: str,
+        tables: List[DynamicTable],
+        error_handler: ErrorHandler,
+        options: FileValidationOptions,
+    ) -> List[Dict[str, Any]]:
+        """
+        Validate the tables of a file serially, in threads, or in an executor, with the file's identifier as context.
+
+        Parameters:
+            identifier (str): The identifier of the NWB file, used as the FILE_NAME error context.
+            tables (list of DynamicTable): The tables with HED to validate.
+            error_handler (ErrorHandler): The error handler collecting issues.
+            options (FileValidationOptions): The options of the validation call.
+
+        Returns:
+            List[Dict[str, Any]]: The issues of the tables, in table order.
+        """
+        budget, monitor, chunk_size = options.budget, options.monitor, options.chunk_size
+        error_handler.push_error_context(ErrorContext.FILE_NAME, identifier)
+        try:
+            if options.executor is not None:
+                return self._validate_tables_in_executor(tables, error_handler, options.executor, budget, monitor)
+            if options.workers is not None:
+                with ProcessPoolExecutor(max_workers=options.workers) as pool:
+                    return self._validate_tables_in_executor(tables, error_handler, pool, budget, monitor)
+            if options.threads is not None:
+                return self._validate_tables_in_threads(
+                    tables, error_handler, options.threads, budget, monitor, chunk_size
+                )
+            issues = []
+            for table in tables:
+                if budget.exhausted:
+                    break
+                issues.extend(self._validate_file_table(table, error_handler, budget, monitor, chunk_size))
+            return issues
+        finally:
+            error_handler.pop_error_context()
+
+    def _validate_file_table(
+        self,
+        table: DynamicTable,
+        error_handler: ErrorHandler,
+        budget: "IssueBudget",
+        monitor: "ValidationMonitor",
+        chunk_size: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Validate one table of a file with assembled validation, in row blocks if chunk_size is given."""
+        if chunk_size is None:
+            return self._validate_assembled(table, error_handler, budget, monitor=monitor)
+        return self._validate_assembled_in_blocks(table, error_handler, chunk_size, budget, monitor=monitor)
+
+    def _validate_tables_in_threads(
+        self,
+        tables: List[DynamicTable],
+        error_handler: ErrorHandler,
+        threads: int,
+        budget: "IssueBudget",
+        monitor: "ValidationMonitor",
+        chunk_size: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Validate assembled tables in a thread pool with this validator and merge their issues in table order.
+
+        Each table is validated with a private copy of the error handler (made in this thread, so the threads
+        never share a context stack), its own budget with the call's limits, and its own monitor with the call's
+        cancellation token. The issues are the same as for serial validation, HED tag and string objects
+        included. Tables are read and assembled in their threads; h5py serializes the HDF5 reads.
+        """
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            futures = [
+                pool.submit(
+                    self._validate_file_table,
+                    table,
+                    copy_error_handler(error_handler),
+                    IssueBudget(budget.max_issues, budget.stop_on_first_error),
+                    ValidationMonitor(cancel=monitor.cancel),
+                    chunk_size,
+                )
+                for table in tables
+            ]
+            return self._collect_table_issues(tables, [len(table) for table in tables], futures, budget, monitor)
+
+    async def validate_file_async(
+        self,
+        nwbfile: NWBFile,
+        error_handler: Optional[ErrorHandler] = None,
+        offload_executor: Optional[Executor] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        **kwargs,
+    ) -> List[Dict[str, Any]]:
+        """
+        Asynchronous counterpart of validate_file that does not block the event loop.
+
+        The whole validation, including the HDF5 reads of a file opened with NWBHDF5IO, runs in
+        ``offload_executor`` (the event loop's default thread pool if None), so the loop stays responsive. To
+        spread the CPU-bound parsing of the tables over processes as well, pass ``workers`` or ``executor``
+        (see validate_file). A shared ``semaphore`` limits how many validations run at once, e.g. across the
+        uploads handled by a service; see validate_files_async for validating a batch of files.
+
+        Concurrent validations must not share an ErrorHandler; if error_handler is None each call creates its own.
+
+        Parameters:
+            nwbfile (NWBFile): The NWB file to validate.
+            error_handler (ErrorHandler, optional): An ErrorHandler instance for collecting errors.
+                                                   If None, a new instance will be created.
+            offload_executor (Executor, optional): The executor the validation runs in (a thread pool, since the
+                                                   NWB file is not picklable).
+            semaphore (asyncio.Semaphore, optional): Held while the validation runs, to limit concurrency.
+            **kwargs: Other keyword arguments of validate_file (e.g. workers, executor, max_issues).
+
+        Returns:
+            List[Dict[str, Any]]: The issues returned by validate_file.
+
+        Raises:
+            The exceptions raised by validate_file.
+        """
+        call = functools.partial(self.validate_file, nwbfile, error_handler, **kwargs)
+        return await run_offloaded(call, offload_executor, semaphore)
+
+    async def validate_table_async(
+        self,
+        table: DynamicTable,
+        error_handler: Optional[ErrorHandler] = None,
+        offload_executor: Optional[Executor] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        **kwargs,
+    ) -> List[Dict[str, Any]]:
+        """
+        Asynchronous counterpart of validate_table that does not block the event loop.
+
+        Parameters:
+            table (DynamicTable): The dynamic table to validate.
+            error_handler (ErrorHandler, optional): An ErrorHandler instance for collecting errors.
+                                                   If None, a new instance will be created.
+            offload_executor (Executor, optional): The executor the validation runs in (the event loop's default
+                                                   thread pool if None).
+            semaphore (asyncio.Semaphore, optional): Held while the validation runs, to limit concurrency.
+            **kwargs: Other keyword arguments of validate_table (e.g. chunk_size, rows, columns).
+
+        Returns:
+            List[Dict[str, Any]]: The issues returned by validate_table.
+
+        Raises:
+            The exceptions raised by validate_table.
+        """
+        call = functools.partial(self.validate_table, table, error_handler, **kwargs)
+        return await run_offloaded(call, offload_executor, semaphore)
+
+    async def validate_files_async(
+        self,
+        nwbfiles: Sequence[NWBFile],
+        max_concurrency: int = 4,
+        offload_executor: Optional[Executor] = None,
+        **kwargs,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Validates several NWB files concurrently, with at most ``max_concurrency`` validations running at once.
+
+        Each file is validated with validate_file_async and its own ErrorHandler.
+
+        Parameters:
+            nwbfiles (sequence of NWBFile): The NWB files to validate.
+            max_concurrency (int): The maximum number of files validated at the same time.
+            offload_executor (Executor, optional): The executor the validations run in (the event loop's
+                                                   default thread pool if None).
+            **kwargs: Other keyword arguments of validate_file (e.g. workers, executor, max_issues).
+
+        Returns:
+            List[List[Dict[str, Any]]]: The issues of each file, in the order of ``nwbfiles``.
+
+        Raises:
+            ValueError: If max_concurrency is not positive.
+            The exceptions raised by validate_file (the first one raised is propagated).
+        """
+
+        def validate(nwbfile: NWBFile, semaphore: asyncio.Semaphore):
+            return self.validate_file_async(nwbfile, offload_executor=offload_executor, semaphore=semaphore, **kwargs)
+
+        return await run_with_limit(validate, nwbfiles, max_concurrency)
+
+    def create_worker_pool(self, workers: int) -> ProcessPoolExecutor:
+        """
+        Create a process pool of forked workers that share this validator's HED schema and DefinitionDict.
+
+        Workers started by ``validate_file(workers=...)`` or by a default ProcessPoolExecutor each load their own
+        schema and DefinitionDict (see validate_tabular_in_worker), so every worker holds a full copy. The
+        workers of this pool are instead forked from this process after the validator has been registered as
+        the worker validator for its schema version and definitions, so they inherit the loaded schema and
+        definitions and share their memory pages copy-on-write. The garbage collector is frozen
+        (``gc.freeze()``) while the workers are forked, so collections in the workers do not write to, and so
+        copy, the pages of the inherited objects. Reference-count updates of the objects a worker uses still copy
+        the pages they are on, but the bulk of the schema stays shared.
+
+        Pass the pool as ``executor=`` to validate_file, validate_path, or their async variants, and shut it down
+        (or use it as a context manager) when done. On platforms without the ``fork`` start method, a regular
+        ProcessPoolExecutor is returned and each worker loads its own schema.
+
+        Parameters:
+            workers (int): The number of worker processes.
+
+        Returns:
+            ProcessPoolExecutor: The pool, with all its workers already started.
+
+        Raises:
+            ValueError: If workers is not positive.
+        """
+        return create_worker_pool(type(self), self._schema_version(), self._definitions(), workers)
+
+    def _validate_tables_in_executor(
+        self,
+        tables: List[DynamicTable],
+        error_handler: ErrorHandler,
+        executor: Executor,
+        budget: Optional["IssueBudget"] = None,
+        monitor: Optional["ValidationMonitor"] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Validate assembled tables in an executor and merge their issues in table order.
+
+        Each table is converted with get_hed_tabular() here, and the picklable dataframe + sidecar is sent
+        to validate_tabular_in_worker together with the schema version, the definitions, and the current
+        error context, so that a worker can rebuild an equivalent validator and error handler. Each worker
+        applies the budget's limits to its own table; the results are then taken from the budget in table
+        order, and the remaining tables are cancelled once it is used up. Progress is reported as each
+        table's result is collected; if the cancellation token is set, the remaining tables are cancelled
+        and ValidationCancelledError is raised.
+        """
+        if budget is None:
+            budget = IssueBudget()
+        if monitor is None:
+            monitor = ValidationMonitor()
+        hed_schema_version = self._schema_version()
+        definitions = self._definitions()
+        check_for_warnings = getattr(error_handler, "_check_for_warnings", False)
+        error_context = list(error_handler.error_context)
+        futures = []
+        row_counts = []
+        for table in tables:
+            monitor.check()
+            df, json_data = get_hed_tabular(table)
+            row_counts.append(len(df))
+            futures.append(
+                executor.submit(
+                    validate_tabular_in_worker,
+                    type(self),
+                    hed_schema_version,
+                    definitions,
+                    df,
+                    json_data,
+                    table.name,
+                    error_context,
+                    check_for_warnings,
+                    budget.max_issues,
+                    budget.stop_on_first_error,
+                )
+            )
+        return self._collect_table_issues(tables, row_counts, futures, budget, monitor)
+
+    @staticmethod
+    def _collect_table_issues(
+        tables: List[DynamicTable],
+        row_counts: List[int],
+        futures: list,
+        budget: "IssueBudget",
+        monitor: "ValidationMonitor",
+    ) -> List[Dict[str, Any]]:
+        """
+        Collect the issues of tables validated concurrently, in table order.
+
+        The issues are taken from the budget table by table, and the futures of the remaining tables are
+        cancelled once it is used up. Progress is reported as each table's result is collected; if the
+        cancellation token is set, the remaining futures are cancelled and ValidationCancelledError is raised.
+        """
+        issues = []
+        try:
+            for table, row_count, future in zip(tables, row_counts, futures, strict=True):
+                if budget.exhausted:
+                    future.cancel()
+                    continue
+                monitor.check()
+                issues.extend(budget.take(future.result()))
+                monitor.set_scope(table.name, None)
+                monitor.report(row_count, row_count)
+        except ValidationCancelledError:
+            for future in futures:
+                future.cancel()
+            raise
         return issues
+
+
+class _SidecarIssueMemo:
+    """
+    A bounded, thread-safe memo of the context-free issues of sidecars validated by HedNWBValidator._validate_sidecar.
+
+    The issues of at most ``max_entries`` sidecars are kept; the least recently used are dropped beyond that.
+    Issues are stored as returned by Sidecar.validate() with warnings and without any error context, and must
+    not be modified by callers. HED tag and string objects in the issues reference their whole schema, so they
+    are stored as strings: the memo never keeps a schema alive. See clear_sidecar_memo.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._issues = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._issues)
+
+    def get(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        """Return the issues memoized for a sidecar key, or None if the sidecar has not been validated."""
+        with self._lock:
+            issues = self._issues.get(key)
+            if issues is not None:
+                self._issues.move_to_end(key)
+            return issues
+
+    def put(self, key: str, issues: List[Dict[str, Any]]):
+        """Memoize the issues of a sidecar, dropping the least recently used entries beyond max_entries."""
+        issues = [
+            {key: str(value) if isinstance(value, (HedTag, HedGroup)) else value for key, value in issue.items()}
+            for issue in issues
+        ]
+        with self._lock:
+            self._issues[key] = issues
+            self._issues.move_to_end(key)
+            while len(self._issues) > self.max_entries:
+                self._issues.popitem(last=False)
+
+    def clear(self):
+        """Drop all the memoized sidecars."""
+        with self._lock:
+            self._issues.clear()
+
+
+# The sidecar issues memoized by all the validators of this process (forked workers inherit a copy).
+_sidecar_memo = _SidecarIssueMemo()
+
+
+def clear_sidecar_memo():
+    """
+    Drop all the sidecar issues memoized by the validators of this process (see HedNWBValidator._validate_sidecar).
+
+    The memo is bounded, so clearing it is not needed for correctness; it frees the memory it holds, e.g. at the
+    end of a batch.
+    """
+    _sidecar_memo.clear()
@@ -0,0 +1,257 @@
+"""
+IssueTable class for storing and summarizing large numbers of HED validation issues in columnar form.
+"""
+
+from array import array
+from typing import List, Dict, Any, Iterable, Iterator, Optional
+import numpy as np
+import pandas as pd
+from hed.errors import ErrorContext, ErrorSeverity
+
+
+class IssueTable:
+    """
+    A compact, columnar store of HED validation issues.
+
+    Validation methods return issues as a list of dicts, one per issue, which is convenient but costly for badly
+    annotated tables with millions of rows. An IssueTable keeps only the fields needed to report an issue -- code,
+    severity, table, column, row, and message -- as parallel integer arrays, with each distinct string (code,
+    table, column, message) stored once. Issues are added with extend(), so a large table can be validated in row
+    blocks (e.g. ``validate_table(table, rows=slice(start, stop))``) and each block's issues appended and dropped.
+
+    The aggregation helpers collapse identical issues (same code, severity, table, column, and message) into
+    row ranges with counts, which makes large failure reports cheap to build and display.
+
+    Other issue fields (e.g. ``source_tag`` or the HED string context) are not kept.
+    """
+
+    # Value stored in the row column for issues without a row context.
+    NO_ROW = -1
+
+    def __init__(self, issues: Optional[Iterable[Dict[str, Any]]] = None):
+        """
+        Create an issue table, optionally holding the given issues.
+
+        Parameters:
+            issues (iterable of dict, optional): Issues as returned by HedNWBValidator methods.
+        """
+        self._strings = []
+        self._string_ids = {}
+        self._codes = array("l")
+        self._severities = array("l")
+        self._tables = array("l")
+        self._columns = array("l")
+        self._rows = array("q")
+        self._messages = array("l")
+        if issues is not None:
+            self.extend(issues)
+
+    def __len__(self):
+        return len(self._codes)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return self.iter_issues()
+
+    def extend(self, issues: Iterable[Dict[str, Any]]):
+        """
+        Append issues to the table.
+
+        The table name is taken from the issue's ``ec_filename`` context (the context HedNWBValidator uses for
+        tables), the column from ``ec_column``, and the row from ``ec_row``.
+
+        Parameters:
+            issues (iterable of dict): Issues as returned by HedNWBValidator methods.
+        """
+        intern = self._intern
+        for issue in issues:
+            self._codes.append(intern(issue.get("code")))
+            self._severities.append(int(issue.get("severity", ErrorSeverity.ERROR)))
+            self._tables.append(intern(issue.get(ErrorContext.FILE_NAME)))
+            self._columns.append(intern(issue.get(ErrorContext.COLUMN)))
+            row = issue.get(ErrorContext.ROW)
+            self._rows.append(self.NO_ROW if row is None else int(row))
+            self._messages.append(intern(issue.get("message")))
+
+    @property
+    def codes(self) -> np.ndarray:
+        """The code of each issue (an object array of interned strings)."""
+        return self._lookup(self._codes)
+
+    @property
+    def severities(self) -> np.ndarray:
+        """The severity of each issue (an integer array of ErrorSeverity values)."""
+        return self._ids(self._severities)
+
+    @property
+    def tables(self) -> np.ndarray:
+        """The table of each issue (an object array; None if the issue has no table context)."""
+        return self._lookup(self._tables)
+
+    @property
+    def columns(self) -> np.ndarray:
+        """The column of each issue (an object array; None if the issue has no column context)."""
+        return self._lookup(self._columns)
+
+    @property
+    def rows(self) -> np.ndarray:
+        """The row of each issue (an integer array; NO_ROW if the issue has no row context)."""
+        return self._ids(self._rows)
+
+    @property
+    def messages(self) -> np.ndarray:
+        """The message of each issue (an object array of interned strings)."""
+        return self._lookup(self._messages)
+
+    @property
+    def has_errors(self) -> bool:
+        """True if any issue has error severity."""
+        return bool(np.any(self.severities < ErrorSeverity.WARNING))
+
+    def iter_issues(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the issues as dicts in the form returned by HedNWBValidator methods.
+
+        Only the fields kept by the table are included; context keys are omitted when the issue had none.
+
+        Yields:
+            dict: The code, severity, message, and table/column/row context of each issue.
+        """
+        strings = self._strings
+        for code, severity, table, column, row, message in zip(
+            self._codes, self._severities, self._tables, self._columns, self._rows, self._messages, strict=True
+        ):
+            issue = {"code": strings[code], "message": strings[message], "severity": ErrorSeverity(severity)}
+            if strings[table] is not None:
+                issue[ErrorContext.FILE_NAME] = strings[table]
+            if strings[column] is not None:
+                issue[ErrorContext.COLUMN] = strings[column]
+            if row != self.NO_ROW:
+                issue[ErrorContext.ROW] = row
+            yield issue
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Return the issues as a DataFrame with one row per issue.
+
+        The string columns are categoricals (missing table or column context is NaN), so the DataFrame stays
+        compact.
+
+        Returns:
+            pd.DataFrame: Columns code, severity, table, column, row (NO_ROW if none), and message.
+        """
+        data = {
+            "code": self._categorical(self._codes),
+            "severity": self.severities,
+            "table": self._categorical(self._tables),
+            "column": self._categorical(self._columns),
+            "row": self.rows,
+            "message": self._categorical(self._messages),
+        }
+        return pd.DataFrame(data, columns=["code", "severity", "table", "column", "row", "message"])
+
+    def count_by_code(self) -> Dict[str, int]:
+        """
+        Return the number of issues with each code.
+
+        Returns:
+            dict: Issue counts keyed by code, in decreasing order of count.
+        """
+        counts = np.bincount(self._ids(self._codes), minlength=len(self._strings))
+        order = np.argsort(-counts, kind="stable")
+        return {self._strings[index]: int(counts[index]) for index in order if counts[index] > 0}
+
+    def aggregate(self) -> List[Dict[str, Any]]:
+        """
+        Collapse identical issues into one entry per (code, severity, table, column, message).
+
+        Returns:
+            list of dict: One entry per group of identical issues, in the order each group first appears, with the
+                          keys code, severity, table, column, message, count, and row_ranges. row_ranges is a list
+                          of (first, last) inclusive row ranges covering the rows of the group (empty if the issues
+                          have no row context).
+        """
+        if len(self) == 0:
+            return []
+        keys = np.stack([
+            self._ids(ids) for ids in (self._codes, self._severities, self._tables, self._columns, self._messages)
+        ])
+        unique_keys, first_index, group_of = np.unique(keys, axis=1, return_index=True, return_inverse=True)
+        group_of = group_of.reshape(-1)
+        rows = self.rows
+        # Sort the issues by group; the groups are numbered 0..n-1, so the runs come out in group order.
+        order = np.argsort(group_of, kind="stable")
+        members_of = np.split(order, np.flatnonzero(np.diff(group_of[order])) + 1)
+        entries = []
+        for group in np.argsort(first_index, kind="stable").tolist():
+            code, severity, table, column, message = unique_keys[:, group].tolist()
+            members = members_of[group]
+            entries.append({
+                "code": self._strings[code],
+                "severity": ErrorSeverity(severity),
+                "table": self._strings[table],
+                "column": self._strings[column],
+                "message": self._strings[message],
+                "count": len(members),
+                "row_ranges": self._row_ranges(rows[members]),
+            })
+        return entries
+
+    def get_printable_string(self, max_ranges: int = 10) -> str:
+        """
+        Return a compact, human-readable report of the issues: counts per code, then one line per group of
+        identical issues (see aggregate) instead of one line per issue.
+
+        Parameters:
+            max_ranges (int): The maximum number of row ranges listed for a group before the rest are elided.
+
+        Returns:
+            str: The report (empty if there are no issues).
+        """
+        if len(self) == 0:
+            return ""
+        lines = [f"{len(self)} issues: " + ", ".join(f"{code} {count}" for code, count in self.count_by_code().items())]
+        for entry in self.aggregate():
+            location = "/".join(name for name in (entry["table"], entry["column"]) if name is not None)
+            ranges = [str(first) if first == last else f"{first}-{last}" for first, last in entry["row_ranges"]]
+            if len(ranges) > max_ranges:
+                ranges = ranges[:max_ranges] + [f"... ({len(ranges) - max_ranges} more)"]
+            rows = f" rows {', '.join(ranges)}" if ranges else ""
+            lines.append(f"{entry['code']} [{location}]{rows} ({entry['count']}x): {entry['message']}")
+        return "\n".join(lines)
+
+    def _intern(self, value: Optional[str]) -> int:
+        """Return the id of a string (or None) in the table's string pool, adding it if it is new."""
+        string_id = self._string_ids.get(value)
+        if string_id is None:
+            string_id = len(self._strings)
+            self._string_ids[value] = string_id
+            self._strings.append(value)
+        return string_id
+
+    def _lookup(self, ids: array) -> np.ndarray:
+        """Return the strings for an array of string ids as an object array."""
+        return np.array(self._strings, dtype=object)[self._ids(ids)]
+
+    def _categorical(self, ids: array) -> pd.Categorical:
+        """Return a string column as a pandas Categorical over the string pool (None becomes NaN)."""
+        is_none = np.array([string is None for string in self._strings], dtype=bool)
+        category_codes = np.cumsum(~is_none) - 1
+        category_codes[is_none] = -1
+        categories = [string for string in self._strings if string is not None]
+        return pd.Categorical.from_codes(category_codes[self._ids(ids)], categories=categories)
+
+    @staticmethod
+    def _ids(ids: array) -> np.ndarray:
+        """Return a copy of an integer column as a NumPy array (a view would stop the column from growing)."""
+        return np.array(ids, dtype=np.int64)
+
+    @classmethod
+    def _row_ranges(cls, rows: np.ndarray) -> List[tuple]:
+        """Return the (first, last) inclusive ranges of consecutive rows in a row array (NO_ROW is ignored)."""
+        rows = np.unique(rows[rows != cls.NO_ROW])
+        if len(rows) == 0:
+            return []
+        breaks = np.flatnonzero(np.diff(rows) != 1) + 1
+        starts = np.concatenate(([rows[0]], rows[breaks]))
+        ends = np.concatenate((rows[breaks - 1], [rows[-1]]))
+        return list(zip(starts.tolist(), ends.tolist(), strict=True))
@@ -0,0 +1,348 @@
+"""
+HedSchemaCache class for sharing loaded HED schemas between all the HedLabMetaData objects of a process,
+and functions for saving loaded schemas as binary snapshots that load quickly.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import re
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import List, Iterable, Optional, Sequence, Union
+from hed import __version__ as hedtools_version
+from hed.errors import HedExceptions, HedFileError
+from hed.schema import HedSchema, HedSchemaGroup, load_schema_version
+
+# Identifies a snapshot file; followed by a one-line JSON header and the pickled schema.
+SNAPSHOT_MAGIC = b"NDX-HED-SCHEMA-SNAPSHOT\n"
+
+# Incremented when the layout of snapshot files changes; snapshots with another format are not loaded.
+SNAPSHOT_FORMAT = 1
+
+SNAPSHOT_EXTENSION = ".hedsnap"
+
+
+class HedSchemaCache:
+    """
+    A process-wide, thread-safe cache of loaded HED schemas, keyed by normalized schema version.
+
+    HedLabMetaData loads its schema through the shared cache (see get_schema_cache), and NWBHDF5IO.read()
+    constructs a HedLabMetaData for every file read, so a batch over many files loads each schema version once
+    per process instead of once per file. Versions are normalized before lookup: a schema group given as a list
+    of versions or as its JSON string (e.g. ``'["8.4.0","bc:score_2.1.0"]'``) is the same entry however it is
+    written, and a group of one version is that version.
+
+    The cache holds at most ``max_entries`` schemas (or schema groups); when it grows past that, the least
+    recently used are dropped. This bounds the index of this cache only: schemas are loaded with hedtools'
+    load_schema_version, whose own in-memory cache keeps the schemas it loaded, so a schema dropped here may
+    stay in memory. A version being loaded by one thread is waited for, not loaded again, by the others. Cached
+    schemas are shared by every user and must not be modified.
+
+    With a ``snapshot_dir``, a version not in memory is first looked for as a binary snapshot in that
+    directory (see save_schema_snapshot), which loads much faster than parsing the schema. Snapshots made by
+    another hedtools version, or that fail their integrity check, are ignored. Only with ``save_snapshots=True``
+    is a version loaded by parsing saved there as a snapshot for the next process (replacing an ignored one);
+    nothing is written otherwise. Snapshots are pickles and loading one can run arbitrary code, so the directory
+    must be trusted: e.g. a cache directory only this user can write to, or snapshots shipped with an
+    installation in a directory users cannot write to. Never use a shared or world-writable directory.
+    """
+
+    def __init__(self, max_entries: int = 16, snapshot_dir: Optional[str] = None, save_snapshots: bool = False):
+        """
+        Create an empty schema cache.
+
+        Parameters:
+            max_entries (int): The maximum number of schemas (or schema groups) kept in the cache.
+            snapshot_dir (str, optional): A trusted directory of binary schema snapshots to load from.
+            save_snapshots (bool): Also save the schemas parsed by this cache as snapshots in snapshot_dir.
+
+        Raises:
+            ValueError: If max_entries is not positive.
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be positive, but {max_entries} was given.")
+        self.max_entries = max_entries
+        self.snapshot_dir = snapshot_dir
+        self.save_snapshots = save_snapshots
+        self._schemas = OrderedDict()
+        self._lock = threading.Lock()
+        self._loading = {}
+
+    def __len__(self):
+        return len(self._schemas)
+
+    def __contains__(self, hed_schema_version) -> bool:
+        return _schema_version_key(hed_schema_version) in self._schemas
+
+    @property
+    def versions(self) -> List[str]:
+        """The versions of the cached schemas, least recently used first (schema groups as JSON lists)."""
+        with self._lock:
+            return [_schema_version_string(key) for key in self._schemas]
+
+    def get(self, hed_schema_version: Union[str, Sequence[str]]) -> Union[HedSchema, HedSchemaGroup]:
+        """
+        Return the schema for a HED schema version, loading it if it is not in the cache.
+
+        Parameters:
+            hed_schema_version (str or sequence of str): The HED schema version, e.g. ``"8.4.0"``, or the versions
+                                                          of a schema group, as a list or its JSON string.
+
+        Returns:
+            HedSchema or HedSchemaGroup: The loaded schema.
+
+        Raises:
+            HedFileError: If the schema version cannot be loaded (as raised by load_schema_version).
+        """
+        key = _schema_version_key(hed_schema_version)
+        with self._lock:
+            schema = self._schemas.get(key)
+            if schema is not None:
+                self._schemas.move_to_end(key)
+                return schema
+            key_lock = self._loading.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                schema = self._schemas.get(key)
+            if schema is None:
+                try:
+                    schema = self._load(key)
+                    self._put(key, schema)
+                finally:
+                    with self._lock:
+                        self._loading.pop(key, None)
+        return schema
+
+    def preload(
+        self, hed_schema_versions: Iterable[Union[str, Sequence[str]]]
+    ) -> List[Union[HedSchema, HedSchemaGroup]]:
+        """
+        Load schema versions into the cache ahead of use (e.g. before forking worker processes).
+
+        Parameters:
+            hed_schema_versions (iterable): The HED schema versions (see get).
+
+        Returns:
+            list: The loaded schemas, in the order of ``hed_schema_versions``.
+
+        Raises:
+            HedFileError: If a schema version cannot be loaded.
+        """
+        return [self.get(version) for version in hed_schema_versions]
+
+    def clear(self, hed_schema_version: Optional[Union[str, Sequence[str]]] = None):
+        """
+        Drop one schema version, or all the schemas, from the cache.
+
+        Schemas already handed out (e.g. to HedLabMetaData objects) are not affected, and the in-memory schema
+        cache of hedtools is left as it is, so the next get() of a dropped version may return the same object.
+
+        Parameters:
+            hed_schema_version (str or sequence of str, optional): The version to drop (all versions if None).
+        """
+        with self._lock:
+            if hed_schema_version is not None:
+                self._schemas.pop(_schema_version_key(hed_schema_version), None)
+            else:
+                self._schemas.clear()
+
+    def _load(self, key: tuple) -> Union[HedSchema, HedSchemaGroup]:
+        """Load a schema version from its snapshot if there is a valid one, or else with load_schema_version."""
+        snapshot_dir = self.snapshot_dir
+        if snapshot_dir is None:
+            return load_schema_version(list(key) if len(key) > 1 else key[0])
+        path = get_snapshot_path(snapshot_dir, key)
+        try:
+            return load_schema_snapshot(path, key)
+        except HedFileError:
+            pass
+        schema = load_schema_version(list(key) if len(key) > 1 else key[0])
+        if self.save_snapshots:
+            try:
+                save_schema_snapshot(schema, path, key)
+            except OSError:
+                pass  # A read-only snapshot directory is only used for loading.
+        return schema
+
+    def _put(self, key: tuple, schema: Union[HedSchema, HedSchemaGroup]):
+        """Add a loaded schema, dropping the least recently used schemas beyond max_entries."""
+        with self._lock:
+            self._schemas[key] = schema
+            self._schemas.move_to_end(key)
+            while len(self._schemas) > self.max_entries:
+                self._schemas.popitem(last=False)
+
+
+# The schema cache shared by all the HedLabMetaData objects of this process.
+_schema_cache = HedSchemaCache()
+
+
+def get_schema_cache() -> HedSchemaCache:
+    """
+    Return the process-wide HedSchemaCache used by HedLabMetaData.
+
+    Returns:
+        HedSchemaCache: The shared schema cache (its ``max_entries`` can be changed, e.g. for many library schemas).
+    """
+    return _schema_cache
+
+
+def save_schema_snapshot(
+    hed_schema: Union[HedSchema, HedSchemaGroup], path: str, hed_schema_version: Union[str, Sequence[str], None] = None
+):
+    """
+    Save a loaded HED schema or schema group as a binary snapshot.
+
+    Loading a snapshot with load_schema_snapshot skips parsing the schema XML (and merging library schemas), which
+    is most of the cost of load_schema_version. The snapshot records the schema version, the hedtools version
+    that built it, and a SHA-256 digest of its contents. The digest is stored in the same file, so it detects a
+    corrupt or truncated snapshot but not a deliberately modified one. The file is written to a temporary file
+    first and then renamed, so a concurrent reader never sees a partial snapshot. Save snapshots only to a
+    directory that untrusted users cannot write to (see load_schema_snapshot).
+
+    Parameters:
+        hed_schema (HedSchema or HedSchemaGroup): The loaded schema.
+        path (str): The path of the snapshot file.
+        hed_schema_version (str or sequence of str, optional): The version the schema was loaded as (the schema's
+                                                               own formatted version if None).
+
+    Raises:
+        ValueError: If hed_schema is not a HedSchema or HedSchemaGroup.
+    """
+    if not isinstance(hed_schema, (HedSchema, HedSchemaGroup)):
+        raise ValueError("hed_schema must be a HedSchema or HedSchemaGroup.")
+    if hed_schema_version is None:
+        hed_schema_version = hed_schema.get_formatted_version()
+    payload = pickle.dumps(hed_schema, protocol=pickle.HIGHEST_PROTOCOL)
+    header = {
+        "format": SNAPSHOT_FORMAT,
+        "hedtools_version": hedtools_version,
+        "hed_schema_version": _schema_version_string(_schema_version_key(hed_schema_version)),
+        "sha256": hashlib.sha256(payload).hexdigest(),
+    }
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(SNAPSHOT_MAGIC)
+            file.write(json.dumps(header).encode("utf-8") + b"\n")
+            file.write(payload)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
+def load_schema_snapshot(
+    path: str, hed_schema_version: Union[str, Sequence[str], None] = None
+) -> Union[HedSchema, HedSchemaGroup]:
+    """
+    Load a HED schema or schema group from a snapshot saved by save_schema_snapshot.
+
+    The snapshot is only unpickled after its format, hedtools version, schema version, and SHA-256 digest have
+    been checked. These checks catch stale and corrupt snapshots, not tampering: the digest is stored in the
+    snapshot itself, so whoever can write the file can also update the digest. Like any pickle, a snapshot can
+    run arbitrary code when loaded, so only load snapshots from a trusted location that untrusted users cannot
+    write to (e.g. a cache directory private to this user, or snapshots shipped with an installation), never from
+    a shared or world-writable directory or a downloaded file.
+
+    Parameters:
+        path (str): The path of the snapshot file.
+        hed_schema_version (str or sequence of str, optional): The version the snapshot must hold (not checked if None).
+
+    Returns:
+        HedSchema or HedSchemaGroup: The schema.
+
+    Raises:
+        HedFileError: If the file does not exist, is not a snapshot, is corrupt, or was made for another hedtools
+                      version, snapshot format, or schema version.
+    """
+    try:
+        with open(path, "rb") as file:
+            magic = file.read(len(SNAPSHOT_MAGIC))
+            header_line = file.readline()
+            payload = file.read()
+    except OSError as e:
+        raise HedFileError(HedExceptions.FILE_NOT_FOUND, f"Cannot read schema snapshot: {e}", path) from e
+    if magic != SNAPSHOT_MAGIC:
+        raise HedFileError(HedExceptions.INVALID_FILE_FORMAT, "The file is not a HED schema snapshot.", path)
+    try:
+        header = json.loads(header_line)
+    except ValueError as e:
+        raise HedFileError(HedExceptions.INVALID_FILE_FORMAT, f"The snapshot header is invalid: {e}", path) from e
+    if not isinstance(header, dict):
+        raise HedFileError(HedExceptions.INVALID_FILE_FORMAT, "The snapshot header is invalid.", path)
+    if header.get("format") != SNAPSHOT_FORMAT or header.get("hedtools_version") != hedtools_version:
+        raise HedFileError(
+            HedExceptions.SCHEMA_LOAD_FAILED,
+            f"The snapshot was made with format {header.get('format')} by hedtools {header.get('hedtools_version')}, "
+            f"not format {SNAPSHOT_FORMAT} by hedtools {hedtools_version}.",
+            path,
+        )
+    if hed_schema_version is not None and _schema_version_key(header.get("hed_schema_version", "")) != (
+        _schema_version_key(hed_schema_version)
+    ):
+        raise HedFileError(
+            HedExceptions.SCHEMA_VERSION_INVALID,
+            f"The snapshot holds HED schema {header.get('hed_schema_version')}, not {hed_schema_version}.",
+            path,
+        )
+    if hashlib.sha256(payload).hexdigest() != header.get("sha256"):
+        raise HedFileError(HedExceptions.INVALID_FILE_FORMAT, "The snapshot contents do not match its digest.", path)
+    try:
+        hed_schema = pickle.loads(payload)
+    except Exception as e:
+        raise HedFileError(HedExceptions.SCHEMA_LOAD_FAILED, f"The snapshot cannot be loaded: {e}", path) from e
+    if not isinstance(hed_schema, (HedSchema, HedSchemaGroup)):
+        raise HedFileError(HedExceptions.INVALID_FILE_FORMAT, "The snapshot does not hold a HED schema.", path)
+    return hed_schema
+
+
+def get_snapshot_path(snapshot_dir: str, hed_schema_version: Union[str, Sequence[str]]) -> str:
+    """
+    Return the path of the snapshot of a HED schema version in a snapshot directory.
+
+    Versions written in different ways (see HedSchemaCache) have the same path.
+
+    Parameters:
+        snapshot_dir (str): The snapshot directory.
+        hed_schema_version (str or sequence of str): The HED schema version.
+
+    Returns:
+        str: The path of the snapshot file.
+    """
+    version_key = _schema_version_key(hed_schema_version)
+    name = re.sub(r"[^0-9A-Za-z._-]+", "-", "+".join(version_key))
+    return os.path.join(snapshot_dir, f"hed_{name}{SNAPSHOT_EXTENSION}")
+
+
+def _schema_version_key(hed_schema_version: Union[str, Sequence[str]]) -> tuple:
+    """
+    Return a HED schema version as a tuple of versions, for comparing versions written in different ways.
+
+    A schema group is given as a list of versions or as its JSON form (e.g. ``'["8.4.0","bc:score_2.1.0"]'``),
+    and a single version may also be in JSON form (``'"8.4.0"'``, as from HedSchema.get_formatted_version).
+    """
+    if isinstance(hed_schema_version, str):
+        stripped = hed_schema_version.strip()
+        if not stripped.startswith(("[", '"')):
+            return (stripped,)
+        try:
+            hed_schema_version = json.loads(stripped)
+        except json.JSONDecodeError:
+            return (stripped,)
+        if isinstance(hed_schema_version, str):
+            return (hed_schema_version.strip(),)
+    return tuple(str(version).strip() for version in hed_schema_version)
+
+
+def _schema_version_string(version_key: tuple) -> str:
+    """Return the HedLabMetaData version string of a version key: the version, or the JSON list of a group."""
+    if len(version_key) == 1:
+        return version_key[0]
+    return json.dumps(list(version_key), separators=(",", ":"))
@@ -0,0 +1,231 @@
+"""
+SpreadsheetValidator subclasses for the assembled validation of NWB tables (see HedNWBValidator).
+"""
+
+import inspect
+from typing import List, Dict, Any, Optional
+from hed.errors import ErrorHandler, ErrorContext
+from hed.errors.error_types import ValidationErrors
+from hed.models import DefinitionDict, HedGroup, HedString, HedTag
+from hed.models.column_mapper import ColumnType
+from hed.validator import HedValidator
+from hed.validator.onset_validator import OnsetValidator
+from hed.validator.spreadsheet_validator import SpreadsheetValidator
+from .validation_cache import ValidationCache, definitions_hash
+
+
+class CachedCellChecks:
+    """
+    Stands in for the HedValidator of a CachedSpreadsheetValidator, taking the basic checks of cells from a cache.
+
+    Only run_basic_checks() is replaced; every other attribute is the wrapped HedValidator's. The issues of each
+    distinct cell are looked up once per table (and validated and stored on a cache miss). The cache stores HED
+    objects as strings, so the position of each issue's ``source_tag`` among the tags (or groups) of the cell is
+    stored with it, and the tag of the cell being validated is put back on every call. SpreadsheetValidator then
+    adds the error context and the character span of the tag to the copies returned, as for uncached issues.
+    """
+
+    # The issue key holding the position of the source tag (``"tag:<index>"`` or ``"group:<index>"``) in the cache.
+    SOURCE_INDEX_KEY = "source_tag_index"
+
+    def __init__(self, hed_validator: HedValidator, cache: ValidationCache, cache_key: tuple):
+        self._hed_validator = hed_validator
+        self._cache = cache
+        self._cache_key = cache_key
+        self._seen = {}
+
+    def __getattr__(self, name):
+        return getattr(self._hed_validator, name)
+
+    def run_basic_checks(self, hed_string: HedString, allow_placeholders: bool) -> List[Dict[str, Any]]:
+        """Return the issues of HedValidator.run_basic_checks() for a cell, from the cache if it is there."""
+        key = (hed_string.get_original_hed_string(), allow_placeholders)
+        issues = self._seen.get(key)
+        if issues is None:
+            issues = self._cache.get(*self._cache_key, allow_placeholders, key[0])
+            if issues is None:
+                issues = self._hed_validator.run_basic_checks(hed_string, allow_placeholders)
+                issues = self._cache.put(
+                    *self._cache_key, allow_placeholders, key[0], self._locate_source_tags(issues, hed_string)
+                )
+            self._seen[key] = issues
+        return self._restore_source_tags(issues, hed_string)
+
+    @classmethod
+    def _locate_source_tags(cls, issues: List[Dict[str, Any]], hed_string: HedString) -> List[Dict[str, Any]]:
+        """Return copies of issues with the position of their HED tag or group source in the cell added."""
+        located = []
+        for issue in issues:
+            source = issue.get("source_tag")
+            if isinstance(source, (HedTag, HedGroup)):
+                kind, items = (
+                    ("tag", hed_string.get_all_tags())
+                    if isinstance(source, HedTag)
+                    else (
+                        "group",
+                        hed_string.get_all_groups(),
+                    )
+                )
+                index = next((index for index, item in enumerate(items) if item is source), None)
+                if index is not None:
+                    issue = {**issue, cls.SOURCE_INDEX_KEY: f"{kind}:{index}"}
+            located.append(issue)
+        return located
+
+    @classmethod
+    def _restore_source_tags(cls, issues: List[Dict[str, Any]], hed_string: HedString) -> List[Dict[str, Any]]:
+        """Return copies of cached issues with their source put back as the tag or group of the cell."""
+        restored = []
+        for issue in issues:
+            issue = dict(issue)
+            location = issue.pop(cls.SOURCE_INDEX_KEY, None)
+            if location is not None:
+                kind, index = location.split(":")
+                items = hed_string.get_all_tags() if kind == "tag" else hed_string.get_all_groups()
+                issue["source_tag"] = items[int(index)]
+            restored.append(issue)
+        return restored
+
+
+class CachedSpreadsheetValidator(SpreadsheetValidator):
+    """
+    A SpreadsheetValidator that takes the checks of each cell of an assembled table from a ValidationCache.
+
+    SpreadsheetValidator.validate() parses every HED cell of every row and runs HedValidator.run_basic_checks() on
+    it. Those issues depend only on the cell, the schema, and the definitions (of the validator and of the table's
+    sidecar), so with a cache they are read from it (see CachedCellChecks). They are keyed by the schema version
+    and a hash of the definitions marked with CELL_CHECKS_SUFFIX, which keeps them apart from the whole-string
+    results stored by HedNWBValidator._validate_rows. The row checks (assembled string and temporal checks) always
+    run. Without a cache this is a plain SpreadsheetValidator.
+
+    This relies on private SpreadsheetValidator internals, listed in REQUIRED_INTERNALS. If the installed hedtools
+    does not have them (see supported()), the cache is not used and this is a plain SpreadsheetValidator.
+    """
+
+    CELL_CHECKS_SUFFIX = ":cell"
+
+    # The private hedtools internals relied on: (class, function, its parameters, the names it must refer to).
+    REQUIRED_INTERNALS = (
+        (SpreadsheetValidator, "validate", ("self", "data", "def_dicts", "name", "error_handler"), ("_run_checks",)),
+        (
+            SpreadsheetValidator,
+            "_run_checks",
+            ("self", "hed_df", "error_handler", "row_adj", "onset_mask"),
+            ("_hed_validator", "run_basic_checks", "add_context_and_filter"),
+        ),
+    )
+
+    @classmethod
+    def supported(cls) -> bool:
+        """Return True if the installed hedtools has all the internals in REQUIRED_INTERNALS (None: any parameters)."""
+        for owner, name, parameters, names in cls.REQUIRED_INTERNALS:
+            function = getattr(owner, name, None)
+            if not inspect.isfunction(function):
+                return False
+            if parameters is not None and tuple(inspect.signature(function).parameters) != parameters:
+                return False
+            if not set(names) <= set(function.__code__.co_names):
+                return False
+        return True
+
+    def __init__(self, hed_schema, cache: Optional[ValidationCache] = None, schema_version: Optional[str] = None):
+        super().__init__(hed_schema)
+        self._cache = cache
+        self._schema_version = schema_version
+        self._cache_key = None
+
+    def validate(self, data, def_dicts=None, name=None, error_handler=None) -> List[Dict[str, Any]]:
+        self._cache_key = None
+        if self._cache is None or not isinstance(def_dicts, DefinitionDict) or not self.supported():
+            return super().validate(data, def_dicts, name, error_handler)
+        self._cache_key = (self._schema_version, definitions_hash(def_dicts) + self.CELL_CHECKS_SUFFIX)
+        try:
+            return super().validate(data, def_dicts, name, error_handler)
+        finally:
+            self._cache.commit()
+
+    def _run_checks(self, *args, **kwargs):
+        if self._cache_key is None:
+            return super()._run_checks(*args, **kwargs)
+        hed_validator = self._hed_validator
+        self._hed_validator = CachedCellChecks(hed_validator, self._cache, self._cache_key)
+        try:
+            return super()._run_checks(*args, **kwargs)
+        finally:
+            self._hed_validator = hed_validator
+
+
+class BlockSpreadsheetValidator(CachedSpreadsheetValidator):
+    """
+    A SpreadsheetValidator for the consecutive row blocks of one table (see _validate_assembled_in_blocks).
+
+    SpreadsheetValidator.validate() starts each call with a new OnsetValidator, so each block would be validated
+    as a timeline of its own. This validator keeps the definitions opened by Onset or Inset tags and not yet
+    closed by Offset tags across blocks, so an Offset in a later block closes an Onset in an earlier one. The
+    column-structure checks are also done for the table as a whole: the checks of SpreadsheetValidator are run on
+    the first block only, without their categorical-value issues, and the categorical values missing from the
+    sidecar are collected over all blocks and reported once by deferred_issues(), as for the whole table.
+
+    The temporal and column-structure overrides rely on more private hedtools internals than
+    CachedSpreadsheetValidator; when supported() is False, tables must be validated as a whole instead.
+    """
+
+    REQUIRED_INTERNALS = CachedSpreadsheetValidator.REQUIRED_INTERNALS + (
+        (
+            SpreadsheetValidator,
+            "validate",
+            ("self", "data", "def_dicts", "name", "error_handler"),
+            ("_onset_validator", "_validate_column_structure", "_run_onset_checks"),
+        ),
+        (SpreadsheetValidator, "_run_onset_checks", ("self", "onset_filtered", "error_handler", "row_adj"), ()),
+        (SpreadsheetValidator, "_validate_column_structure", ("self", "base_input", "error_handler"), ()),
+        (OnsetValidator, "__init__", ("self",), ("_onsets",)),
+        (OnsetValidator, "_handle_onset_or_offset", None, ("_onsets",)),
+    )
+
+    def __init__(self, hed_schema, cache: Optional[ValidationCache] = None, schema_version: Optional[str] = None):
+        super().__init__(hed_schema, cache, schema_version)
+        self._open_onsets = {}
+        self._first_block = True
+        self._invalid_categorical = {}
+
+    def _run_onset_checks(self, onset_filtered, error_handler, row_adj):
+        self._onset_validator._onsets = self._open_onsets
+        return super()._run_onset_checks(onset_filtered, error_handler, row_adj)
+
+    def _validate_column_structure(self, base_input, error_handler):
+        issues = []
+        if self._first_block:
+            issues = [
+                issue
+                for issue in super()._validate_column_structure(base_input, error_handler)
+                if issue["code"] != ValidationErrors.SIDECAR_KEY_MISSING
+            ]
+            self._first_block = False
+        for column in base_input.column_metadata().values():
+            if column.column_type != ColumnType.Categorical:
+                continue
+            valid_keys, invalid_values = self._invalid_categorical.setdefault(
+                column.column_name, (set(column.hed_dict.keys()), set())
+            )
+            column_values = base_input.dataframe[column.column_name]
+            invalid_values.update(column_values[(column_values != "n/a") & (~column_values.isin(valid_keys))])
+        return issues
+
+    def deferred_issues(self, error_handler: ErrorHandler, name: str) -> List[Dict[str, Any]]:
+        """Return the SIDECAR_KEY_MISSING issues for the categorical values of all the blocks validated."""
+        issues = []
+        error_handler.push_error_context(ErrorContext.FILE_NAME, name)
+        for column_name, (valid_keys, invalid_values) in self._invalid_categorical.items():
+            if not invalid_values:
+                continue
+            error_handler.push_error_context(ErrorContext.COLUMN, column_name)
+            issues += error_handler.format_error_with_context(
+                ValidationErrors.SIDECAR_KEY_MISSING,
+                invalid_keys=str(list(invalid_values)),
+                category_keys=list(valid_keys),
+                column_name=column_name,
+            )
+            error_handler.pop_error_context()
+        error_handler.pop_error_context()
+        return issues
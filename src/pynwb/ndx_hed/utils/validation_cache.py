@@ -0,0 +1,193 @@
+"""
+ValidationCache class for persisting HED string validation results across runs.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from typing import List, Dict, Any, Optional
+from hed import __version__ as hedtools_version
+from hed.errors import ErrorSeverity
+from hed.models import DefinitionDict
+
+
+class ValidationCache:
+    """
+    A persistent (SQLite) cache of HED string validation issues.
+
+    Entries are keyed by (schema version, hash of the DefinitionDict, allow_placeholders, HED string) and hold the
+    issues found when the string was validated on its own, without any error context. HedNWBValidator adds the
+    table/column/row context and filters warnings when it reads them back, so a cached string is never re-parsed.
+    The per-column validation methods store the full validation of each string; assembled validation (e.g.
+    validate_file) stores the basic checks of each table cell, under a definitions hash with a ``:cell`` suffix.
+
+    The cache holds at most ``max_entries`` strings; when it grows past that, the least recently used entries are
+    evicted. The cache is tied to the installed hedtools version and is emptied when that version changes.
+    Issues are stored as JSON, so HED tag and string objects in them (e.g. ``source_tag``) are stored as strings.
+
+    A ValidationCache can be shared by threads. Each process should open its own ValidationCache on the file.
+    """
+
+    # Fraction of max_entries evicted at once when the cache is full, so that eviction does not run on every put.
+    EVICTION_FRACTION = 0.1
+
+    def __init__(self, path: str, max_entries: int = 1000000):
+        """
+        Open (or create) a validation cache file.
+
+        Parameters:
+            path (str): The path of the SQLite database file (":memory:" for a cache that is not persisted).
+            max_entries (int): The maximum number of HED strings kept in the cache.
+
+        Raises:
+            ValueError: If max_entries is not positive.
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be positive, but {max_entries} was given.")
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("CREATE TABLE IF NOT EXISTS metadata (name TEXT PRIMARY KEY, value TEXT)")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS issues (schema_version TEXT, definitions_hash TEXT, "
+                "allow_placeholders INTEGER, hed_string TEXT, issues TEXT, last_used INTEGER, "
+                "PRIMARY KEY (schema_version, definitions_hash, allow_placeholders, hed_string))"
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS issues_last_used ON issues (last_used)")
+            row = self._connection.execute("SELECT value FROM metadata WHERE name = 'hedtools_version'").fetchone()
+            if row is None or row[0] != hedtools_version:
+                self._connection.execute("DELETE FROM issues")
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO metadata (name, value) VALUES ('hedtools_version', ?)", (hedtools_version,)
+                )
+            self._size = self._connection.execute("SELECT COUNT(*) FROM issues").fetchone()[0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return self._size
+
+    def get(
+        self, schema_version: str, definitions_hash: str, allow_placeholders: bool, hed_string: str
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Return the cached issues for a HED string, or None if the string is not in the cache.
+
+        Parameters:
+            schema_version (str): The HED schema version the string was validated against.
+            definitions_hash (str): The hash of the DefinitionDict the string was validated with.
+            allow_placeholders (bool): Whether placeholders were allowed.
+            hed_string (str): The HED string.
+
+        Returns:
+            list or None: The context-free issues for the string (an empty list if it is valid).
+        """
+        key = (schema_version, definitions_hash, int(allow_placeholders), hed_string)
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT issues FROM issues WHERE schema_version = ? AND definitions_hash = ? "
+                "AND allow_placeholders = ? AND hed_string = ?",
+                key,
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute(
+                "UPDATE issues SET last_used = ? WHERE schema_version = ? AND definitions_hash = ? "
+                "AND allow_placeholders = ? AND hed_string = ?",
+                (time.time_ns(), *key),
+            )
+        return self._load_issues(row[0])
+
+    def put(
+        self,
+        schema_version: str,
+        definitions_hash: str,
+        allow_placeholders: bool,
+        hed_string: str,
+        issues: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Store the context-free issues of a HED string.
+
+        Parameters:
+            schema_version (str): The HED schema version the string was validated against.
+            definitions_hash (str): The hash of the DefinitionDict the string was validated with.
+            allow_placeholders (bool): Whether placeholders were allowed.
+            hed_string (str): The HED string.
+            issues (list): The issues found when validating the string without error context.
+
+        Returns:
+            list: The issues as they will be read back from the cache.
+        """
+        serialized = json.dumps([self._dump_issue(issue) for issue in issues])
+        key = (schema_version, definitions_hash, int(allow_placeholders), hed_string)
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO issues (schema_version, definitions_hash, allow_placeholders, hed_string, "
+                "issues, last_used) VALUES (?, ?, ?, ?, ?, ?)",
+                (*key, serialized, time.time_ns()),
+            )
+            # Strings are only put after a miss, so the size is tracked without counting; _evict recounts.
+            self._size += 1
+            if self._size > self.max_entries:
+                self._evict()
+        return self._load_issues(serialized)
+
+    def commit(self):
+        """Write the pending cache updates to disk."""
+        with self._lock:
+            self._connection.commit()
+
+    def clear(self):
+        """Remove all entries from the cache."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM issues")
+            self._size = 0
+
+    def close(self):
+        """Commit pending updates and close the cache file."""
+        with self._lock:
+            self._connection.commit()
+            self._connection.close()
+
+    def _evict(self):
+        """Delete the least recently used entries so the cache is below max_entries (called with the lock held)."""
+        target = int(self.max_entries * (1 - self.EVICTION_FRACTION))
+        self._connection.execute(
+            "DELETE FROM issues WHERE rowid IN (SELECT rowid FROM issues ORDER BY last_used LIMIT ?)",
+            (self._size - target,),
+        )
+        self._size = self._connection.execute("SELECT COUNT(*) FROM issues").fetchone()[0]
+
+    @staticmethod
+    def _dump_issue(issue: Dict[str, Any]) -> Dict[str, Any]:
+        """Return a JSON-serializable copy of an issue (HED objects and other values become strings)."""
+        return {
+            key: value if isinstance(value, (str, int, float, bool, type(None))) else str(value)
+            for key, value in issue.items()
+        }
+
+    @staticmethod
+    def _load_issues(serialized: str) -> List[Dict[str, Any]]:
+        """Return the issues stored in a cache entry, with their severities restored."""
+        issues = json.loads(serialized)
+        for issue in issues:
+            if "severity" in issue:
+                issue["severity"] = ErrorSeverity(issue["severity"])
+        return issues
+
+
+def definitions_hash(def_dict: DefinitionDict) -> str:
+    """Return a hash of a DefinitionDict (names, placeholders, and contents of all definitions)."""
+    digest = hashlib.sha256()
+    for name, entry in sorted(def_dict.items()):
+        digest.update(f"{name}\0{entry.takes_value}\0{entry.contents}\n".encode("utf-8"))
+    return digest.hexdigest()
@@ -0,0 +1,196 @@
+"""
+Issue budgets, progress reporting, and cancellation for the validation calls of HedNWBValidator.
+"""
+
+from typing import List, Dict, Any, Callable, Optional
+import numpy as np
+from hed.errors import ErrorHandler, ErrorContext, ErrorSeverity
+
+# TabularInput reports ``ec_row`` as the line number in a TSV file: 1-based, after the header line.
+TABULAR_ROW_OFFSET = 2
+
+
+class IssueBudgetExhaustedError(Exception):
+    """Raised by MonitoredErrorHandler to stop a validation whose issue budget has been used up."""
+
+
+class IssueBudget:
+    """
+    The issue limits of one validation call (``max_issues`` and ``stop_on_first_error``).
+
+    Validation code passes the issues it finds through take(), in the order they are reported, and stops
+    once the budget is exhausted. A budget without limits passes all issues through and is never exhausted.
+    """
+
+    def __init__(self, max_issues: Optional[int] = None, stop_on_first_error: bool = False):
+        """
+        Parameters:
+            max_issues (int, optional): The maximum number of issues to report.
+            stop_on_first_error (bool): Whether to stop after the first issue with error severity.
+
+        Raises:
+            ValueError: If max_issues is not positive.
+        """
+        if max_issues is not None and max_issues < 1:
+            raise ValueError(f"max_issues must be positive, but {max_issues} was given.")
+        self.max_issues = max_issues
+        self.stop_on_first_error = stop_on_first_error
+        self.count = 0
+        self.exhausted = False
+
+    @property
+    def limited(self) -> bool:
+        """True if the budget has a limit, so validation may stop early."""
+        return self.max_issues is not None or self.stop_on_first_error
+
+    def remaining(self) -> "IssueBudget":
+        """Return a new budget with the limits that are left of this one."""
+        max_issues = None if self.max_issues is None else self.max_issues - self.count
+        return IssueBudget(max_issues, self.stop_on_first_error)
+
+    def take(self, issues: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Count issues against the budget.
+
+        Parameters:
+            issues (list): The next issues found, in order.
+
+        Returns:
+            list: The leading issues that fit in the budget (all of them unless the budget is now exhausted).
+        """
+        if self.exhausted:
+            return []
+        if not issues or not self.limited:
+            return issues
+        if self.stop_on_first_error:
+            for index, issue in enumerate(issues):
+                if issue.get("severity", ErrorSeverity.ERROR) == ErrorSeverity.ERROR:
+                    issues = issues[: index + 1]
+                    self.exhausted = True
+                    break
+        if self.max_issues is not None and self.count + len(issues) >= self.max_issues:
+            issues = issues[: self.max_issues - self.count]
+            self.exhausted = True
+        self.count += len(issues)
+        return issues
+
+
+class MonitoredErrorHandler(ErrorHandler):
+    """
+    An ErrorHandler that follows hedtools validation of a TabularInput to enforce limits and report progress.
+
+    hedtools reports the issues of each string through add_context_and_filter() or format_error_with_context().
+    This handler starts with a copy of another handler's settings and context, records the issues reported
+    through it, and raises IssueBudgetExhaustedError when the issues recorded use up what is left of the budget.
+    The budget itself is not charged; the caller takes the issues it returns from the budget.
+
+    hedtools also pushes each row onto the error context before validating it. Every PROGRESS_INTERVAL rows
+    the handler reports progress to the monitor and checks for cancellation.
+    """
+
+    # Number of rows between progress reports and cancellation checks.
+    PROGRESS_INTERVAL = 1000
+
+    def __init__(
+        self,
+        error_handler: ErrorHandler,
+        budget: IssueBudget,
+        monitor: "ValidationMonitor",
+        total_rows: int,
+        first_row: int = 0,
+    ):
+        super().__init__(check_for_warnings=getattr(error_handler, "_check_for_warnings", True))
+        self.error_context = list(error_handler.error_context)
+        self.issues = []
+        self._budget = budget.remaining()
+        self._monitor = monitor
+        self._total_rows = total_rows
+        self._first_row = first_row
+        self._rows_done = first_row
+        self.reported_rows = first_row
+        self._next_report = first_row + self.PROGRESS_INTERVAL
+
+    def push_error_context(self, context_type, context):
+        super().push_error_context(context_type, context)
+        if context_type == ErrorContext.ROW and self._monitor.active and isinstance(context, (int, np.integer)):
+            # Temporal validation revisits rows, so progress follows the furthest row reached.
+            self._rows_done = min(
+                max(self._rows_done, self._first_row + context - TABULAR_ROW_OFFSET + 1),
+                self._total_rows,
+            )
+            if self._rows_done >= self._next_report:
+                self._next_report = self._rows_done + self.PROGRESS_INTERVAL
+                self.reported_rows = self._rows_done
+                self._monitor.report(self._rows_done, self._total_rows)
+
+    def add_context_and_filter(self, issues):
+        super().add_context_and_filter(issues)
+        self._record(issues)
+
+    def format_error_with_context(self, *args, **kwargs):
+        issues = super().format_error_with_context(*args, **kwargs)
+        self._record(issues)
+        return issues
+
+    def _record(self, issues):
+        self.issues += self._budget.take(issues)
+        if self._budget.exhausted:
+            raise IssueBudgetExhaustedError()
+
+
+class ValidationCancelledError(Exception):
+    """Raised by HedNWBValidator methods when their cancellation token is set during validation."""
+
+
+class ValidationMonitor:
+    """
+    The progress callback and cancellation token of one validation call.
+
+    Callers set the table and column being validated with set_scope(); report() passes the progress for that
+    scope to the callback and then checks for cancellation. A monitor without a callback or token is inactive.
+    """
+
+    def __init__(
+        self,
+        progress: Optional[Callable[[Optional[str], Optional[str], int, int], None]] = None,
+        cancel=None,
+        table_name: Optional[str] = None,
+        column_name: Optional[str] = None,
+    ):
+        self.progress = progress
+        self.cancel = cancel
+        self.table_name = table_name
+        self.column_name = column_name
+
+    @property
+    def active(self) -> bool:
+        """True if the monitor has a progress callback or a cancellation token."""
+        return self.progress is not None or self.cancel is not None
+
+    def set_scope(self, table_name: Optional[str], column_name: Optional[str]):
+        """Set the table and column that subsequent progress reports refer to."""
+        self.table_name = table_name
+        self.column_name = column_name
+
+    def check(self):
+        """
+        Raise ValidationCancelledError if the cancellation token is set.
+
+        Raises:
+            ValidationCancelledError: If the cancellation token is set.
+        """
+        if self.cancel is not None and self.cancel.is_set():
+            raise ValidationCancelledError("HED validation was cancelled.")
+
+    def report(self, rows_done: int, total_rows: int):
+        """Report progress for the current scope, then check for cancellation."""
+        if self.progress is not None:
+            self.progress(self.table_name, self.column_name, rows_done, total_rows)
+        self.check()
+
+
+def copy_error_handler(error_handler: ErrorHandler) -> ErrorHandler:
+    """Return a new ErrorHandler with the warning setting and a copy of the context stack of another."""
+    handler_copy = ErrorHandler(check_for_warnings=getattr(error_handler, "_check_for_warnings", True))
+    handler_copy.error_context = list(error_handler.error_context)
+    return handler_copy
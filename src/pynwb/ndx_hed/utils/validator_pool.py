@@ -0,0 +1,208 @@
+"""
+HedValidatorPool class for validating NWB files that use different HED schema versions.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import List, Dict, Any, Callable, Optional, Sequence, Union
+from pynwb import NWBFile
+from hed.errors import ErrorHandler, HedExceptions, HedFileError
+from ..hed_lab_metadata import HedLabMetaData
+from .file_validation_options import FileValidationOptions
+from .hed_nwb_validator import HedNWBValidator
+from .schema_cache import _schema_version_key, _schema_version_string
+from .validation_cache import ValidationCache
+
+
+class HedValidatorPool:
+    """
+    Lazily builds and caches one HedNWBValidator per HED schema version, and dispatches each file to it.
+
+    HedNWBValidator.validate_file raises HedFileError for a file whose schema version differs from the
+    validator's, so validating an archive that mixes schema versions needs one validator per version. A pool
+    builds the validator for a version the first time a file uses it and reuses it for every later file, so
+    each schema (a standard or library schema, or a schema group such as ``'["8.4.0","bc:score_2.1.0"]'``) is
+    loaded once per batch. Schema groups are compared by their list of versions, however the list is written.
+
+    A validator also holds the HED definitions it validates against (see HedNWBValidator.validate_file), so
+    files with the same schema version but different definitions get validators of their own. Within a
+    dataset the definitions are normally the same in every file, so this is usually one validator per version.
+    Validators are keyed by the schema version and a SHA-256 hash of the definitions string, so the pool does
+    not keep the definitions of every file as keys.
+
+    The pool holds at most ``max_entries`` validators; when it grows past that, the least recently used are
+    dropped (and built again if a later file needs them). A pool can be shared by threads; validators are built
+    under a lock.
+    """
+
+    def __init__(self, cache: Optional[ValidationCache] = None, max_entries: int = 16):
+        """
+        Create an empty validator pool.
+
+        Parameters:
+            cache (ValidationCache, optional): A persistent cache of HED string validation results, shared by all
+                                               the validators of the pool.
+            max_entries (int): The maximum number of validators kept in the pool.
+
+        Raises:
+            ValueError: If max_entries is not positive.
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be positive, but {max_entries} was given.")
+        self.cache = cache
+        self.max_entries = max_entries
+        self._validators = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._validators)
+
+    @property
+    def schema_versions(self) -> List[str]:
+        """The HED schema versions of the validators in the pool, least recently used first."""
+        versions = []
+        with self._lock:
+            keys = list(self._validators)
+        for version_key, _ in keys:
+            version = _schema_version_string(version_key)
+            if version not in versions:
+                versions.append(version)
+        return versions
+
+    def get_validator(
+        self, hed_schema_version: Union[str, Sequence[str]], definitions: Optional[str] = None
+    ) -> HedNWBValidator:
+        """
+        Return the pool's validator for a HED schema version and definitions, building it if needed.
+
+        Parameters:
+            hed_schema_version (str or sequence of str): The HED schema version, e.g. ``"8.4.0"``, or the versions
+                                                          of a schema group, as a list or its JSON string.
+            definitions (str, optional): A string containing one or more HED definitions.
+
+        Returns:
+            HedNWBValidator: The validator for that schema version and those definitions.
+
+        Raises:
+            ValueError: If the HED schema version cannot be loaded or the definitions cannot be parsed.
+        """
+        definitions_key = hashlib.sha256((definitions or "").encode("utf-8")).hexdigest()
+        key = (_schema_version_key(hed_schema_version), definitions_key)
+        return self._get_or_build(
+            key, lambda: HedLabMetaData(hed_schema_version=_schema_version_string(key[0]), definitions=definitions)
+        )
+
+    def get_file_validator(self, nwbfile: NWBFile) -> HedNWBValidator:
+        """
+        Return the pool's validator for an NWB file's HedLabMetaData.
+
+        A validator not built yet is built from a copy of the file's HedLabMetaData (its schema version and
+        serialized definitions), so the pool does not keep the file's container tree alive and later changes to
+        the file's definitions (e.g. add_definitions) do not change the pooled validator.
+
+        Parameters:
+            nwbfile (NWBFile): The NWB file.
+
+        Returns:
+            HedNWBValidator: The validator for the file's schema version and definitions.
+
+        Raises:
+            ValueError: If nwbfile is not a valid NWBFile instance.
+            HedFileError: If HedLabMetaData is missing or invalid in the NWB file.
+        """
+        if nwbfile is None or not isinstance(nwbfile, NWBFile):
+            raise ValueError("The provided nwbfile is not a valid NWBFile instance.")
+        hed_metadata = nwbfile.lab_meta_data.get("hed_schema")
+        if hed_metadata is None or not isinstance(hed_metadata, HedLabMetaData):
+            raise HedFileError(
+                HedExceptions.SCHEMA_INVALID, f"NWB file {nwbfile.identifier} does not have a valid HED schema", ""
+            )
+        return self.get_validator(hed_metadata.get_hed_schema_version(), hed_metadata.definitions)
+
+    def validate_file(self, nwbfile: NWBFile, **kwargs) -> List[Dict[str, Any]]:
+        """
+        Validates an NWB file with the pool's validator for its schema version (see HedNWBValidator.validate_file).
+
+        Parameters:
+            nwbfile (NWBFile): The NWB file to validate.
+            **kwargs: Other keyword arguments of HedNWBValidator.validate_file (e.g. error_handler, max_issues).
+
+        Returns:
+            List[Dict[str, Any]]: A consolidated list of validation issues from all tables in the file.
+
+        Raises:
+            The exceptions raised by get_file_validator and HedNWBValidator.validate_file.
+        """
+        return self.get_file_validator(nwbfile).validate_file(nwbfile, **kwargs)
+
+    def validate_files(self, nwbfiles: Sequence[NWBFile], **kwargs) -> List[List[Dict[str, Any]]]:
+        """
+        Validates several NWB files, each with the pool's validator for its schema version.
+
+        Each file is validated with its own ErrorHandler (unless ``error_handler`` is given).
+
+        Parameters:
+            nwbfiles (sequence of NWBFile): The NWB files to validate.
+            **kwargs: Other keyword arguments of HedNWBValidator.validate_file.
+
+        Returns:
+            List[List[Dict[str, Any]]]: The issues of each file, in the order of ``nwbfiles``.
+        """
+        return [self.validate_file(nwbfile, **kwargs) for nwbfile in nwbfiles]
+
+    def validate_path(self, path: str, error_handler: Optional[ErrorHandler] = None, **options) -> List[Dict[str, Any]]:
+        """
+        Validates the HED in an NWB file on disk with the pool's validator for its schema version.
+
+        This is HedNWBValidator.validate_path, except that the validator comes from the pool: the file's
+        HedLabMetaData attributes are read first, and a HedLabMetaData is only constructed (and its schema
+        loaded and definitions parsed) for a schema version and definitions the pool has not seen.
+
+        Parameters:
+            path (str): The path of the NWB (HDF5) file.
+            error_handler (ErrorHandler, optional): An ErrorHandler instance for collecting errors.
+            **options: The file validation options, as for HedNWBValidator.validate_file (see
+                       FileValidationOptions).
+
+        Returns:
+            List[Dict[str, Any]]: A consolidated list of validation issues from all tables in the file.
+
+        Raises:
+            The exceptions raised by HedNWBValidator.validate_path.
+        """
+        return HedNWBValidator._validate_path(path, self.get_validator, error_handler, FileValidationOptions(**options))
+
+    def validate_paths(self, paths: Sequence[str], **kwargs) -> List[List[Dict[str, Any]]]:
+        """
+        Validates several NWB files on disk, each with the pool's validator for its schema version.
+
+        Parameters:
+            paths (sequence of str): The paths of the NWB files.
+            **kwargs: Other keyword arguments of validate_path.
+
+        Returns:
+            List[List[Dict[str, Any]]]: The issues of each file, in the order of ``paths``.
+        """
+        return [self.validate_path(path, **kwargs) for path in paths]
+
+    def clear(self):
+        """Drop all the validators of the pool."""
+        with self._lock:
+            self._validators.clear()
+
+    def _get_or_build(self, key: tuple, get_metadata: Callable[[], HedLabMetaData]) -> HedNWBValidator:
+        """
+        Return the validator for a key, building it from the HedLabMetaData returned by get_metadata if needed.
+
+        The validator becomes the most recently used, and the least recently used beyond max_entries are dropped.
+        """
+        with self._lock:
+            validator = self._validators.get(key)
+            if validator is None:
+                validator = HedNWBValidator(get_metadata(), cache=self.cache)
+                self._validators[key] = validator
+            self._validators.move_to_end(key)
+            while len(self._validators) > self.max_entries:
+                self._validators.popitem(last=False)
+        return validator
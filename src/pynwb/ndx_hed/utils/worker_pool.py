@@ -0,0 +1,101 @@
+"""
+Worker processes that validate the assembled tables of NWB files in parallel (see HedNWBValidator.validate_file).
+"""
+
+import gc
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Optional
+from hed.errors import ErrorHandler
+from hed.models import HedGroup, HedTag
+from ..hed_lab_metadata import HedLabMetaData
+from .validation_monitor import IssueBudget
+
+# Validators built by validate_tabular_in_worker, keyed by (schema version, definitions). Each worker process
+# has its own copy, so the schema and DefinitionDict are loaded once per worker rather than once per table.
+# Workers forked by create_worker_pool inherit the entry registered in the parent while the pool is created.
+_worker_validators = {}
+
+
+def validate_tabular_in_worker(
+    validator_class: type,
+    hed_schema_version: str,
+    definitions: Optional[str],
+    df,
+    json_data: dict,
+    name: str,
+    error_context: list,
+    check_for_warnings: bool,
+    max_issues: Optional[int] = None,
+    stop_on_first_error: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    Validate one assembled table in a worker and return picklable issues (see HedNWBValidator.validate_file).
+
+    The validator is built as ``validator_class(HedLabMetaData(...))`` the first time the worker sees a schema
+    version and definitions, and is reused for later tables.
+    """
+    validator_key = (hed_schema_version, definitions)
+    validator = _worker_validators.get(validator_key)
+    if validator is None:
+        hed_metadata = HedLabMetaData(hed_schema_version=hed_schema_version, definitions=definitions)
+        validator = _worker_validators[validator_key] = validator_class(hed_metadata)
+
+    error_handler = ErrorHandler(check_for_warnings=check_for_warnings)
+    for context_type, context in error_context:
+        error_handler.push_error_context(context_type, context)
+    budget = IssueBudget(max_issues, stop_on_first_error)
+    issues = validator._validate_tabular(df, json_data, name, error_handler, budget)
+    # HED tag and string objects reference the whole schema, so they are sent back as strings.
+    return [
+        {key: str(value) if isinstance(value, (HedTag, HedGroup)) else value for key, value in issue.items()}
+        for issue in issues
+    ]
+
+
+def create_worker_pool(
+    validator_class: type, hed_schema_version: str, definitions: Optional[str], workers: int
+) -> ProcessPoolExecutor:
+    """
+    Create a process pool of workers forked after a validator for a schema version and definitions is registered.
+
+    See HedNWBValidator.create_worker_pool. The registered validator is built exactly as validate_tabular_in_worker
+    builds one, from a new HedLabMetaData, so it holds no reference to the caller's metadata. It is registered only
+    while the workers are forked: the parent process drops it once they are started, so creating pools does not
+    accumulate validators in the parent.
+
+    Parameters:
+        validator_class (type): The validator class (HedNWBValidator or a subclass).
+        hed_schema_version (str): The HED schema version of the validator.
+        definitions (str, optional): The definitions of the validator, as sent with each table.
+        workers (int): The number of worker processes.
+
+    Returns:
+        ProcessPoolExecutor: The pool, with all its workers already started.
+
+    Raises:
+        ValueError: If workers is not positive.
+    """
+    if workers < 1:
+        raise ValueError(f"workers must be positive, but {workers} was given.")
+    if "fork" not in multiprocessing.get_all_start_methods():
+        return ProcessPoolExecutor(max_workers=workers)
+
+    # The worker validator has no cache: a SQLite connection must not be used across a fork.
+    validator_key = (hed_schema_version, definitions)
+    registered = validator_key not in _worker_validators
+    if registered:
+        hed_metadata = HedLabMetaData(hed_schema_version=hed_schema_version, definitions=definitions)
+        _worker_validators[validator_key] = validator_class(hed_metadata)
+    gc.collect()
+    gc.freeze()
+    try:
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("fork"))
+        # With the fork start method, all the workers are forked when the first task is submitted.
+        pool.submit(os.getpid).result()
+    finally:
+        gc.unfreeze()
+        if registered:
+            _worker_validators.pop(validator_key, None)
+    return pool
@@ -0,0 +1,10 @@
+"""Helpers shared by the validation tests for comparing lists of issues."""
+
+from hed.errors import ErrorContext
+
+DEFAULT_SIGNATURE_KEYS = ("code", "message", ErrorContext.FILE_NAME, ErrorContext.COLUMN, ErrorContext.ROW)
+
+
+def issue_signatures(issues, keys=DEFAULT_SIGNATURE_KEYS):
+    """Return the comparable (ordered) signatures of a list of issues: the values of ``keys`` of each issue."""
+    return [tuple(issue.get(key) for key in keys) for issue in issues]
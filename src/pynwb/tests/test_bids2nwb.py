@@ -17,6 +17,7 @@ from ndx_hed.utils.bids2nwb import (
     get_categorical_meanings,
     get_events_table,
     get_bids_tabular,
+    get_hed_tabular,
     extract_definitions,
 )
 
@@ -849,5 +850,86 @@ class TestGetBidsTabular(unittest.TestCase):
         self.assertEqual(json_data["reaction_time"]["HED"], "(Duration, # s)")
 
 
+class TestGetHedTabular(unittest.TestCase):
+    """Test class for get_hed_tabular function."""
+
+    def setUp(self):
+        """Set up an EventsTable with HED, value, categorical, and non-HED columns."""
+        sample_df = pd.DataFrame({
+            "onset": [0.0, 1.5, 3.0],
+            "duration": [0.5, 1.0, 0.8],
+            "event_type": ["show_cross", "left_click", "show_cross"],
+            "response": ["left", "right", "left"],
+            "trial": [1, 2, 3],
+            "notes": ["a", "b", "c"],
+            "HED": ["Red", "n/a", "Blue"],
+        })
+        meanings = {
+            "categorical": {
+                "event_type": {
+                    "Levels": {"show_cross": "Display a cross", "left_click": "Left button press"},
+                    "HED": {"show_cross": "Sensory-event", "left_click": "Agent-action"},
+                },
+                "response": {"Levels": {"left": "Left", "right": "Right"}},
+            },
+            "value": {"trial": "Experimental-trial/#"},
+        }
+        self.events_table = get_events_table(
+            name="test_events", description="Test events for conversion", df=sample_df, meanings=meanings
+        )
+
+    def test_get_hed_tabular_keeps_hed_columns(self):
+        """Test that only the onset and HED-relevant columns are assembled, with HED-only sidecar entries."""
+        df, json_data = get_hed_tabular(self.events_table)
+        self.assertEqual(list(df.columns), ["onset", "event_type", "trial", "HED"])
+        self.assertEqual(list(df.index), list(self.events_table.id[:]))
+        self.assertEqual(list(df["onset"]), [0.0, 1.5, 3.0])
+        self.assertEqual(list(df["event_type"]), ["show_cross", "left_click", "show_cross"])
+        self.assertEqual(
+            json_data,
+            {
+                "event_type": {"HED": {"show_cross": "Sensory-event", "left_click": "Agent-action"}},
+                "trial": {"HED": "Experimental-trial/#"},
+            },
+        )
+
+    def test_get_hed_tabular_matches_bids_tabular(self):
+        """Test that the assembled columns and HED entries are the same as those of get_bids_tabular."""
+        hed_df, hed_json = get_hed_tabular(self.events_table)
+        bids_df, bids_json = get_bids_tabular(self.events_table)
+        pd.testing.assert_frame_equal(hed_df, bids_df[hed_df.columns])
+        for col_name, column_info in hed_json.items():
+            self.assertEqual(column_info["HED"], bids_json[col_name]["HED"])
+
+    def test_get_hed_tabular_rows_and_columns(self):
+        """Test that a subset of the rows and HED columns is assembled, always with the onset column."""
+        df, json_data = get_hed_tabular(self.events_table, rows=[2, 0], columns=["HED"])
+        self.assertEqual(list(df.columns), ["onset", "HED"])
+        self.assertEqual(list(df.index), [0, 2])
+        self.assertEqual(list(df["HED"]), ["Red", "Blue"])
+        self.assertEqual(json_data, {})
+
+        df, json_data = get_hed_tabular(self.events_table, rows=slice(1, 3), columns=["trial"])
+        self.assertEqual(list(df["trial"]), [2, 3])
+        self.assertEqual(list(json_data), ["trial"])
+
+        with self.assertRaises(ValueError):
+            get_hed_tabular(self.events_table, columns=["missing"])
+        with self.assertRaises(ValueError):
+            get_hed_tabular(self.events_table, rows=[3])
+
+    def test_get_hed_tabular_no_hed(self):
+        """Test that a table without HED assembles to no HED columns."""
+        table = DynamicTable(
+            name="plain",
+            description="No HED",
+            columns=[VectorData(name="trial_id", description="Trial IDs", data=[1, 2])],
+        )
+        df, json_data = get_hed_tabular(table)
+        self.assertEqual(list(df.columns), [])
+        self.assertEqual(len(df), 2)
+        self.assertEqual(json_data, {})
+
+
 if __name__ == "__main__":
     unittest.main()
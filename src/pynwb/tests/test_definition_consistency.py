@@ -0,0 +1,143 @@
+"""
+Unit tests for the DefinitionConsistencyChecker class.
+"""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+from datetime import datetime
+from dateutil.tz import tzlocal
+import h5py
+from pynwb import NWBFile, NWBHDF5IO
+from hed.errors import ErrorSeverity, HedFileError
+from ndx_hed import HedLabMetaData
+from ndx_hed.utils import definition_consistency
+from ndx_hed.utils.definition_consistency import DefinitionConsistencyChecker
+
+
+class TestDefinitionConsistencyChecker(unittest.TestCase):
+    """Test class for checking HED definitions across the files of a dataset."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    @staticmethod
+    def _nwbfile(identifier, definitions, schema_version="8.4.0"):
+        nwbfile = NWBFile(
+            session_description="Test session for definition consistency",
+            identifier=identifier,
+            session_start_time=datetime.now(tzlocal()),
+        )
+        nwbfile.add_lab_meta_data(HedLabMetaData(hed_schema_version=schema_version, definitions=definitions))
+        return nwbfile
+
+    def _write(self, identifier, definitions, schema_version="8.4.0"):
+        path = os.path.join(self.temp_dir.name, f"{identifier}.nwb")
+        with NWBHDF5IO(path, "w") as io:
+            io.write(self._nwbfile(identifier, definitions, schema_version))
+        return path
+
+    def test_consistent_files(self):
+        """Test that files with the same definitions are parsed once and give no issues."""
+        definitions = "(Definition/Go, (Sensory-event, Red)), (Definition/Stop, (Agent-action))"
+        paths = [self._write(f"file{index}", definitions) for index in range(4)]
+        checker = DefinitionConsistencyChecker()
+        with mock.patch.object(
+            definition_consistency, "DefinitionDict", wraps=definition_consistency.DefinitionDict
+        ) as definition_dict:
+            keys = checker.add_paths(paths)
+        self.assertEqual(definition_dict.call_count, 1)
+        self.assertEqual(len(set(keys)), 1)
+        self.assertEqual(checker.num_definition_sets, 1)
+        self.assertEqual(checker.files, paths)
+        self.assertEqual(checker.check(), [])
+
+    def test_equivalent_definitions(self):
+        """Test that definitions differing only in tag form, order, or case do not conflict."""
+        path_a = self._write("a", "(Definition/Go, (Sensory-event, Red))")
+        path_b = self._write("b", "(Definition/Go, (Sensory-event, Red))")
+        with h5py.File(path_b, "r+") as h5file:
+            h5file["general/hed_schema"].attrs["definitions"] = "(Definition/go, (red, Event/Sensory-event))"
+        checker = DefinitionConsistencyChecker()
+        checker.add_paths([path_a, path_b])
+        self.assertEqual(checker.num_definition_sets, 2)
+        self.assertEqual(checker.check(), [])
+
+    def test_equivalent_schema_versions(self):
+        """Test that one schema version written in different forms is one definition set without a mismatch."""
+        definitions = "(Definition/Go, (Sensory-event, Red)), (Definition/Mark)"
+        paths = [self._write(f"file{index}", definitions) for index in range(3)]
+        for path, schema_version in zip(paths, ["8.4.0", '"8.4.0"', " 8.4.0"], strict=True):
+            with h5py.File(path, "r+") as h5file:
+                h5file["general/hed_schema"].attrs["hed_schema_version"] = schema_version
+        checker = DefinitionConsistencyChecker()
+        self.assertEqual(len(set(checker.add_paths(paths))), 1)
+        self.assertEqual(checker.num_definition_sets, 1)
+        self.assertEqual(checker.check(), [])
+
+    def test_conflicting_and_missing_definitions(self):
+        """Test that differing contents, missing definitions, and schema versions are reported."""
+        paths = [
+            self._write("a", "(Definition/Go, (Sensory-event, Red)), (Definition/Stop, (Agent-action))"),
+            self._write("b", "(Definition/Go, (Sensory-event, Red)), (Definition/Stop, (Agent-action))"),
+            self._write("c", "(Definition/Go, (Sensory-event, Blue))", schema_version="8.3.0"),
+        ]
+        checker = DefinitionConsistencyChecker()
+        checker.add_paths(paths)
+        issues = checker.check()
+        self.assertEqual(
+            [issue["code"] for issue in issues],
+            ["SCHEMA_VERSION_MISMATCH", "DEFINITION_CONFLICT", "DEFINITION_MISSING"],
+        )
+        version_issue, conflict, missing = issues
+        self.assertEqual(version_issue["variants"], {"8.4.0": paths[:2], "8.3.0": paths[2:]})
+        self.assertEqual(conflict["definition"], "go")
+        self.assertEqual(conflict["severity"], ErrorSeverity.ERROR)
+        self.assertEqual(sorted(len(files) for files in conflict["variants"].values()), [1, 2])
+        self.assertIn("2 files", conflict["message"])
+        self.assertEqual(missing["definition"], "stop")
+        self.assertEqual(missing["files"], paths[2:])
+        self.assertEqual(missing["severity"], ErrorSeverity.WARNING)
+
+    def test_invalid_definitions(self):
+        """Test that the errors of a definition set are reported for each file with that set."""
+        paths = [self._write(name, "(Definition/Go, (Red))") for name in ("a", "b")]
+        for path in paths:
+            with h5py.File(path, "r+") as h5file:
+                h5file["general/hed_schema"].attrs["definitions"] = "(Definition/Go, (InvalidTag1))"
+        checker = DefinitionConsistencyChecker()
+        checker.add_paths(paths)
+        issues = checker.check()
+        self.assertEqual([issue.get("ec_filename") for issue in issues], paths)
+        self.assertTrue(all(issue["severity"] == ErrorSeverity.ERROR for issue in issues))
+
+    def test_in_memory_files(self):
+        """Test files added as NWBFile objects, which reuse their parsed DefinitionDict."""
+        checker = DefinitionConsistencyChecker()
+        with mock.patch.object(definition_consistency, "DefinitionDict") as definition_dict:
+            checker.add_nwbfile(self._nwbfile("a", "(Definition/Go, (Red))"))
+            checker.add_nwbfile(self._nwbfile("b", "(Definition/Go, (Blue))"), name="second")
+        definition_dict.assert_not_called()
+        self.assertEqual(checker.files, ["a", "second"])
+        self.assertEqual([issue["code"] for issue in checker.check()], ["DEFINITION_CONFLICT"])
+        with self.assertRaises(ValueError):
+            checker.add_nwbfile("not a file")
+
+    def test_file_without_metadata(self):
+        """Test that a file without HedLabMetaData raises HedFileError."""
+        path = os.path.join(self.temp_dir.name, "no_hed.nwb")
+        nwbfile = NWBFile(session_description="No HED", identifier="no_hed", session_start_time=datetime.now(tzlocal()))
+        with NWBHDF5IO(path, "w") as io:
+            io.write(nwbfile)
+        with self.assertRaises(HedFileError):
+            DefinitionConsistencyChecker().add_path(path)
+        with self.assertRaises(HedFileError):
+            DefinitionConsistencyChecker().add_nwbfile(nwbfile)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,13 +1,20 @@
 """Unit and integration tests for ndx-hed."""
 
 import os
+import tempfile
+import threading
+from unittest import mock
 from datetime import datetime
 from dateutil.tz import tzlocal
+import h5py
 from hed.schema import HedSchema, HedSchemaGroup
+from hed.errors import HedFileError
 from hed.models import DefinitionDict
 from pynwb import NWBHDF5IO, NWBFile
 from pynwb.testing import TestCase, remove_test_file
+from ndx_hed import hed_lab_metadata
 from ndx_hed.hed_lab_metadata import HedLabMetaData
+from ndx_hed.utils.schema_cache import get_schema_cache
 
 
 class TestHedLabMetaDataConstructor(TestCase):
@@ -281,6 +288,191 @@ class TestHedLabMetaDataRoundTrip(TestCase):
         self.assertIn("Cannot add <class 'ndx_hed.hed_lab_metadata.HedLabMetaData'> 'hed_schema' ", str(cm.exception))
 
 
+class TestHedLabMetaDataLazyLoading(TestCase):
+    """Tests for deferring the schema load and definitions parse until first use."""
+
+    def setUp(self):
+        fd, self.test_nwb_file_path = tempfile.mkstemp(suffix=".nwb")
+        os.close(fd)
+        self.definitions = "(Definition/Go,(Sensory-event)),(Definition/Rt/#,(Parameter-value/#))"
+
+    def tearDown(self):
+        remove_test_file(self.test_nwb_file_path)
+
+    def test_read_defers_loading(self):
+        """Test that reading a file does not load the schema or parse the definitions until they are used."""
+        nwbfile = NWBFile(
+            session_description="Testing lazy loading",
+            identifier="lazy",
+            session_start_time=datetime.now(tzlocal()),
+        )
+        nwbfile.add_lab_meta_data(HedLabMetaData(hed_schema_version="8.4.0", definitions=self.definitions))
+        with NWBHDF5IO(self.test_nwb_file_path, "w") as io:
+            io.write(nwbfile)
+
+        with mock.patch("ndx_hed.hed_lab_metadata.get_schema_cache", wraps=get_schema_cache) as schema_cache:
+            with NWBHDF5IO(self.test_nwb_file_path, "r") as io:
+                read_hed_info = io.read().lab_meta_data["hed_schema"]
+                schema_cache.assert_not_called()
+                self.assertFalse(read_hed_info.is_loaded)
+                self.assertEqual(read_hed_info.get_hed_schema_version(), "8.4.0")
+                self.assertEqual(
+                    read_hed_info.definitions, "(Definition/go,(Sensory-event)),(Definition/rt/#,(Parameter-value/#))"
+                )
+                self.assertTrue(read_hed_info.is_loaded)
+                self.assertIsInstance(read_hed_info.get_hed_schema(), HedSchema)
+        schema_cache.assert_called_once()
+
+    def test_lazy_constructor(self):
+        """Test that lazy=True defers loading, and errors are raised on first use instead of construction."""
+        labdata = HedLabMetaData(hed_schema_version="8.4.0", definitions=self.definitions, lazy=True)
+        self.assertFalse(labdata.is_loaded)
+        labdata.add_definitions("(Definition/Stop,(Move))")
+        self.assertEqual(len(labdata.get_definition_dict().defs), 3)
+
+        labdata = HedLabMetaData(hed_schema_version="99.99.99", lazy=True)
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                labdata.get_hed_schema()
+        labdata = HedLabMetaData(hed_schema_version="8.4.0", definitions="(Definition/Bad, (Sensory-event", lazy=True)
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                labdata.get_definition_dict()
+        self.assertFalse(labdata.is_loaded)
+
+    def test_concurrent_first_use(self):
+        """Test that threads using a lazy object for the first time load it once."""
+        labdata = HedLabMetaData(hed_schema_version="8.4.0", definitions=self.definitions, lazy=True)
+        barrier = threading.Barrier(8)
+        results = []
+
+        def use():
+            barrier.wait()
+            results.append(labdata.get_definition_dict())
+
+        threads = [threading.Thread(target=use) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(results), 8)
+        self.assertTrue(all(result is results[0] for result in results))
+
+    def test_independent_loads(self):
+        """Test that loading one lazy object does not wait for another object being loaded."""
+        loading = HedLabMetaData(hed_schema_version="8.4.0", definitions=self.definitions, lazy=True)
+        other = HedLabMetaData(hed_schema_version="8.4.0", definitions=self.definitions, lazy=True)
+        with loading._load_lock:
+            thread = threading.Thread(target=other.get_definition_dict, daemon=True)
+            thread.start()
+            thread.join(timeout=60)
+            self.assertFalse(thread.is_alive())
+        self.assertTrue(other.is_loaded)
+        self.assertFalse(loading.is_loaded)
+
+
+class TestHedLabMetaDataDefinitionsTable(TestCase):
+    """Tests for storing the definitions as a definitions table."""
+
+    def setUp(self):
+        fd, self.test_nwb_file_path = tempfile.mkstemp(suffix=".nwb")
+        os.close(fd)
+        self.definitions = "(Definition/Go,(Sensory-event)),(Definition/Rt/#,(Parameter-value/#)),(Definition/Mark)"
+
+    def tearDown(self):
+        remove_test_file(self.test_nwb_file_path)
+
+    def _write(self, **kwargs):
+        nwbfile = NWBFile(
+            session_description="Testing definitions tables",
+            identifier="definitions_table",
+            session_start_time=datetime.now(tzlocal()),
+        )
+        labdata = HedLabMetaData(hed_schema_version="8.4.0", definitions=self.definitions, **kwargs)
+        nwbfile.add_lab_meta_data(labdata)
+        with NWBHDF5IO(self.test_nwb_file_path, "w") as io:
+            io.write(nwbfile)
+        return labdata
+
+    def test_table_rows(self):
+        """Test the rows of the definitions table and the serialization of definitions without contents."""
+        labdata = HedLabMetaData(hed_schema_version="8.4.0", definitions=self.definitions)
+        rows = labdata.definitions_table
+        self.assertEqual(
+            [row[:3] for row in rows],
+            [
+                ("go", False, "(Sensory-event)"),
+                ("rt", True, "(Parameter-value/#)"),
+                ("mark", False, ""),
+            ],
+        )
+        self.assertEqual(len({row[3] for row in rows}), 3)
+        self.assertTrue(labdata.definitions.endswith(",(Definition/mark)"))
+        self.assertIsNone(HedLabMetaData(hed_schema_version="8.4.0").definitions_table)
+
+    def test_roundtrip_definitions_table(self):
+        """Test that a table is written next to the attribute and read back without parsing it."""
+        written = self._write(use_definitions_table=True)
+        with h5py.File(self.test_nwb_file_path, "r") as h5file:
+            group = h5file["general/hed_schema"]
+            self.assertEqual(group.attrs["definitions"], written.definitions)
+            self.assertEqual(len(group["definitions_table"]), 3)
+
+        with NWBHDF5IO(self.test_nwb_file_path, "r") as io:
+            read_hed_info = io.read().lab_meta_data["hed_schema"]
+            self.assertTrue(read_hed_info.use_definitions_table)
+            entry = read_hed_info.get_definition("RT")
+            self.assertTrue(entry.takes_value)
+            self.assertIsNone(read_hed_info.get_definition("Stop"))
+            self.assertFalse(read_hed_info.is_loaded)
+            self.assertEqual(read_hed_info.definitions, written.definitions)
+            self.assertEqual(read_hed_info.definitions_table, written.definitions_table)
+            self.assertEqual(read_hed_info.get_definition("go").name, "go")
+
+    def test_definitions_table_compatibility(self):
+        """Test that a file with a definitions table keeps the attribute for older readers, who ignore the table."""
+        written = self._write(use_definitions_table=True)
+        with h5py.File(self.test_nwb_file_path, "r+") as h5file:
+            self.assertEqual(list(h5file["specifications/ndx-hed"]), ["1.1.0"])
+            group = h5file["general/hed_schema"]
+            self.assertEqual(group.attrs["definitions"], written.definitions)
+            group.attrs["definitions"] = "(Definition/Stop, (Agent-action))"
+        with NWBHDF5IO(self.test_nwb_file_path, "r") as io:
+            read_hed_info = io.read().lab_meta_data["hed_schema"]
+            self.assertIsNone(read_hed_info.get_definition("Stop"))
+            self.assertEqual(read_hed_info.definitions, written.definitions)
+
+    def test_content_hash_mismatch(self):
+        """Test that a definitions table row whose contents do not match its content_hash raises HedFileError."""
+        self._write(use_definitions_table=True)
+        with h5py.File(self.test_nwb_file_path, "r+") as h5file:
+            table = h5file["general/hed_schema/definitions_table"]
+            row = table[0]
+            row["contents"] = "(Agent-action)"
+            table[0] = row
+        with NWBHDF5IO(self.test_nwb_file_path, "r") as io:
+            read_hed_info = io.read().lab_meta_data["hed_schema"]
+            with self.assertRaises(HedFileError):
+                read_hed_info.get_definition("go")
+            self.assertTrue(read_hed_info.get_definition("rt").takes_value)
+            with self.assertRaises(HedFileError):
+                read_hed_info.get_definition_dict()
+        with self.assertRaises(HedFileError):
+            hed_lab_metadata.definition_strings_from_table([("go", False, "(Sensory-event)", "")])
+
+    def test_roundtrip_definitions_attribute(self):
+        """Test that the attribute is still written by default, without a table."""
+        written = self._write()
+        with h5py.File(self.test_nwb_file_path, "r") as h5file:
+            group = h5file["general/hed_schema"]
+            self.assertNotIn("definitions_table", group)
+            self.assertEqual(group.attrs["definitions"], written.definitions)
+        with NWBHDF5IO(self.test_nwb_file_path, "r") as io:
+            read_hed_info = io.read().lab_meta_data["hed_schema"]
+            self.assertFalse(read_hed_info.use_definitions_table)
+            self.assertTrue(read_hed_info.get_definition("rt").takes_value)
+
+
 class TestHedLabMetaDataDefinitions(TestCase):
     """Comprehensive tests for definitions handling in HedLabMetaData."""
 
@@ -390,6 +582,51 @@ class TestHedLabMetaDataDefinitions(TestCase):
         self.assertIn("addedevent", labdata._definition_dict.defs)
         self.assertIn("secondevent", labdata._definition_dict.defs)
 
+    def test_definitions_string_cached(self):
+        """Test that the definitions string is serialized once, and only new definitions are serialized after."""
+        definitions = "(Definition/event1,(Sensory-event)),(Definition/event2/#,(Parameter-value/#))"
+        labdata = HedLabMetaData(hed_schema_version="8.4.0", definitions=definitions)
+        with mock.patch(
+            "ndx_hed.hed_lab_metadata.definition_string", wraps=hed_lab_metadata.definition_string
+        ) as definition_string:
+            self.assertEqual(labdata.definitions, definitions)
+            self.assertEqual(labdata.definitions, definitions)
+            self.assertEqual(definition_string.call_count, 2)
+            labdata.add_definitions("(Definition/event3,(Move)),(Definition/event1,(Red))")
+            self.assertEqual(definition_string.call_count, 3)
+            self.assertEqual(labdata.definitions, definitions + ",(Definition/event3,(Move))")
+            self.assertEqual(definition_string.call_count, 3)
+
+    def test_definitions_cache_matches_rebuild(self):
+        """Test that the incrementally built definitions string is the one a full serialization gives."""
+        labdata = HedLabMetaData(hed_schema_version="8.4.0", definitions="(Definition/first,(Red))")
+        self.assertEqual(labdata.definitions, "(Definition/first,(Red))")
+        labdata.add_definitions("(Definition/second/#,(Parameter-value/#))")
+        labdata.add_definitions(["(Definition/third,(Blue))", "(Definition/fourth)"])
+        labdata.get_definition_dict().add_definitions("(Definition/fifth,(Move))", labdata.get_hed_schema())
+        rebuilt = HedLabMetaData(hed_schema_version="8.4.0", definitions=labdata.definitions)
+        self.assertEqual(len(rebuilt.get_definition_dict().defs), 5)
+        self.assertEqual(rebuilt.definitions, labdata.definitions)
+        self.assertTrue(labdata.definitions.endswith(",(Definition/fifth,(Move))"))
+
+    def test_definitions_cache_after_direct_changes(self):
+        """Test that deleting, replacing, or adding definitions directly in the DefinitionDict updates the string."""
+        labdata = HedLabMetaData(
+            hed_schema_version="8.4.0", definitions="(Definition/first,(Red)),(Definition/second,(Blue))"
+        )
+        self.assertEqual(labdata.definitions, "(Definition/first,(Red)),(Definition/second,(Blue))")
+        def_dict = labdata.get_definition_dict()
+        del def_dict.defs["first"]
+        def_dict.add_definitions("(Definition/third,(Move))", labdata.get_hed_schema())
+        self.assertEqual(labdata.definitions, "(Definition/second,(Blue)),(Definition/third,(Move))")
+        replacement = DefinitionDict("(Definition/second,(Green))", labdata.get_hed_schema())
+        def_dict.defs["second"] = replacement.defs["second"]
+        self.assertEqual(labdata.definitions, "(Definition/second,(Green)),(Definition/third,(Move))")
+        labdata.add_definitions("(Definition/fourth)")
+        self.assertEqual(
+            labdata.definitions, "(Definition/second,(Green)),(Definition/third,(Move)),(Definition/fourth)"
+        )
+
     def test_definitions_roundtrip_file_io(self):
         """Test that definitions survive file write/read cycles."""
         # Create NWB file with definitions
@@ -2,22 +2,46 @@
 Unit tests for HedNWBValidator validate_file method.
 """
 
+import asyncio
+import gc
+import hashlib
+import multiprocessing
+import threading
+import time
 import unittest
 import tempfile
 import os
+from unittest import mock
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from dateutil.tz import tzlocal
+import h5py
+import numpy as np
 from pynwb import NWBFile, ProcessingModule, NWBHDF5IO
 from pynwb.core import DynamicTable, VectorData
 from pynwb.event import EventsTable, TimestampVectorData
+from hdmf.common import MeaningsTable
 from ndx_hed import HedTags, HedLabMetaData, HedValueVector
-from ndx_hed.utils.hed_nwb_validator import HedNWBValidator
-from hed.errors import ErrorHandler
+from ndx_hed.utils import worker_pool
+from ndx_hed.utils.bids2nwb import get_hed_tabular
+from ndx_hed.utils.hed_nwb_validator import HedNWBValidator, ValidationCancelledError
+from ndx_hed.utils.validation_cache import ValidationCache
+from hed.errors import ErrorContext, ErrorHandler, HedFileError
+from hed.models import HedString, HedTag
+from hed.validator import HedValidator
+from .issue_utils import issue_signatures
+
+
+def _worker_validator_keys():
+    """Return the keys of the worker validators of the process (run in a worker by the worker pool tests)."""
+    return list(worker_pool._worker_validators)
 
 
 class TestHedNWBFileValidator(unittest.TestCase):
     """Test class for HedNWBValidator validate_file method."""
 
+    SIGNATURE_KEYS = ("code", "message", ErrorContext.FILE_NAME, ErrorContext.ROW)
+
     def setUp(self):
         """Set up test data for file validation."""
 
@@ -479,6 +503,461 @@ class TestHedNWBFileValidator(unittest.TestCase):
         invalid_tag_found = any("InvalidTag123" in msg or "InvalidRoundtripTag" in msg for msg in error_messages)
         self.assertTrue(invalid_tag_found, "Should find our specific invalid tags in error messages")
 
+    def _create_multi_table_nwbfile(self, identifier):
+        """Helper method to create an NWB file with several tables, some with invalid HED."""
+        nwbfile = self._create_nwbfile_with_hed_metadata(identifier)
+        nwbfile.add_acquisition(self.valid_table)
+        nwbfile.add_acquisition(self.invalid_table)
+        nwbfile.add_acquisition(self.no_hed_table)
+        nwbfile.add_acquisition(self.events_table)
+        return nwbfile
+
+    def test_validate_file_with_workers_matches_serial(self):
+        """Test that validating tables in a process pool gives the serial issues in the same order."""
+        nwbfile = self._create_multi_table_nwbfile("workers_test")
+        serial_issues = self.validator.validate_file(nwbfile)
+        parallel_issues = self.validator.validate_file(nwbfile, workers=2)
+
+        self.assertGreater(len(serial_issues), 0)
+        self.assertEqual(
+            issue_signatures(serial_issues, self.SIGNATURE_KEYS), issue_signatures(parallel_issues, self.SIGNATURE_KEYS)
+        )
+        for issue in parallel_issues:
+            self.assertNotIsInstance(issue.get("source_tag", ""), HedTag)
+
+    def test_validate_file_with_executor(self):
+        """Test that validate_file accepts an existing executor and uses the caller's error context."""
+        nwbfile = self._create_multi_table_nwbfile("executor_test")
+        error_handler = ErrorHandler(check_for_warnings=False)
+        serial_issues = self.validator.validate_file(nwbfile, error_handler)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            parallel_issues = self.validator.validate_file(nwbfile, error_handler, executor=executor)
+
+        self.assertEqual(error_handler.error_context, [])
+        self.assertEqual(
+            issue_signatures(serial_issues, self.SIGNATURE_KEYS), issue_signatures(parallel_issues, self.SIGNATURE_KEYS)
+        )
+
+    @unittest.skipUnless("fork" in multiprocessing.get_all_start_methods(), "requires the fork start method")
+    def test_create_worker_pool(self):
+        """Test that forked workers inherit the validator, give the serial issues, and leave no parent entry."""
+        nwbfile = self._create_multi_table_nwbfile("fork_test")
+        serial_issues = self.validator.validate_file(nwbfile)
+        with mock.patch("ndx_hed.utils.worker_pool._worker_validators", {}):
+            with self.validator.create_worker_pool(2) as pool:
+                self.assertEqual(gc.get_freeze_count(), 0)
+                self.assertEqual(worker_pool._worker_validators, {})
+                inherited = pool.submit(_worker_validator_keys).result()
+                parallel_issues = self.validator.validate_file(nwbfile, executor=pool)
+            with self.validator.create_worker_pool(1):
+                pass
+            self.assertEqual(worker_pool._worker_validators, {})
+        self.assertEqual(inherited, [("8.4.0", None)])
+        self.assertEqual(
+            issue_signatures(serial_issues, self.SIGNATURE_KEYS), issue_signatures(parallel_issues, self.SIGNATURE_KEYS)
+        )
+        with self.assertRaises(ValueError):
+            self.validator.create_worker_pool(0)
+
+    def test_validate_file_max_issues(self):
+        """Test that validate_file stops once max_issues issues have been found, serially and in parallel."""
+        nwbfile = self._create_multi_table_nwbfile("max_issues_test")
+        all_issues = issue_signatures(self.validator.validate_file(nwbfile), self.SIGNATURE_KEYS)
+        self.assertGreater(len(all_issues), 3)
+        for max_issues in (1, 3, len(all_issues), len(all_issues) + 5):
+            with self.subTest(max_issues=max_issues):
+                issues = self.validator.validate_file(nwbfile, max_issues=max_issues)
+                self.assertEqual(issue_signatures(issues, self.SIGNATURE_KEYS), all_issues[:max_issues])
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    issues = self.validator.validate_file(nwbfile, executor=executor, max_issues=max_issues)
+                self.assertEqual(issue_signatures(issues, self.SIGNATURE_KEYS), all_issues[:max_issues])
+
+    def test_validate_file_stop_on_first_error(self):
+        """Test that validate_file returns only the first error and does not validate the remaining rows."""
+        table = DynamicTable(
+            name="many_errors",
+            description="Table with many invalid rows",
+            columns=[HedTags(data=["Sensory-event"] + [f"InvalidTag{index}" for index in range(500)])],
+        )
+        nwbfile = self._create_nwbfile_with_hed_metadata("first_error_test")
+        nwbfile.add_acquisition(table)
+        with mock.patch("hed.validator.spreadsheet_validator.HedString", wraps=HedString) as hed_string:
+            issues = self.validator.validate_file(nwbfile, stop_on_first_error=True)
+        self.assertEqual(len(issues), 1)
+        self.assertEqual(issues[0]["code"], "TAG_INVALID")
+        self.assertEqual((issues[0]["ec_filename"], issues[0]["ec_row"]), ("many_errors", 3))
+        self.assertLess(hed_string.call_count, 10)
+
+    def test_validate_file_invalid_max_issues(self):
+        """Test that a non-positive max_issues is rejected."""
+        nwbfile = self._create_multi_table_nwbfile("invalid_max_issues_test")
+        with self.assertRaises(ValueError):
+            self.validator.validate_file(nwbfile, max_issues=0)
+
+    def test_table_has_hed(self):
+        """Test the HED-presence pre-scan on column types and meanings tables."""
+        self.assertTrue(HedNWBValidator._table_has_hed(self.valid_table))
+        self.assertTrue(HedNWBValidator._table_has_hed(self.events_table))
+        self.assertFalse(HedNWBValidator._table_has_hed(self.no_hed_table))
+
+        value_table = DynamicTable(
+            name="values",
+            description="Table with a value column",
+            columns=[HedValueVector(name="rt", description="RTs", data=[0.5], hed="(Duration, # s)")],
+        )
+        self.assertTrue(HedNWBValidator._table_has_hed(value_table))
+
+        categorical_table = DynamicTable(
+            name="conditions",
+            description="Table with a categorical column",
+            columns=[VectorData(name="condition", description="Condition", data=["a", "b"])],
+        )
+        meanings = MeaningsTable(target=categorical_table["condition"], description="Condition meanings")
+        meanings.add_row(value="a", meaning="Condition A")
+        meanings.add_row(value="b", meaning="Condition B")
+        categorical_table.add_meanings_table(meanings)
+        self.assertFalse(HedNWBValidator._table_has_hed(categorical_table))
+        meanings.add_column(name="HED", description="HED tags", col_cls=HedTags, data=["Red", "Blue"])
+        self.assertTrue(HedNWBValidator._table_has_hed(categorical_table))
+
+    def test_validate_file_skips_tables_without_hed(self):
+        """Test that tables without HED are not assembled or read."""
+        nwbfile = self._create_multi_table_nwbfile("skip_test")
+        with mock.patch("ndx_hed.utils.hed_nwb_validator.get_hed_tabular", wraps=get_hed_tabular) as assemble:
+            issues = self.validator.validate_file(nwbfile)
+        assembled = sorted(call.args[0].name for call in assemble.call_args_list)
+        self.assertEqual(assembled, ["invalid_events", "test_events_table", "valid_events"])
+        self.assertGreater(len(issues), 0)
+
+    def test_onsets_of_tables_without_hed_not_checked(self):
+        """Test that the onsets of a table are only checked (e.g. for ONSETS_UNORDERED) if the table has HED."""
+
+        def events_table(with_hed):
+            columns = [TimestampVectorData(name="timestamp", description="Event timestamps", data=[2.0, 1.0, 3.0])]
+            if with_hed:
+                columns.append(HedTags(name="HED", description="HED annotations", data=["Red", "Blue", "Red"]))
+            return EventsTable(name="events", description="Unordered events", columns=columns)
+
+        for with_hed, expected in ((True, ["ONSETS_UNORDERED"]), (False, [])):
+            with self.subTest(with_hed=with_hed):
+                nwbfile = self._create_nwbfile_with_hed_metadata(f"onsets_{with_hed}")
+                nwbfile.add_acquisition(events_table(with_hed))
+                issues = self.validator.validate_file(nwbfile, ErrorHandler(check_for_warnings=True))
+                self.assertEqual([issue["code"] for issue in issues], expected)
+                issues = self.validator.validate_events(events_table(with_hed), ErrorHandler(check_for_warnings=True))
+                self.assertEqual([issue["code"] for issue in issues], expected)
+
+    def test_validate_file_progress(self):
+        """Test that validate_file reports the progress of each table, serially and in an executor."""
+        nwbfile = self._create_multi_table_nwbfile("progress_test")
+        calls = []
+        self.validator.validate_file(nwbfile, progress=lambda *args: calls.append(args))
+        finished = sorted(call[0] for call in calls if call[2] == call[3])
+        self.assertEqual(finished, ["invalid_events", "test_events_table", "valid_events"])
+        self.assertTrue(all(call[1] is None for call in calls))
+
+        calls = []
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            self.validator.validate_file(nwbfile, executor=executor, progress=lambda *args: calls.append(args))
+        self.assertEqual(sorted(call[0] for call in calls), finished)
+
+    def test_validate_file_chunk_size(self):
+        """Test that validating each table in row blocks gives the same issues as whole tables."""
+        nwbfile = self._create_multi_table_nwbfile("chunk_test")
+        expected = self.validator.validate_file(nwbfile)
+        issues = self.validator.validate_file(nwbfile, chunk_size=1)
+        self.assertEqual(
+            [(issue.get("ec_filename"), issue.get("ec_row"), issue["code"]) for issue in issues],
+            [(issue.get("ec_filename"), issue.get("ec_row"), issue["code"]) for issue in expected],
+        )
+        with self.assertRaises(ValueError):
+            self.validator.validate_file(nwbfile, chunk_size=2, workers=2)
+        with self.assertRaises(TypeError):
+            self.validator.validate_file(nwbfile, chunksize=2)
+
+    def test_validate_file_with_threads(self):
+        """Test that validating tables in a thread pool gives the serial issues and leaves the handler unchanged."""
+        nwbfile = self._create_multi_table_nwbfile("threads_test")
+        error_handler = ErrorHandler(check_for_warnings=False)
+        all_issues = issue_signatures(self.validator.validate_file(nwbfile), self.SIGNATURE_KEYS)
+        issues = self.validator.validate_file(nwbfile, error_handler, threads=2)
+        self.assertEqual(issue_signatures(issues, self.SIGNATURE_KEYS), all_issues)
+        self.assertEqual(error_handler.error_context, [])
+        issues = self.validator.validate_file(nwbfile, threads=3, max_issues=2)
+        self.assertEqual(issue_signatures(issues, self.SIGNATURE_KEYS), all_issues[:2])
+        with self.assertRaises(ValueError):
+            self.validator.validate_file(nwbfile, threads=0)
+        with self.assertRaises(ValueError):
+            self.validator.validate_file(nwbfile, threads=2, workers=2)
+
+    def test_validate_file_cancel(self):
+        """Test that validate_file stops at the next table once cancelled and restores the error context."""
+        nwbfile = self._create_multi_table_nwbfile("cancel_test")
+        cancel = threading.Event()
+        tables = []
+
+        def progress(table_name, column_name, rows_done, total_rows):
+            if table_name not in tables:
+                tables.append(table_name)
+            cancel.set()
+
+        error_handler = ErrorHandler(check_for_warnings=False)
+        with self.assertRaises(ValidationCancelledError):
+            self.validator.validate_file(nwbfile, error_handler, progress=progress, cancel=cancel)
+        self.assertEqual(len(tables), 1)
+        self.assertEqual(error_handler.error_context, [])
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            with self.assertRaises(ValidationCancelledError):
+                self.validator.validate_file(nwbfile, error_handler, executor=executor, cancel=cancel)
+        self.assertEqual(error_handler.error_context, [])
+
+
+class TestHedNWBValidatePath(unittest.TestCase):
+    """Test class for HedNWBValidator.validate_path."""
+
+    SIGNATURE_KEYS = ("code", "message", ErrorContext.FILE_NAME, ErrorContext.ROW)
+
+    def setUp(self):
+        """Write an NWB file with HED metadata, tables with and without HED, and a categorical table."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "session.nwb")
+        nwbfile = NWBFile(
+            session_description="Test session for validate_path",
+            identifier="path_test",
+            session_start_time=datetime.now(tzlocal()),
+        )
+        nwbfile.add_lab_meta_data(
+            HedLabMetaData(hed_schema_version="8.4.0", definitions="(Definition/Go-stimulus, (Sensory-event))")
+        )
+        nwbfile.add_acquisition(
+            EventsTable(
+                name="events",
+                description="Events",
+                columns=[
+                    TimestampVectorData(name="timestamp", description="Event timestamps", data=[1.0, 2.0, 3.0]),
+                    HedTags(data=["Def/Go-stimulus", "InvalidTag1", "Def/Undefined"]),
+                ],
+            )
+        )
+        nwbfile.add_acquisition(
+            DynamicTable(
+                name="no_hed",
+                description="Table without HED",
+                columns=[VectorData(name="value", description="Values", data=[1, 2, 3])],
+            )
+        )
+        conditions = DynamicTable(
+            name="conditions",
+            description="Table with categorical HED",
+            columns=[VectorData(name="condition", description="Conditions", data=["a", "b", "a"])],
+        )
+        meanings = MeaningsTable(target=conditions["condition"], description="Condition meanings")
+        meanings.add_row(value="a", meaning="Condition A")
+        meanings.add_row(value="b", meaning="Condition B")
+        meanings.add_column(name="HED", description="HED tags", col_cls=HedTags, data=["Red", "InvalidTag2"])
+        conditions.add_meanings_table(meanings)
+        nwbfile.add_acquisition(conditions)
+        with NWBHDF5IO(self.path, "w") as io:
+            io.write(nwbfile)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_validate_path_matches_validate_file(self):
+        """Test that validate_path finds the same issues as reading the file and calling validate_file."""
+        with NWBHDF5IO(self.path, "r") as io:
+            nwbfile = io.read()
+            expected = HedNWBValidator(nwbfile.lab_meta_data["hed_schema"]).validate_file(nwbfile)
+        issues = HedNWBValidator.validate_path(self.path)
+        self.assertEqual(len(issues), 3)
+        self.assertEqual(
+            sorted(issue_signatures(issues, self.SIGNATURE_KEYS)),
+            sorted(issue_signatures(expected, self.SIGNATURE_KEYS)),
+        )
+
+    def test_validate_path_with_definitions_table(self):
+        """Test that validate_path uses definitions stored as a definitions table, ignoring the attribute next to it."""
+        expected = HedNWBValidator.validate_path(self.path)
+        with h5py.File(self.path, "r+") as h5file:
+            del h5file["general/hed_schema"].attrs["definitions"]
+        self.assertEqual(len(HedNWBValidator.validate_path(self.path)), 4)
+        with h5py.File(self.path, "r+") as h5file:
+            h5file["general/hed_schema"].create_dataset(
+                "definitions_table",
+                data=np.array(
+                    [
+                        (
+                            "go-stimulus",
+                            False,
+                            "(Sensory-event)",
+                            hashlib.sha256(b"(Definition/go-stimulus,(Sensory-event))").hexdigest(),
+                        )
+                    ],
+                    dtype=[
+                        ("name", h5py.string_dtype()),
+                        ("takes_value", bool),
+                        ("contents", h5py.string_dtype()),
+                        ("content_hash", h5py.string_dtype()),
+                    ],
+                ),
+            )
+            h5file["general/hed_schema"].attrs["definitions"] = "(Definition/go-stimulus, (InvalidTag1))"
+        issues = HedNWBValidator.validate_path(self.path)
+        self.assertEqual(
+            sorted(issue_signatures(issues, self.SIGNATURE_KEYS)),
+            sorted(issue_signatures(expected, self.SIGNATURE_KEYS)),
+        )
+
+    def test_validate_path_uses_cache(self):
+        """Test that validate_path fills the given cache and reuses it on the next run."""
+        with ValidationCache(":memory:") as cache:
+            expected = HedNWBValidator.validate_path(self.path, cache=cache)
+            self.assertGreater(len(cache), 0)
+            with mock.patch.object(
+                HedValidator, "run_basic_checks", autospec=True, side_effect=HedValidator.run_basic_checks
+            ) as run_basic_checks:
+                issues = HedNWBValidator.validate_path(self.path, cache=cache)
+            checked = [str(call.args[1]) for call in run_basic_checks.call_args_list]
+        # Only the metadata definitions are parsed (and checked) again; no table cell is.
+        self.assertEqual(checked, ["(Definition/go-stimulus,(Sensory-event))"])
+        self.assertEqual(issue_signatures(issues, self.SIGNATURE_KEYS), issue_signatures(expected, self.SIGNATURE_KEYS))
+
+    def test_validate_path_constructs_only_hed_tables(self):
+        """Test that only the tables with HED are constructed."""
+        constructed = []
+        get_container = NWBHDF5IO.get_container
+
+        def record(io, h5obj):
+            constructed.append(h5obj.name)
+            return get_container(io, h5obj)
+
+        with mock.patch.object(NWBHDF5IO, "get_container", autospec=True, side_effect=record):
+            with mock.patch.object(NWBHDF5IO, "read") as read:
+                HedNWBValidator.validate_path(self.path)
+        read.assert_not_called()
+        self.assertEqual(sorted(constructed), ["/acquisition/conditions", "/acquisition/events"])
+
+    def test_validate_path_options(self):
+        """Test that validate_path passes the validate_file options on."""
+        error_handler = ErrorHandler(check_for_warnings=False)
+        issues = HedNWBValidator.validate_path(self.path, error_handler, max_issues=1)
+        self.assertEqual(len(issues), 1)
+        self.assertEqual(error_handler.error_context, [])
+        calls = []
+        HedNWBValidator.validate_path(self.path, progress=lambda *args: calls.append(args))
+        self.assertEqual(sorted({call[0] for call in calls}), ["conditions", "events"])
+
+    def test_validate_path_without_hed_tables(self):
+        """Test that a file without tables with HED is checked without constructing any container."""
+        nwbfile = NWBFile(
+            session_description="Test session without HED tables",
+            identifier="no_hed_tables",
+            session_start_time=datetime.now(tzlocal()),
+        )
+        nwbfile.add_lab_meta_data(HedLabMetaData(hed_schema_version="8.4.0"))
+        path = os.path.join(self.temp_dir.name, "no_hed_tables.nwb")
+        with NWBHDF5IO(path, "w") as io:
+            io.write(nwbfile)
+        with mock.patch.object(NWBHDF5IO, "read_builder") as read_builder:
+            self.assertEqual(HedNWBValidator.validate_path(path), [])
+        read_builder.assert_not_called()
+
+    def test_validate_path_without_hed_metadata(self):
+        """Test that a file without HedLabMetaData raises HedFileError."""
+        nwbfile = NWBFile(
+            session_description="Test session without HED metadata",
+            identifier="no_hed_metadata",
+            session_start_time=datetime.now(tzlocal()),
+        )
+        path = os.path.join(self.temp_dir.name, "no_hed_metadata.nwb")
+        with NWBHDF5IO(path, "w") as io:
+            io.write(nwbfile)
+        with self.assertRaises(HedFileError):
+            HedNWBValidator.validate_path(path)
+
+
+class TestHedNWBFileValidatorAsync(unittest.IsolatedAsyncioTestCase):
+    """Test class for the asyncio validation methods of HedNWBValidator."""
+
+    def setUp(self):
+        """Set up a validator."""
+        self.validator = HedNWBValidator(HedLabMetaData(hed_schema_version="8.4.0"))
+
+    @staticmethod
+    def _create_nwbfile(identifier, hed_strings):
+        """Helper method to create an NWB file with one table holding the given HED strings."""
+        nwbfile = NWBFile(
+            session_description="Test session for async validation",
+            identifier=identifier,
+            session_start_time=datetime.now(tzlocal()),
+        )
+        nwbfile.add_lab_meta_data(HedLabMetaData(hed_schema_version="8.4.0"))
+        table = DynamicTable(name="trials", description="Trials", columns=[HedTags(data=hed_strings)])
+        nwbfile.add_acquisition(table)
+        return nwbfile
+
+    async def test_validate_file_async_matches_sync(self):
+        """Test that validate_file_async returns the issues of validate_file."""
+        nwbfile = self._create_nwbfile("async_file", ["Red", "InvalidTag1", "Blue"])
+        expected = self.validator.validate_file(nwbfile)
+        issues = await self.validator.validate_file_async(nwbfile, max_issues=5)
+        self.assertEqual(len(expected), 1)
+        self.assertEqual([issue["code"] for issue in issues], [issue["code"] for issue in expected])
+
+    async def test_validate_table_async(self):
+        """Test that validate_table_async forwards keyword arguments to validate_table."""
+        nwbfile = self._create_nwbfile("async_table", ["InvalidTag1", "Red", "InvalidTag2"])
+        table = nwbfile.acquisition["trials"]
+        issues = await self.validator.validate_table_async(table, rows=slice(1, 3))
+        self.assertEqual([issue["ec_row"] for issue in issues], [2])
+
+    async def test_validate_files_async_limits_concurrency(self):
+        """Test that validate_files_async runs at most max_concurrency validations at once, in order."""
+        nwbfiles = [self._create_nwbfile(f"file{index}", [f"InvalidTag{index}"]) for index in range(6)]
+        running = []
+        peak = []
+        lock = threading.Lock()
+        validate_file = self.validator.validate_file
+
+        def slow_validate_file(nwbfile, error_handler=None, **kwargs):
+            with lock:
+                running.append(nwbfile)
+                peak.append(len(running))
+            time.sleep(0.05)
+            try:
+                return validate_file(nwbfile, error_handler, **kwargs)
+            finally:
+                with lock:
+                    running.remove(nwbfile)
+
+        with mock.patch.object(self.validator, "validate_file", side_effect=slow_validate_file):
+            results = await self.validator.validate_files_async(nwbfiles, max_concurrency=2)
+        self.assertLessEqual(max(peak), 2)
+        for index, issues in enumerate(results):
+            self.assertIn(f"InvalidTag{index}", issues[0]["message"])
+
+    async def test_validate_file_async_does_not_block_loop(self):
+        """Test that the event loop keeps running while a file is validated."""
+        nwbfile = self._create_nwbfile("async_loop", [f"InvalidTag{index}" for index in range(300)])
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        ticker_task = asyncio.create_task(ticker())
+        await self.validator.validate_file_async(nwbfile)
+        ticker_task.cancel()
+        self.assertGreater(ticks, 1)
+
+    async def test_validate_files_async_invalid_concurrency(self):
+        """Test that a non-positive max_concurrency is rejected."""
+        with self.assertRaises(ValueError):
+            await self.validator.validate_files_async([], max_concurrency=0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -2,13 +2,26 @@
 Unit tests for HedNWBValidator class.
 """
 
+import multiprocessing
+import os
+import tempfile
+import threading
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+import h5py
+import numpy as np
 import pandas as pd
 from pynwb.core import DynamicTable, VectorData
 from ndx_hed import HedTags, HedLabMetaData, HedValueVector
-from ndx_hed.utils.hed_nwb_validator import HedNWBValidator
-from ndx_hed.utils.bids2nwb import get_events_table
-from hed.errors import ErrorHandler
+from ndx_hed.utils import hed_nwb_validator, worker_pool
+from ndx_hed.utils.hed_nwb_validator import HedNWBValidator, ValidationCancelledError
+from ndx_hed.utils.spreadsheet_validators import BlockSpreadsheetValidator
+from ndx_hed.utils.validation_monitor import MonitoredErrorHandler
+from ndx_hed.utils.bids2nwb import get_events_table, get_hed_tabular
+from hed.errors import ErrorHandler, ErrorContext
+from hed.models import HedString, Sidecar
+from .issue_utils import issue_signatures
 
 
 class TestHedNWBValidatorInit(unittest.TestCase):
@@ -149,6 +162,28 @@ class TestValidateHedTagsVector(unittest.TestCase):
         self.assertIsInstance(issues, list)
         self.assertEqual(len(issues), 0)
 
+    def test_validate_vector_repeated_strings_validated_once(self):
+        """Test that each distinct string is parsed once and its issues are reported for every row."""
+        repeated_tags = HedTags(data=["InvalidTag123", "Sensory-event", "InvalidTag123", "n/a", "InvalidTag123"])
+        with mock.patch("ndx_hed.utils.hed_nwb_validator.HedString", wraps=HedString) as hed_string:
+            issues = self.validator.validate_vector(repeated_tags)
+
+        self.assertEqual(hed_string.call_count, 2)
+        self.assertEqual([issue[ErrorContext.ROW] for issue in issues], [0, 2, 4])
+        self.assertEqual({issue["code"] for issue in issues}, {issues[0]["code"]})
+
+    def test_validate_vector_repeated_strings_match_context(self):
+        """Test that fanned-out issues carry the same context as directly validated ones."""
+        error_handler = ErrorHandler(check_for_warnings=False)
+        error_handler.push_error_context(ErrorContext.COLUMN, "HED")
+        issues = self.validator.validate_vector(HedTags(data=["BadTag/WithSlash"] * 3), error_handler)
+
+        self.assertEqual(len(issues), 3)
+        for row, issue in enumerate(issues):
+            self.assertEqual(issue[ErrorContext.ROW], row)
+            self.assertEqual(issue[ErrorContext.COLUMN], "HED")
+            self.assertEqual(issue["message"], issues[0]["message"])
+
 
 class TestValidateTable(unittest.TestCase):
     """Test class for validating DynamicTable objects."""
@@ -354,6 +389,13 @@ class TestValidateEventsTable(unittest.TestCase):
         # Should have no issues for valid events table
         # Note: May fail initially until HED tags are corrected
 
+    def test_validate_events_reads_only_hed_columns(self):
+        """Test that assembled validation does not convert the whole table to a DataFrame."""
+        with mock.patch.object(DynamicTable, "to_dataframe") as to_dataframe:
+            issues = self.validator.validate_events(self.invalid_events_table)
+        to_dataframe.assert_not_called()
+        self.assertEqual(len(issues), 3)
+
     def test_validate_events_invalid_table(self):
         """Test validate_events with invalid EventsTable."""
         issues = self.validator.validate_events(self.invalid_events_table)
@@ -701,6 +743,785 @@ class TestValidateHedValueVector(unittest.TestCase):
         self.assertIn("found 2", str(cm.exception))
         self.assertIn("multi", str(cm.exception))
 
+    def test_validate_value_vector_fast_path_matches_full_parse(self):
+        """Test that the template fast path reports the same issues as full per-row parsing."""
+        values = [0.5, -1, 3, 1e20, "abc", "a,b", "(x", "0.5 s", " 2", "n/a", None, float("nan"), "abc", 3]
+        for template in ["(Item-count/#, Sensory-event)", "Label/#", "(Age/#, Agent)", "Parameter-value/#"]:
+            with self.subTest(template=template):
+                hed_values = HedValueVector(name="values", description="Mixed values", data=values, hed=template)
+                fast_issues = self.validator.validate_value_vector(hed_values)
+                full_issues = self.validator.validate_value_vector(hed_values, template_fast_path=False)
+                self.assertEqual(
+                    [(issue[ErrorContext.ROW], issue["code"], issue["message"]) for issue in fast_issues],
+                    [(issue[ErrorContext.ROW], issue["code"], issue["message"]) for issue in full_issues],
+                )
+
+    def test_validate_value_vector_fast_path_repeated_tag(self):
+        """Test that values making the placeholder tag a repeat of another template tag are reported."""
+        cases = [
+            ("Label/#, Label/foo", ["foo", "Foo", "bar"]),
+            ("(Label/#, Label/foo)", ["foo", "bar"]),
+            ("Item-count/#, Item-count/3", [3, 4]),
+            ("(Label/#, Item), (Label/foo, Item)", ["foo", "bar"]),
+        ]
+        for template, values in cases:
+            with self.subTest(template=template):
+                hed_values = HedValueVector(name="values", description="Values", data=values, hed=template)
+                fast_issues = self.validator.validate_value_vector(hed_values)
+                full_issues = self.validator.validate_value_vector(hed_values, template_fast_path=False)
+                self.assertTrue(fast_issues)
+                self.assertEqual(
+                    [(issue[ErrorContext.ROW], issue["code"]) for issue in fast_issues],
+                    [(issue[ErrorContext.ROW], issue["code"]) for issue in full_issues],
+                )
+
+    def test_validate_value_vector_fast_path_numpy_data(self):
+        """Test that numeric NumPy data only parses the template and the values that fail the check."""
+        data = np.array([1.0, 2.0, np.nan, 1.0, 1e20, 2.0])
+        hed_values = HedValueVector(name="counts", description="Counts", data=data, hed="(Item-count/#, Item)")
+        with mock.patch("ndx_hed.utils.hed_nwb_validator.HedString", wraps=HedString) as hed_string:
+            issues = self.validator.validate_value_vector(hed_values)
+        full_issues = self.validator.validate_value_vector(hed_values, template_fast_path=False)
+
+        self.assertEqual(hed_string.call_count, 1)
+        self.assertEqual(len(issues), len(full_issues))
+
+        data[1] = -3.5
+        data[5] = -3.5
+        issues = self.validator.validate_value_vector(hed_values)
+        full_issues = self.validator.validate_value_vector(hed_values, template_fast_path=False)
+        self.assertEqual(
+            [issue[ErrorContext.ROW] for issue in issues], [issue[ErrorContext.ROW] for issue in full_issues]
+        )
+
+    def test_validate_value_vector_fast_path_definition_template(self):
+        """Test that templates with the placeholder in a Def tag are always fully parsed."""
+        metadata = HedLabMetaData(hed_schema_version="8.4.0", definitions="(Definition/Level/#, (Label/#, Item))")
+        validator = HedNWBValidator(metadata)
+        hed_values = HedValueVector(name="level", description="Levels", data=["low", "a,b"], hed="Def/Level/#")
+        issues = validator.validate_value_vector(hed_values)
+        full_issues = validator.validate_value_vector(hed_values, template_fast_path=False)
+        self.assertEqual([issue["code"] for issue in issues], [issue["code"] for issue in full_issues])
+
+
+class TestValidateChunkedData(unittest.TestCase):
+    """Test class for block-by-block validation of HDF5-backed columns."""
+
+    SIGNATURE_KEYS = (ErrorContext.ROW, "code", "message")
+
+    def setUp(self):
+        """Set up an HDF5 file holding a string column and a numeric column."""
+        self.validator = HedNWBValidator(HedLabMetaData(hed_schema_version="8.4.0"))
+        self.hed_strings = ["Sensory-event", "InvalidTag123", "n/a", "Red, Blue", "", "InvalidTag123"] * 3 + ["Red"]
+        self.values = [1.0, 2.5, float("nan"), 1e20, 2.5, 3.0] * 3 + [4.0]
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.h5_file = h5py.File(os.path.join(self.temp_dir.name, "columns.h5"), "w")
+        self.h5_file.create_dataset("hed", data=self.hed_strings, dtype=h5py.string_dtype(), chunks=(4,))
+        self.h5_file.create_dataset("values", data=self.values, chunks=(4,))
+
+    def tearDown(self):
+        """Close and remove the HDF5 file."""
+        self.h5_file.close()
+        self.temp_dir.cleanup()
+
+    def test_iter_blocks_aligned_to_hdf5_chunks(self):
+        """Test that HDF5 data is read in decoded blocks rounded to the dataset chunking."""
+        blocks = list(HedNWBValidator._iter_blocks(self.h5_file["hed"], chunk_size=5))
+        self.assertEqual([(start, len(block)) for start, block in blocks], [(0, 4), (4, 4), (8, 4), (12, 4), (16, 3)])
+        self.assertEqual([value for _, block in blocks for value in block], self.hed_strings)
+
+    def test_iter_blocks_in_memory(self):
+        """Test that in-memory data is a single block unless a chunk size is given."""
+        self.assertEqual(list(HedNWBValidator._iter_blocks(self.hed_strings)), [(0, self.hed_strings)])
+        blocks = list(HedNWBValidator._iter_blocks(self.hed_strings, chunk_size=8))
+        self.assertEqual([start for start, _ in blocks], [0, 8, 16])
+
+    def test_validate_vector_hdf5_matches_in_memory(self):
+        """Test that validating an HDF5-backed HedTags column in blocks matches in-memory validation."""
+        expected = self.validator.validate_vector(HedTags(data=self.hed_strings))
+        for chunk_size in (None, 1, 5, 100):
+            with self.subTest(chunk_size=chunk_size):
+                issues = self.validator.validate_vector(HedTags(data=self.h5_file["hed"]), chunk_size=chunk_size)
+                self.assertEqual(
+                    issue_signatures(issues, self.SIGNATURE_KEYS), issue_signatures(expected, self.SIGNATURE_KEYS)
+                )
+
+    def test_validate_value_vector_hdf5_matches_in_memory(self):
+        """Test that validating an HDF5-backed HedValueVector in blocks matches in-memory validation."""
+        template = "(Label/#, Item)"  # nameClass values cannot contain "."
+        expected = self.validator.validate_value_vector(
+            HedValueVector(name="counts", description="Counts", data=np.array(self.values), hed=template)
+        )
+        self.assertGreater(len(expected), 0)
+        hed_values = HedValueVector(name="counts", description="Counts", data=self.h5_file["values"], hed=template)
+        for template_fast_path in (True, False):
+            with self.subTest(template_fast_path=template_fast_path):
+                issues = self.validator.validate_value_vector(
+                    hed_values, template_fast_path=template_fast_path, chunk_size=5
+                )
+                self.assertEqual(
+                    issue_signatures(issues, self.SIGNATURE_KEYS), issue_signatures(expected, self.SIGNATURE_KEYS)
+                )
+
+
+class TestValidateNewRows(unittest.TestCase):
+    """Test class for incremental validation of columns that grow by appending rows."""
+
+    def setUp(self):
+        """Set up a validator with a definition and a growing table."""
+        self.hed_metadata = HedLabMetaData(
+            hed_schema_version="8.4.0", definitions="(Definition/Go-stimulus, (Sensory-event, Visual-presentation))"
+        )
+        self.validator = HedNWBValidator(self.hed_metadata)
+        self.table = DynamicTable(
+            name="trials",
+            description="Trials",
+            columns=[
+                HedTags(data=["Def/Go-stimulus", "InvalidTag123"]),
+                HedValueVector(name="label", description="Labels", data=["a", "b,c"], hed="Label/#"),
+            ],
+        )
+
+    @staticmethod
+    def _rows(issues):
+        return [issue[ErrorContext.ROW] for issue in issues]
+
+    def test_iter_blocks_from_start_row(self):
+        """Test that blocks can start and stop within the data."""
+        data = list(range(10))
+        self.assertEqual(list(HedNWBValidator._iter_blocks(data, start=7)), [(7, [7, 8, 9])])
+        blocks = list(HedNWBValidator._iter_blocks(data, chunk_size=4, start=3, stop=9))
+        self.assertEqual(blocks, [(3, [3]), (4, [4, 5, 6, 7]), (8, [8])])
+
+    def test_only_appended_rows_are_validated(self):
+        """Test that each call validates and reports only the rows added since the previous call."""
+        hed_tags = self.table["HED"]
+        self.assertEqual(self._rows(self.validator.validate_new_rows(hed_tags)), [1])
+        self.assertEqual(self.validator.validate_new_rows(hed_tags), [])
+
+        self.table.add_row(HED="Red, InvalidTag123", label="d")
+        self.table.add_row(HED="Blue", label="e")
+        with mock.patch("ndx_hed.utils.hed_nwb_validator.HedString", wraps=HedString) as hed_string:
+            issues = self.validator.validate_new_rows(hed_tags)
+        self.assertEqual(self._rows(issues), [2])
+        self.assertEqual(hed_string.call_count, 2)
+        self.assertEqual(hed_tags.get_validated_rows(self.validator._validation_state()), 4)
+
+    def test_definition_change_revalidates_column(self):
+        """Test that adding definitions resets the validated mark."""
+        hed_tags = HedTags(data=["Def/Stop-stimulus", "Red"])
+        self.assertEqual(self._rows(self.validator.validate_new_rows(hed_tags)), [0])
+        self.hed_metadata.add_definitions("(Definition/Stop-stimulus, (Sensory-event, Auditory-presentation))")
+        with mock.patch("ndx_hed.utils.hed_nwb_validator.HedString", wraps=HedString) as hed_string:
+            self.assertEqual(self.validator.validate_new_rows(hed_tags), [])
+        self.assertEqual(hed_string.call_count, 2)
+
+    def test_reset_validation(self):
+        """Test that reset_validation causes the whole column to be validated again."""
+        hed_tags = self.table["HED"]
+        self.validator.validate_new_rows(hed_tags)
+        hed_tags.reset_validation()
+        self.assertEqual(self._rows(self.validator.validate_new_rows(hed_tags)), [1])
+
+    def test_value_vector_appended_rows(self):
+        """Test incremental validation of a HedValueVector."""
+        hed_values = self.table["label"]
+        self.assertEqual(self._rows(self.validator.validate_new_rows(hed_values)), [1])
+        self.table.add_row(HED="Red", label="x,y")
+        self.table.add_row(HED="Red", label="z")
+        self.assertEqual(self._rows(self.validator.validate_new_rows(hed_values)), [2])
+        self.assertEqual(self.validator.validate_new_rows(hed_values), [])
+
+    def test_value_vector_invalid_template_does_not_advance(self):
+        """Test that template errors are reported on every call and no rows are marked as validated."""
+        hed_values = HedValueVector(name="label", description="Labels", data=["a"], hed="InvalidTag/#")
+        self.assertGreater(len(self.validator.validate_new_rows(hed_values)), 0)
+        self.assertGreater(len(self.validator.validate_new_rows(hed_values)), 0)
+        self.assertEqual(hed_values.get_validated_rows(self.validator._validation_state() + (hed_values.hed,)), 0)
+
+    def test_invalid_column(self):
+        """Test that columns without HED are rejected."""
+        with self.assertRaises(ValueError):
+            self.validator.validate_new_rows(VectorData(name="plain", description="Plain", data=[1, 2]))
+
+
+class TestValidateIssueBudget(unittest.TestCase):
+    """Test class for the max_issues and stop_on_first_error options."""
+
+    SIGNATURE_KEYS = (ErrorContext.COLUMN, ErrorContext.ROW, "code")
+
+    def setUp(self):
+        """Set up a validator and columns with several invalid rows."""
+        self.validator = HedNWBValidator(HedLabMetaData(hed_schema_version="8.4.0"))
+        self.hed_tags = HedTags(data=["Red", "InvalidTag1", "Item/Blue-x", "InvalidTag2", "Red, (Blue", "InvalidTag1"])
+        self.hed_values = HedValueVector(name="label", description="Labels", data=["a", "b,c", "d,e"], hed="Label/#")
+
+    def test_vector_max_issues(self):
+        """Test that validate_vector returns the leading max_issues issues and stops parsing rows."""
+        all_issues = issue_signatures(self.validator.validate_vector(self.hed_tags), self.SIGNATURE_KEYS)
+        self.assertEqual(len(all_issues), 4)
+        for max_issues in (1, 2, 4, 10):
+            with self.subTest(max_issues=max_issues):
+                issues = self.validator.validate_vector(self.hed_tags, max_issues=max_issues)
+                self.assertEqual(issue_signatures(issues, self.SIGNATURE_KEYS), all_issues[:max_issues])
+
+        with mock.patch("ndx_hed.utils.hed_nwb_validator.HedString", wraps=HedString) as hed_string:
+            self.validator.validate_vector(self.hed_tags, max_issues=1)
+        self.assertEqual(hed_string.call_count, 2)
+
+    def test_stop_on_first_error_skips_past_warnings(self):
+        """Test that warnings before the first error are kept and nothing after it is returned."""
+        hed_tags = HedTags(data=["Item/Blue-x", "InvalidTag1", "InvalidTag2"])
+        issues = self.validator.validate_vector(
+            hed_tags, ErrorHandler(check_for_warnings=True), stop_on_first_error=True
+        )
+        self.assertEqual([issue[ErrorContext.ROW] for issue in issues], [0, 1])
+        self.assertEqual(issues[-1]["code"], "TAG_INVALID")
+
+    def test_value_vector_budget(self):
+        """Test the issue budget on a HedValueVector."""
+        all_issues = self.validator.validate_value_vector(self.hed_values)
+        self.assertEqual(len(all_issues), 2)
+        issues = self.validator.validate_value_vector(self.hed_values, stop_on_first_error=True)
+        self.assertEqual(
+            issue_signatures(issues, self.SIGNATURE_KEYS), issue_signatures(all_issues[:1], self.SIGNATURE_KEYS)
+        )
+
+    def test_table_budget_spans_columns(self):
+        """Test that validate_table shares one budget across its columns."""
+        hed_values = HedValueVector(
+            name="label", description="Labels", data=["a", "b,c", "d,e", "f", "g", "h"], hed="Label/#"
+        )
+        table = DynamicTable(name="trials", description="Trials", columns=[hed_values, self.hed_tags])
+        all_issues = issue_signatures(self.validator.validate_table(table), self.SIGNATURE_KEYS)
+        for max_issues in (1, 2, 3, 5):
+            with self.subTest(max_issues=max_issues):
+                issues = self.validator.validate_table(table, max_issues=max_issues)
+                self.assertEqual(issue_signatures(issues, self.SIGNATURE_KEYS), all_issues[:max_issues])
+
+    def test_events_budget(self):
+        """Test that assembled validation of an EventsTable stops within the table."""
+        events = get_events_table(
+            "events",
+            "Events",
+            pd.DataFrame({"onset": [0.0, 1.0, 2.0, 3.0], "HED": ["Red", "InvalidTag1", "InvalidTag2", "InvalidTag3"]}),
+            {"categorical": {}, "value": {}},
+        )
+        all_issues = self.validator.validate_events(events)
+        self.assertEqual(len(all_issues), 3)
+        issues = self.validator.validate_events(events, max_issues=2)
+        self.assertEqual(
+            [issue[ErrorContext.ROW] for issue in issues], [issue[ErrorContext.ROW] for issue in all_issues[:2]]
+        )
+
+    def test_invalid_max_issues(self):
+        """Test that a non-positive max_issues is rejected."""
+        with self.assertRaises(ValueError):
+            self.validator.validate_vector(self.hed_tags, max_issues=0)
+        with self.assertRaises(ValueError):
+            self.validator.validate_value_vector(self.hed_values, max_issues=-1)
+
+
+class TestValidateProgressAndCancel(unittest.TestCase):
+    """Test class for progress reporting and cooperative cancellation."""
+
+    def setUp(self):
+        """Set up a validator and a table with a HedTags and a HedValueVector column."""
+        self.validator = HedNWBValidator(HedLabMetaData(hed_schema_version="8.4.0"))
+        self.hed_tags = HedTags(data=["Red", "InvalidTag1", "Blue", "Green", "InvalidTag2"])
+        self.hed_values = HedValueVector(
+            name="label", description="Labels", data=["a", "b,c", "d", "e", "f"], hed="Label/#"
+        )
+        self.table = DynamicTable(name="trials", description="Trials", columns=[self.hed_tags, self.hed_values])
+
+    def test_vector_progress(self):
+        """Test that validate_vector reports the rows done after each block."""
+        calls = []
+        issues = self.validator.validate_vector(self.hed_tags, chunk_size=2, progress=lambda *args: calls.append(args))
+        self.assertEqual(len(issues), 2)
+        self.assertEqual(calls, [("trials", "HED", done, 5) for done in (0, 2, 4, 5)])
+
+    def test_progress_follows_row_selection(self):
+        """Test that progress counts only the selected rows."""
+        calls = []
+        self.validator.validate_vector(self.hed_tags, rows=[0, 3, 4], progress=lambda *args: calls.append(args))
+        self.assertEqual([call[2:] for call in calls], [(0, 3), (3, 3)])
+
+    def test_table_progress_per_column(self):
+        """Test that validate_table reports progress for each column."""
+        calls = []
+        self.validator.validate_table(self.table, progress=lambda *args: calls.append(args))
+        self.assertEqual(
+            calls,
+            [("trials", "HED", 0, 5), ("trials", "HED", 5, 5), ("trials", "label", 0, 5), ("trials", "label", 5, 5)],
+        )
+
+    def test_cancel_before_start(self):
+        """Test that a set cancellation token stops validation before any row is validated."""
+        cancel = threading.Event()
+        cancel.set()
+        with mock.patch("ndx_hed.utils.hed_nwb_validator.HedString", wraps=HedString) as hed_string:
+            with self.assertRaises(ValidationCancelledError):
+                self.validator.validate_vector(self.hed_tags, cancel=cancel)
+        hed_string.assert_not_called()
+
+    def test_cancel_between_chunks(self):
+        """Test that cancellation is checked between blocks of rows."""
+        cancel = threading.Event()
+
+        def progress(table_name, column_name, rows_done, total_rows):
+            if rows_done >= 2:
+                cancel.set()
+
+        with mock.patch("ndx_hed.utils.hed_nwb_validator.HedString", wraps=HedString) as hed_string:
+            with self.assertRaises(ValidationCancelledError):
+                self.validator.validate_vector(self.hed_tags, chunk_size=2, progress=progress, cancel=cancel)
+        self.assertEqual(hed_string.call_count, 2)
+
+    def test_cancel_table_restores_error_context(self):
+        """Test that a cancelled validate_table leaves the error handler's context as it was."""
+        cancel = threading.Event()
+        error_handler = ErrorHandler(check_for_warnings=False)
+        error_handler.push_error_context(ErrorContext.FILE_NAME, "session.nwb")
+
+        def progress(table_name, column_name, rows_done, total_rows):
+            if column_name == "label":
+                cancel.set()
+
+        with self.assertRaises(ValidationCancelledError):
+            self.validator.validate_table(self.table, error_handler, progress=progress, cancel=cancel)
+        self.assertEqual(error_handler.error_context, [(ErrorContext.FILE_NAME, "session.nwb")])
+
+    def test_events_progress_and_cancel(self):
+        """Test progress and cancellation of assembled EventsTable validation."""
+        events = get_events_table(
+            "events",
+            "Events",
+            pd.DataFrame({"onset": [0.0, 1.0, 2.0, 3.0], "HED": ["Red", "InvalidTag1", "Blue", "InvalidTag2"]}),
+            {"categorical": {}, "value": {}},
+        )
+        calls = []
+        issues = self.validator.validate_events(events, progress=lambda *args: calls.append(args))
+        self.assertEqual(issues, self.validator.validate_events(events))
+        self.assertEqual(calls[0], ("events", None, 0, 4))
+        self.assertEqual(calls[-1], ("events", None, 4, 4))
+
+        cancel = threading.Event()
+        cancel.set()
+        with self.assertRaises(ValidationCancelledError):
+            self.validator.validate_events(events, cancel=cancel)
+
+        calls = []
+        with mock.patch.object(MonitoredErrorHandler, "PROGRESS_INTERVAL", 1):
+            self.validator.validate_events(events, progress=lambda *args: calls.append(args))
+        self.assertEqual(calls, [("events", None, done, 4) for done in range(5)])
+
+
+class TestValidateRowsAndColumns(unittest.TestCase):
+    """Test class for validating a subset of the rows and columns of a table."""
+
+    SIGNATURE_KEYS = (ErrorContext.COLUMN, ErrorContext.ROW, "code")
+
+    def setUp(self):
+        """Set up a validator and an EventsTable with HED, value, and categorical columns."""
+        self.validator = HedNWBValidator(HedLabMetaData(hed_schema_version="8.4.0"))
+        self.hed_strings = ["Red", "InvalidTag1", "n/a", "Blue", "InvalidTag2", "Green", "InvalidTag3", "Red"]
+        self.events = get_events_table(
+            "events",
+            "Events",
+            pd.DataFrame({
+                "onset": [float(index) for index in range(8)],
+                "label": ["a", "b,c", "d", "e,f", "g", "h", "i,j", "k"],
+                "condition": ["go", "stop", "go", "stop", "go", "go", "stop", "go"],
+                "HED": self.hed_strings,
+            }),
+            {
+                "categorical": {"condition": {"HED": {"go": "Sensory-event", "stop": "InvalidTagStop"}}},
+                "value": {"label": "Label/#"},
+            },
+        )
+
+    def test_vector_rows(self):
+        """Test that validate_vector with a row selection returns the full-column issues of those rows."""
+        hed_tags = HedTags(data=self.hed_strings)
+        all_issues = issue_signatures(self.validator.validate_vector(hed_tags), self.SIGNATURE_KEYS)
+        for rows, selected in (
+            (slice(2, 6), {2, 3, 4, 5}),
+            (slice(None, None, 3), {0, 3, 6}),
+            ([6, 1, -1, 1], {1, 6, 7}),
+            (np.array([True, False] * 4), {0, 2, 4, 6}),
+        ):
+            with self.subTest(rows=rows):
+                issues = self.validator.validate_vector(hed_tags, rows=rows, chunk_size=3)
+                expected = [signature for signature in all_issues if signature[1] in selected]
+                self.assertEqual(issue_signatures(issues, self.SIGNATURE_KEYS), expected)
+
+    def test_vector_rows_hdf5(self):
+        """Test that selected rows of an HDF5-backed column are read and validated."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with h5py.File(os.path.join(temp_dir, "rows.h5"), "w") as h5_file:
+                h5_file.create_dataset("hed", data=self.hed_strings, dtype=h5py.string_dtype(), chunks=(2,))
+                hed_tags = HedTags(data=h5_file["hed"])
+                issues = self.validator.validate_vector(hed_tags, rows=[0, 4, 6])
+                self.assertEqual([issue[ErrorContext.ROW] for issue in issues], [4, 6])
+                issues = self.validator.validate_vector(hed_tags, rows=slice(3, 5))
+                self.assertEqual([issue[ErrorContext.ROW] for issue in issues], [4])
+
+    def test_value_vector_rows(self):
+        """Test row selection on a HedValueVector."""
+        hed_values = self.events["label"]
+        issues = self.validator.validate_value_vector(hed_values, rows=slice(2, 8))
+        self.assertEqual([issue[ErrorContext.ROW] for issue in issues], [3, 6])
+
+    def test_table_rows_and_columns(self):
+        """Test that validate_table validates only the selected columns and rows."""
+        issues = self.validator.validate_table(self.events, columns=["label"], rows=[0, 1, 2])
+        self.assertEqual(issue_signatures(issues, self.SIGNATURE_KEYS), [("label", 1, "TAG_INVALID")])
+        with self.assertRaises(ValueError):
+            self.validator.validate_table(self.events, columns=["missing"])
+        with self.assertRaises(ValueError):
+            self.validator.validate_table(self.events, rows=[8])
+
+    def test_events_rows_match_full_table(self):
+        """Test that assembled validation of a row range reports the full-table row numbers."""
+        all_issues = issue_signatures(self.validator.validate_events(self.events), self.SIGNATURE_KEYS)
+        offset = HedNWBValidator.TABULAR_ROW_OFFSET
+        for rows in (slice(3, 7), [1, 4, 6]):
+            with self.subTest(rows=rows):
+                selected = set(range(8)[rows] if isinstance(rows, slice) else rows)
+                issues = self.validator.validate_events(self.events, rows=rows)
+                expected = [signature for signature in all_issues if signature[1] - offset in selected]
+                self.assertGreater(len(expected), 0)
+                self.assertEqual(issue_signatures(issues, self.SIGNATURE_KEYS), expected)
+
+    def test_events_columns(self):
+        """Test that assembled validation of a column subset only reports issues of those columns."""
+        issues = self.validator.validate_events(self.events, columns=["condition"])
+        self.assertGreater(len(issues), 0)
+        self.assertEqual({issue.get(ErrorContext.COLUMN) for issue in issues}, {"condition"})
+        with mock.patch.object(DynamicTable, "to_dataframe") as to_dataframe:
+            self.validator.validate_events(self.events, rows=slice(0, 2), columns=["HED"])
+        to_dataframe.assert_not_called()
+
+
+class TestValidateEventsInBlocks(unittest.TestCase):
+    """Test class for validating an EventsTable in blocks of rows with validate_events(chunk_size=...)."""
+
+    SIGNATURE_KEYS = (ErrorContext.COLUMN, ErrorContext.ROW, "code")
+
+    def setUp(self):
+        """Set up an EventsTable whose temporal and categorical issues span several rows."""
+        self.validator = HedNWBValidator(
+            HedLabMetaData(
+                hed_schema_version="8.4.0",
+                definitions="(Definition/Trial, (Sensory-event)), (Definition/Rest, (Rest))",
+            )
+        )
+        self.events = get_events_table(
+            "events",
+            "Events",
+            pd.DataFrame({
+                "onset": [0.0, 1.0, 1.0, 2.0, 3.0, 4.0, 5.0, 5.0, 6.0, 7.0],
+                "condition": ["go", "stop", "oops", "go", "go", "bad", "go", "go", "stop", "go"],
+                "HED": [
+                    "(Def/Trial, Onset)",
+                    "Red",
+                    "(Def/Rest, Onset)",
+                    "InvalidTag1",
+                    "(Def/Trial, Offset)",
+                    "(Def/Trial, Offset)",
+                    "(Def/Trial, Onset)",
+                    "(Def/Trial, Onset)",
+                    "Green",
+                    "(Def/Rest, Offset)",
+                ],
+            }),
+            {
+                "categorical": {
+                    "condition": {"HED": {"go": "Sensory-event", "stop": "Agent-action", "unused": "InvalidTagU"}}
+                },
+                "value": {},
+            },
+        )
+
+    def test_blocks_match_whole_table(self):
+        """Test that every block size gives the issues of the whole table, in the same order."""
+        expected = issue_signatures(
+            self.validator.validate_events(self.events, error_handler=ErrorHandler(check_for_warnings=True)),
+            self.SIGNATURE_KEYS,
+        )
+        self.assertIn(("condition", None, "SIDECAR_KEY_MISSING"), expected)
+        self.assertIn((None, 7, "TEMPORAL_TAG_ERROR"), expected)
+        for chunk_size in range(1, 12):
+            with self.subTest(chunk_size=chunk_size):
+                issues = self.validator.validate_events(
+                    self.events, error_handler=ErrorHandler(check_for_warnings=True), chunk_size=chunk_size
+                )
+                self.assertEqual(issue_signatures(issues, self.SIGNATURE_KEYS), expected)
+
+    def test_blocks_are_read_separately(self):
+        """Test that only one block of rows is read at a time and that equal onsets stay in one block."""
+        with mock.patch(
+            "ndx_hed.utils.hed_nwb_validator.get_hed_tabular", wraps=get_hed_tabular
+        ) as mocked_get_hed_tabular:
+            self.validator.validate_events(self.events, chunk_size=3)
+        blocks = [call.args[1] for call in mocked_get_hed_tabular.call_args_list if len(call.args) > 1]
+        self.assertEqual(blocks, [slice(0, 3), slice(3, 6), slice(6, 9), slice(9, 10)])
+        with mock.patch(
+            "ndx_hed.utils.hed_nwb_validator.get_hed_tabular", wraps=get_hed_tabular
+        ) as mocked_get_hed_tabular:
+            self.validator.validate_events(self.events, chunk_size=2)
+        blocks = [call.args[1] for call in mocked_get_hed_tabular.call_args_list if len(call.args) > 1]
+        self.assertEqual(blocks, [slice(0, 3), slice(3, 5), slice(5, 8), slice(8, 10)])
+
+    def test_offset_in_later_block(self):
+        """Test that an Offset closes an Onset from an earlier block, and an unmatched Offset is reported."""
+        events = get_events_table(
+            "events",
+            "Events",
+            pd.DataFrame({
+                "onset": [0.0, 1.0, 2.0, 3.0],
+                "HED": ["(Def/Rest, Onset)", "Red", "(Def/Rest, Offset)", "(Def/Rest, Offset)"],
+            }),
+            {"categorical": {}, "value": {}},
+        )
+        issues = self.validator.validate_events(events, chunk_size=1)
+        self.assertEqual(issue_signatures(issues, self.SIGNATURE_KEYS), [(None, 5, "TEMPORAL_TAG_ERROR")])
+
+    def test_hedtools_internals(self):
+        """Test that the hedtools internals block validation relies on are there, and the fallback without them."""
+        self.assertTrue(
+            BlockSpreadsheetValidator.supported(),
+            "The SpreadsheetValidator/OnsetValidator internals used by BlockSpreadsheetValidator have changed.",
+        )
+        expected = issue_signatures(self.validator.validate_events(self.events), self.SIGNATURE_KEYS)
+        with mock.patch.object(BlockSpreadsheetValidator, "supported", return_value=False):
+            with mock.patch.object(
+                HedNWBValidator, "_validate_assembled", autospec=True, side_effect=HedNWBValidator._validate_assembled
+            ) as validate_assembled:
+                issues = self.validator.validate_events(self.events, chunk_size=2)
+        validate_assembled.assert_called_once()
+        self.assertEqual(issue_signatures(issues, self.SIGNATURE_KEYS), expected)
+
+    def test_budget_and_progress(self):
+        """Test that the issue budget and progress reports follow the blocks."""
+        expected = issue_signatures(self.validator.validate_events(self.events, max_issues=3), self.SIGNATURE_KEYS)
+        issues = self.validator.validate_events(self.events, chunk_size=2, max_issues=3)
+        self.assertEqual(issue_signatures(issues, self.SIGNATURE_KEYS), expected)
+        calls = []
+        self.validator.validate_events(
+            self.events, chunk_size=4, progress=lambda *args: calls.append(args), cancel=threading.Event()
+        )
+        self.assertEqual(
+            calls, [("events", None, 0, 10), ("events", None, 4, 10), ("events", None, 8, 10), ("events", None, 10, 10)]
+        )
+
+    def test_fallback_to_whole_table(self):
+        """Test that tables with unsorted onsets or Delay tags are validated as a whole."""
+        delayed = get_events_table(
+            "events",
+            "Events",
+            pd.DataFrame({"onset": [0.0, 1.0, 2.0], "HED": ["(Def/Rest, Onset)", "(Delay/1.5 s, Red)", "Blue"]}),
+            {"categorical": {}, "value": {}},
+        )
+        unsorted = get_events_table(
+            "events",
+            "Events",
+            pd.DataFrame({"onset": [1.0, 0.0, 2.0], "HED": ["Red", "Blue", "InvalidTag1"]}),
+            {"categorical": {}, "value": {}},
+        )
+        for events in (delayed, unsorted):
+            expected = issue_signatures(self.validator.validate_events(events), self.SIGNATURE_KEYS)
+            with mock.patch.object(
+                self.validator, "_validate_assembled", wraps=self.validator._validate_assembled
+            ) as validate_assembled:
+                issues = self.validator.validate_events(events, chunk_size=1)
+            validate_assembled.assert_called_once()
+            self.assertEqual(issue_signatures(issues, self.SIGNATURE_KEYS), expected)
+
+    def test_invalid_chunk_size(self):
+        """Test that a chunk size below one is rejected."""
+        with self.assertRaises(ValueError):
+            self.validator.validate_events(self.events, chunk_size=0)
+
+
+class TestSidecarMemo(unittest.TestCase):
+    """Test class for reusing the sidecar validation issues of tables with the same column metadata."""
+
+    SIGNATURE_KEYS = ("code", ErrorContext.FILE_NAME, ErrorContext.SIDECAR_KEY_NAME)
+
+    def setUp(self):
+        """Set up runs with the same categorical and value metadata and an empty process-wide memo."""
+        self.hed_metadata = HedLabMetaData(hed_schema_version="8.4.0", definitions="(Definition/Go, (Red))")
+        self.meanings = {
+            "categorical": {"condition": {"HED": {"go": "Def/Go", "stop": "Agent-action", "unused": "InvalidTagU"}}},
+            "value": {"rt": "(Parameter-value/#)"},
+        }
+        self.runs = [self._run(f"run{index}", ["go", "stop", "bad"]) for index in range(3)]
+        patcher = mock.patch.object(hed_nwb_validator, "_sidecar_memo", hed_nwb_validator._SidecarIssueMemo())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _run(self, name, conditions):
+        return get_events_table(
+            name,
+            "Run",
+            pd.DataFrame({
+                "onset": [0.0, 1.0, 2.0],
+                "condition": conditions,
+                "rt": [0.5, 0.6, 0.7],
+                "HED": ["", "", ""],
+            }),
+            self.meanings,
+        )
+
+    def _validate_runs(self, validator, check_for_warnings=True):
+        return [
+            validator.validate_events(run, error_handler=ErrorHandler(check_for_warnings=check_for_warnings))
+            for run in self.runs
+        ]
+
+    def test_sidecar_validated_once(self):
+        """Test that identical sidecars are validated once, across tables and validators, with the same issues."""
+        with mock.patch.object(Sidecar, "validate", autospec=True, side_effect=Sidecar.validate) as validate:
+            issues = self._validate_runs(HedNWBValidator(self.hed_metadata))
+            issues += self._validate_runs(HedNWBValidator(self.hed_metadata), check_for_warnings=False)
+        self.assertEqual(validate.call_count, 1)
+        self.assertEqual(len(hed_nwb_validator._sidecar_memo), 1)
+
+        hed_nwb_validator.clear_sidecar_memo()
+        self.assertEqual(len(hed_nwb_validator._sidecar_memo), 0)
+        expected = self._validate_runs(HedNWBValidator(self.hed_metadata))
+        hed_nwb_validator.clear_sidecar_memo()
+        expected += self._validate_runs(HedNWBValidator(self.hed_metadata), check_for_warnings=False)
+        self.assertEqual(
+            [issue_signatures(run_issues, self.SIGNATURE_KEYS) for run_issues in issues],
+            [issue_signatures(run_issues, self.SIGNATURE_KEYS) for run_issues in expected],
+        )
+        self.assertIn(("TAG_INVALID", "run2", "unused"), issue_signatures(issues[2], self.SIGNATURE_KEYS))
+        self.assertIn("SIDECAR_KEY_MISSING", [issue["code"] for issue in issues[0]])
+        self.assertNotIn("SIDECAR_KEY_MISSING", [issue["code"] for issue in issues[3]])
+
+    def test_key_depends_on_definitions_and_metadata(self):
+        """Test that a sidecar is validated again for other definitions or other column metadata."""
+        self._validate_runs(HedNWBValidator(self.hed_metadata))
+        other = HedNWBValidator(HedLabMetaData(hed_schema_version="8.4.0", definitions="(Definition/Go, (Blue))"))
+        self._validate_runs(other)
+        self.meanings["categorical"]["condition"]["HED"]["unused"] = "Blue"
+        other.validate_events(self._run("changed", ["go", "go", "stop"]))
+        self.assertEqual(len(hed_nwb_validator._sidecar_memo), 3)
+
+    def test_memo_holds_no_hed_objects(self):
+        """Test that the memo stores HED tag and string objects of issues as strings, keeping no schema alive."""
+        hed_string = HedString("Red, (Blue, InvalidTagX)", HedLabMetaData(hed_schema_version="8.4.0").get_hed_schema())
+        tag = hed_string.get_all_tags()[2]
+        memo = hed_nwb_validator._SidecarIssueMemo()
+        memo.put("a", [{"code": "TAG_INVALID", "source_tag": tag, "ec_HedString": hed_string, "ec_row": 2}])
+        self.assertEqual(
+            memo.get("a"),
+            [{"code": "TAG_INVALID", "source_tag": "InvalidTagX", "ec_HedString": str(hed_string), "ec_row": 2}],
+        )
+
+    def test_memo_is_bounded(self):
+        """Test that the least recently used sidecars are dropped beyond max_entries."""
+        memo = hed_nwb_validator._SidecarIssueMemo(max_entries=2)
+        memo.put("a", [])
+        memo.put("b", [])
+        self.assertEqual(memo.get("a"), [])
+        memo.put("c", [])
+        self.assertEqual((memo.get("a"), memo.get("b"), memo.get("c")), ([], None, []))
+
+
+class TestThreadSafeValidator(unittest.TestCase):
+    """Test class for sharing a thread-safe validator and an ErrorHandler between threads."""
+
+    SIGNATURE_KEYS = ("code", ErrorContext.FILE_NAME, ErrorContext.ROW)
+
+    def setUp(self):
+        """Set up a thread-safe validator with definitions and tables with invalid HED."""
+        self.hed_metadata = HedLabMetaData(hed_schema_version="8.4.0", definitions="(Definition/Go, (Red))")
+        self.validator = HedNWBValidator(self.hed_metadata, thread_safe=True)
+        self.tables = [
+            DynamicTable(
+                name=f"table{index}",
+                description="Table with invalid HED",
+                columns=[HedTags(data=["Def/Go", f"InvalidTag{index}", "Blue", "Def/Stop"])],
+            )
+            for index in range(8)
+        ]
+
+    def test_shared_error_handler(self):
+        """Test that concurrent calls with one ErrorHandler give the serial issues and leave its context empty."""
+        error_handler = ErrorHandler(check_for_warnings=False)
+        expected = [self.validator.validate_table(table, error_handler) for table in self.tables]
+        results = [None] * len(self.tables)
+        barrier = threading.Barrier(len(self.tables))
+
+        def validate(index):
+            barrier.wait()
+            results[index] = self.validator.validate_table(self.tables[index], error_handler)
+
+        threads = [threading.Thread(target=validate, args=(index,)) for index in range(len(self.tables))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(error_handler.error_context, [])
+        self.assertEqual(
+            [issue_signatures(issues, self.SIGNATURE_KEYS) for issues in results],
+            [issue_signatures(issues, self.SIGNATURE_KEYS) for issues in expected],
+        )
+        self.assertTrue(all(len(issues) == 2 for issues in results))
+
+    def test_definitions_snapshot(self):
+        """Test that definitions added to the metadata later do not change a thread-safe validator."""
+        self.hed_metadata.add_definitions("(Definition/Stop, (Blue))")
+        self.assertNotIn("stop", self.validator.def_dict)
+        self.assertIn("stop", self.hed_metadata.get_definition_dict())
+        self.assertEqual(len(self.validator.validate_table(self.tables[0])), 2)
+        self.assertEqual(HedNWBValidator(self.hed_metadata).def_dict, self.hed_metadata.get_definition_dict())
+
+    @unittest.skipUnless("fork" in multiprocessing.get_all_start_methods(), "requires the fork start method")
+    def test_definitions_snapshot_in_workers(self):
+        """Test that worker validation and worker pools use the snapshot definitions, not the metadata's."""
+        from pynwb import NWBFile
+        from datetime import datetime
+        from zoneinfo import ZoneInfo
+
+        nwbfile = NWBFile(
+            session_description="Test session for a thread-safe validator",
+            identifier="thread_safe_file",
+            session_start_time=datetime(2024, 1, 1, 0, 0, 0, tzinfo=ZoneInfo("US/Pacific")),
+        )
+        nwbfile.add_lab_meta_data(self.hed_metadata)
+        nwbfile.add_acquisition(self.tables[0])
+        snapshot = self.hed_metadata.definitions
+        self.hed_metadata.add_definitions("(Definition/Stop, (Blue))")
+        expected = self.validator.validate_file(nwbfile)
+        self.assertEqual(len(expected), 2)
+
+        with mock.patch.dict(worker_pool._worker_validators, clear=True):
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                with mock.patch.object(executor, "submit", wraps=executor.submit) as submit:
+                    issues = self.validator.validate_file(nwbfile, executor=executor)
+            self.assertEqual([call.args[3] for call in submit.call_args_list], [snapshot])
+            self.assertEqual(
+                issue_signatures(issues, self.SIGNATURE_KEYS), issue_signatures(expected, self.SIGNATURE_KEYS)
+            )
+
+        registered = []
+
+        def create_pool(**kwargs):
+            registered.extend(worker_pool._worker_validators)
+            return mock.MagicMock()
+
+        with mock.patch.dict(worker_pool._worker_validators, clear=True):
+            with mock.patch.object(worker_pool, "ProcessPoolExecutor", side_effect=create_pool) as process_pool:
+                self.validator.create_worker_pool(2)
+            process_pool.assert_called_once()
+            self.assertEqual(registered, [("8.4.0", snapshot)])
+            self.assertEqual(worker_pool._worker_validators, {})
+
 
 class TestValidateWithDefinitions(unittest.TestCase):
     """Test class for validating HED tags that reference definitions.
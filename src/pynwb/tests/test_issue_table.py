@@ -0,0 +1,102 @@
+"""
+Unit tests for the IssueTable class.
+"""
+
+import unittest
+import numpy as np
+from hed.errors import ErrorContext, ErrorSeverity
+from pynwb.core import DynamicTable
+from ndx_hed import HedTags, HedLabMetaData
+from ndx_hed.utils.hed_nwb_validator import HedNWBValidator
+from ndx_hed.utils.issue_table import IssueTable
+from .issue_utils import issue_signatures
+
+
+class TestIssueTable(unittest.TestCase):
+    """Test class for the IssueTable columnar issue store."""
+
+    SIGNATURE_KEYS = ("code", "severity", "message", ErrorContext.FILE_NAME, ErrorContext.COLUMN, ErrorContext.ROW)
+
+    def setUp(self):
+        """Set up issues from a table with repeated invalid strings."""
+        validator = HedNWBValidator(HedLabMetaData(hed_schema_version="8.4.0"))
+        self.table = DynamicTable(
+            name="trials",
+            description="Trials",
+            columns=[HedTags(data=["Red", "InvalidTag1", "InvalidTag1", "Blue", "Bad2", "InvalidTag1"])],
+        )
+        self.validator = validator
+        self.issues = validator.validate_table(self.table)
+        self.issue_table = IssueTable(self.issues)
+
+    def test_columns(self):
+        """Test that the columns hold the issue fields and strings are interned."""
+        self.assertEqual(len(self.issue_table), 4)
+        self.assertEqual(self.issue_table.rows.tolist(), [1, 2, 4, 5])
+        self.assertEqual(self.issue_table.codes.tolist(), ["TAG_INVALID"] * 4)
+        self.assertEqual(self.issue_table.tables.tolist(), ["trials"] * 4)
+        self.assertEqual(self.issue_table.columns.tolist(), ["HED"] * 4)
+        self.assertTrue(np.all(self.issue_table.severities == ErrorSeverity.ERROR))
+        messages = self.issue_table.messages
+        self.assertIs(messages[0], messages[1])
+        self.assertTrue(self.issue_table.has_errors)
+
+    def test_iter_issues_round_trip(self):
+        """Test that the issues read back match the kept fields of the original issues."""
+        self.assertEqual(
+            issue_signatures(self.issue_table, self.SIGNATURE_KEYS), issue_signatures(self.issues, self.SIGNATURE_KEYS)
+        )
+
+    def test_extend_in_row_blocks(self):
+        """Test that issues appended block by block give the same table as all at once."""
+        issue_table = IssueTable()
+        for start in range(0, len(self.table), 4):
+            issue_table.extend(self.validator.validate_table(self.table, rows=slice(start, start + 4)))
+        self.assertEqual(
+            issue_signatures(issue_table, self.SIGNATURE_KEYS), issue_signatures(self.issue_table, self.SIGNATURE_KEYS)
+        )
+
+    def test_aggregate(self):
+        """Test that identical issues are collapsed into row ranges with counts."""
+        aggregated = self.issue_table.aggregate()
+        self.assertEqual([entry["count"] for entry in aggregated], [3, 1])
+        self.assertEqual(aggregated[0]["row_ranges"], [(1, 2), (5, 5)])
+        self.assertEqual(aggregated[1]["row_ranges"], [(4, 4)])
+        self.assertEqual(aggregated[0]["table"], "trials")
+        self.assertEqual(self.issue_table.count_by_code(), {"TAG_INVALID": 4})
+
+    def test_issues_without_context(self):
+        """Test issues without table, column, or row context."""
+        issue_table = IssueTable([
+            {"code": "SIDECAR_INVALID", "message": "Bad sidecar", "severity": ErrorSeverity.WARNING},
+            {"code": "SIDECAR_INVALID", "message": "Bad sidecar", "severity": ErrorSeverity.WARNING},
+        ])
+        self.assertFalse(issue_table.has_errors)
+        self.assertEqual(issue_table.rows.tolist(), [IssueTable.NO_ROW] * 2)
+        self.assertEqual(
+            list(issue_table)[0],
+            {"code": "SIDECAR_INVALID", "message": "Bad sidecar", "severity": ErrorSeverity.WARNING},
+        )
+        self.assertEqual(issue_table.aggregate()[0]["row_ranges"], [])
+        self.assertEqual(issue_table.to_dataframe()["table"].isna().tolist(), [True, True])
+
+    def test_to_dataframe(self):
+        """Test the DataFrame form of the table."""
+        df = self.issue_table.to_dataframe()
+        self.assertEqual(list(df.columns), ["code", "severity", "table", "column", "row", "message"])
+        self.assertEqual(df["row"].tolist(), [1, 2, 4, 5])
+        self.assertEqual(df["code"].dtype, "category")
+        self.assertEqual(df["table"].tolist(), ["trials"] * 4)
+
+    def test_get_printable_string(self):
+        """Test the compact report, one line per group of identical issues."""
+        report = self.issue_table.get_printable_string(max_ranges=1)
+        lines = report.split("\n")
+        self.assertEqual(lines[0], "4 issues: TAG_INVALID 4")
+        self.assertEqual(len(lines), 3)
+        self.assertIn("[trials/HED] rows 1-2, ... (1 more) (3x)", lines[1])
+        self.assertEqual(IssueTable().get_printable_string(), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
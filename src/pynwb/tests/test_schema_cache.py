@@ -0,0 +1,207 @@
+"""
+Unit tests for the HedSchemaCache class.
+"""
+
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+from datetime import datetime
+from dateutil.tz import tzlocal
+from pynwb import NWBFile, NWBHDF5IO
+from hed.errors import HedFileError
+from hed.schema import HedSchemaGroup, load_schema_version
+from ndx_hed import HedLabMetaData
+from ndx_hed.utils import schema_cache
+from ndx_hed.utils.schema_cache import (
+    HedSchemaCache,
+    get_schema_cache,
+    get_snapshot_path,
+    load_schema_snapshot,
+    save_schema_snapshot,
+)
+
+
+class TestHedSchemaCache(unittest.TestCase):
+    """Test class for the process-wide HED schema cache."""
+
+    def setUp(self):
+        patcher = mock.patch.object(schema_cache, "load_schema_version", side_effect=lambda version: object())
+        self.load_schema = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_normalized_versions(self):
+        """Test that a version is loaded once however it is written, including schema groups."""
+        cache = HedSchemaCache()
+        schema = cache.get("8.4.0")
+        self.assertIs(cache.get(" 8.4.0 "), schema)
+        self.assertIs(cache.get('["8.4.0"]'), schema)
+        group = cache.get('["8.4.0", "bc:score_2.1.0"]')
+        self.assertIs(cache.get(["8.4.0", "bc:score_2.1.0"]), group)
+        self.assertEqual(
+            [call.args[0] for call in self.load_schema.call_args_list],
+            ["8.4.0", ["8.4.0", "bc:score_2.1.0"]],
+        )
+        self.assertEqual(cache.versions, ["8.4.0", '["8.4.0","bc:score_2.1.0"]'])
+        self.assertIn(("8.4.0", "bc:score_2.1.0"), cache)
+
+    def test_least_recently_used_eviction(self):
+        """Test that the least recently used schemas are dropped beyond max_entries."""
+        cache = HedSchemaCache(max_entries=2)
+        cache.preload(["8.2.0", "8.3.0"])
+        cache.get("8.2.0")
+        cache.get("8.4.0")
+        self.assertEqual(cache.versions, ["8.2.0", "8.4.0"])
+        self.assertNotIn("8.3.0", cache)
+        with self.assertRaises(ValueError):
+            HedSchemaCache(max_entries=0)
+
+    def test_clear(self):
+        """Test dropping one version and all versions."""
+        cache = HedSchemaCache()
+        schemas = cache.preload(["8.3.0", "8.4.0"])
+        cache.clear("8.3.0")
+        self.assertEqual(cache.versions, ["8.4.0"])
+        self.assertIs(cache.get("8.4.0"), schemas[1])
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertIsNot(cache.get("8.4.0"), schemas[1])
+
+    def test_concurrent_loads(self):
+        """Test that threads asking for a version being loaded wait for it instead of loading it again."""
+
+        def slow_load(version):
+            time.sleep(0.05)
+            return object()
+
+        self.load_schema.side_effect = slow_load
+        cache = HedSchemaCache()
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cache.get("8.4.0"))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.load_schema.call_count, 1)
+        self.assertEqual(len({id(schema) for schema in results}), 1)
+
+    def test_failed_load(self):
+        """Test that a version that fails to load is not cached and raises the hedtools error."""
+        self.load_schema.side_effect = HedFileError("fileNotFound", "Not found", "")
+        cache = HedSchemaCache()
+        with self.assertRaises(HedFileError):
+            cache.get("99.99.99")
+        self.assertEqual(len(cache), 0)
+
+
+class TestSchemaSnapshots(unittest.TestCase):
+    """Test class for saving and loading binary schema snapshots."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.schema = load_schema_version("8.4.0")
+
+    def test_round_trip(self):
+        """Test that a snapshot loads back as an equal schema, for a schema and a schema group."""
+        path = os.path.join(self.temp_dir.name, "schema.hedsnap")
+        save_schema_snapshot(self.schema, path)
+        loaded = load_schema_snapshot(path, "8.4.0")
+        self.assertEqual(loaded, self.schema)
+        self.assertEqual(loaded.get_formatted_version(), self.schema.get_formatted_version())
+
+        group = load_schema_version('["8.4.0","sc:score_2.1.0"]')
+        save_schema_snapshot(group, path, '["8.4.0","sc:score_2.1.0"]')
+        loaded = load_schema_snapshot(path, ["8.4.0", "sc:score_2.1.0"])
+        self.assertIsInstance(loaded, HedSchemaGroup)
+        self.assertEqual(loaded.get_formatted_version(), group.get_formatted_version())
+        with self.assertRaises(ValueError):
+            save_schema_snapshot("8.4.0", path)
+
+    def test_invalid_snapshots(self):
+        """Test that missing, foreign, corrupt, stale, or mismatched snapshots are rejected."""
+        path = os.path.join(self.temp_dir.name, "schema.hedsnap")
+        with self.assertRaises(HedFileError):
+            load_schema_snapshot(path)
+        save_schema_snapshot(self.schema, path)
+        with self.assertRaises(HedFileError):
+            load_schema_snapshot(path, "8.3.0")
+        with mock.patch.object(schema_cache, "hedtools_version", "0.0.0"):
+            with self.assertRaises(HedFileError):
+                load_schema_snapshot(path)
+        with open(path, "r+b") as file:
+            file.seek(-10, os.SEEK_END)
+            file.write(b"corrupted!")
+        with self.assertRaises(HedFileError):
+            load_schema_snapshot(path)
+        with open(path, "wb") as file:
+            file.write(b"<?xml version='1.0'?>")
+        with self.assertRaises(HedFileError):
+            load_schema_snapshot(path)
+
+    def test_cache_with_snapshot_dir(self):
+        """Test that a cache saves parsed schemas as snapshots only if asked to, and later caches load them."""
+        snapshot_dir = os.path.join(self.temp_dir.name, "snapshots")
+        HedSchemaCache(snapshot_dir=snapshot_dir).get("8.4.0")
+        self.assertFalse(os.path.exists(snapshot_dir))
+        HedSchemaCache(snapshot_dir=snapshot_dir, save_snapshots=True).get("8.4.0")
+        path = get_snapshot_path(snapshot_dir, '["8.4.0"]')
+        self.assertTrue(os.path.isfile(path))
+
+        with mock.patch.object(schema_cache, "load_schema_version") as load:
+            schema = HedSchemaCache(snapshot_dir=snapshot_dir).get("8.4.0")
+        load.assert_not_called()
+        self.assertEqual(schema, self.schema)
+
+        with mock.patch.object(schema_cache, "hedtools_version", "0.0.0"):
+            with mock.patch.object(schema_cache, "load_schema_version", return_value=self.schema) as load:
+                HedSchemaCache(snapshot_dir=snapshot_dir, save_snapshots=True).get("8.4.0")
+            load.assert_called_once()
+            self.assertIs(load_schema_snapshot(path, "8.4.0").__class__, self.schema.__class__)
+
+
+class TestSharedSchemaCache(unittest.TestCase):
+    """Test class for the schema cache shared by HedLabMetaData objects."""
+
+    def test_metadata_shares_schema(self):
+        """Test that HedLabMetaData objects, including those read from files, share one loaded schema."""
+        schema = HedLabMetaData(hed_schema_version="8.4.0").get_hed_schema()
+        self.assertIs(schema, get_schema_cache().get("8.4.0"))
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "schema_cache.nwb")
+            nwbfile = NWBFile(
+                session_description="Schema cache",
+                identifier="schema_cache",
+                session_start_time=datetime.now(tzlocal()),
+            )
+            nwbfile.add_lab_meta_data(HedLabMetaData(hed_schema_version="8.4.0"))
+            with NWBHDF5IO(path, "w") as io:
+                io.write(nwbfile)
+            with mock.patch.object(schema_cache, "load_schema_version") as load_schema:
+                for _ in range(3):
+                    with NWBHDF5IO(path, "r") as io:
+                        read_metadata = io.read().lab_meta_data["hed_schema"]
+                        self.assertIs(read_metadata.get_hed_schema(), schema)
+            load_schema.assert_not_called()
+
+    def test_schema_groups(self):
+        """Test that a schema group is loaded as load_schema_version loads it, however its versions are written."""
+        cache = HedSchemaCache()
+        group = cache.get('["8.4.0", "sc:score_2.1.0"]')
+        self.assertIsInstance(group, HedSchemaGroup)
+        self.assertIs(cache.get(["8.4.0", "sc:score_2.1.0"]), group)
+        self.assertEqual(
+            group.get_formatted_version(), load_schema_version(["8.4.0", "sc:score_2.1.0"]).get_formatted_version()
+        )
+
+    def test_invalid_version(self):
+        """Test that HedLabMetaData still reports a version that cannot be loaded as a ValueError."""
+        with self.assertRaises(ValueError):
+            HedLabMetaData(hed_schema_version="99.99.99")
+        self.assertNotIn("99.99.99", get_schema_cache())
+
+
+if __name__ == "__main__":
+    unittest.main()
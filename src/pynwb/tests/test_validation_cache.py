@@ -0,0 +1,223 @@
+"""
+Unit tests for the ValidationCache class and its use by HedNWBValidator.
+"""
+
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest import mock
+from datetime import datetime
+from dateutil.tz import tzlocal
+from hdmf.common import MeaningsTable
+from hed.errors import ErrorHandler, ErrorContext, ErrorSeverity
+from hed.models import HedString
+from hed.validator import HedValidator
+from pynwb import NWBFile
+from pynwb.event import EventsTable, TimestampVectorData
+from ndx_hed import HedTags, HedLabMetaData, HedValueVector
+from ndx_hed.utils.hed_nwb_validator import HedNWBValidator
+from ndx_hed.utils.spreadsheet_validators import CachedSpreadsheetValidator
+from ndx_hed.utils.validation_cache import ValidationCache
+from .issue_utils import issue_signatures
+
+
+class TestValidationCache(unittest.TestCase):
+    """Test class for the ValidationCache storage."""
+
+    def setUp(self):
+        """Create a cache in a temporary directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "hed_cache.sqlite")
+        self.issue = {"code": "TAG_INVALID", "message": "Bad tag", "severity": ErrorSeverity.ERROR, "source_tag": 3}
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_put_and_get_persist(self):
+        """Test that entries survive closing and reopening the cache file."""
+        with ValidationCache(self.path) as cache:
+            self.assertIsNone(cache.get("8.4.0", "abc", False, "Bad"))
+            cache.put("8.4.0", "abc", False, "Bad", [self.issue])
+            cache.put("8.4.0", "abc", False, "Red", [])
+
+        with ValidationCache(self.path) as cache:
+            self.assertEqual(len(cache), 2)
+            issues = cache.get("8.4.0", "abc", False, "Bad")
+            self.assertEqual(issues, [self.issue])
+            self.assertIsInstance(issues[0]["severity"], ErrorSeverity)
+            self.assertEqual(cache.get("8.4.0", "abc", False, "Red"), [])
+            self.assertIsNone(cache.get("8.4.0", "abc", True, "Bad"))
+            self.assertIsNone(cache.get("8.4.0", "other", False, "Bad"))
+            self.assertIsNone(cache.get("8.3.0", "abc", False, "Bad"))
+
+    def test_eviction_removes_least_recently_used(self):
+        """Test that the cache stays bounded and evicts the least recently used entries."""
+        with ValidationCache(self.path, max_entries=10) as cache:
+            cache.put("8.4.0", "abc", False, "string0", [])
+            for index in range(1, 11):
+                cache.put("8.4.0", "abc", False, f"string{index}", [])
+                cache.get("8.4.0", "abc", False, "string0")
+            self.assertLessEqual(len(cache), 10)
+            self.assertIsNotNone(cache.get("8.4.0", "abc", False, "string0"))
+            self.assertIsNone(cache.get("8.4.0", "abc", False, "string1"))
+
+    def test_hedtools_version_change_clears_cache(self):
+        """Test that a cache written by a different hedtools version is emptied on open."""
+        with ValidationCache(self.path) as cache:
+            cache.put("8.4.0", "abc", False, "Red", [])
+        connection = sqlite3.connect(self.path)
+        with connection:
+            connection.execute("UPDATE metadata SET value = '0.0.0' WHERE name = 'hedtools_version'")
+        connection.close()
+
+        with ValidationCache(self.path) as cache:
+            self.assertEqual(len(cache), 0)
+            self.assertIsNone(cache.get("8.4.0", "abc", False, "Red"))
+
+    def test_invalid_max_entries(self):
+        """Test that a non-positive size bound is rejected."""
+        with self.assertRaises(ValueError):
+            ValidationCache(self.path, max_entries=0)
+
+
+class TestValidatorWithCache(unittest.TestCase):
+    """Test class for HedNWBValidator using a persistent ValidationCache."""
+
+    SIGNATURE_KEYS = ("code", "message", ErrorContext.COLUMN, ErrorContext.ROW)
+
+    def setUp(self):
+        """Set up validators with and without a cache."""
+        self.hed_metadata = HedLabMetaData(
+            hed_schema_version="8.4.0", definitions="(Definition/Go-stimulus, (Sensory-event, Visual-presentation))"
+        )
+        self.cache = ValidationCache(":memory:")
+        self.validator = HedNWBValidator(self.hed_metadata)
+        self.cached_validator = HedNWBValidator(self.hed_metadata, cache=self.cache)
+        self.hed_tags = HedTags(
+            data=["Def/Go-stimulus", "InvalidTag123", "Red, (Blue", "InvalidTag123", "n/a", "Def/Undefined"]
+        )
+
+    def tearDown(self):
+        self.cache.close()
+
+    def test_cached_issues_match_uncached(self):
+        """Test that cache misses and hits return the same issues as validation without a cache."""
+        error_handler = ErrorHandler(check_for_warnings=False)
+        error_handler.push_error_context(ErrorContext.COLUMN, "HED")
+        expected = self.validator.validate_vector(self.hed_tags, error_handler)
+        first = self.cached_validator.validate_vector(self.hed_tags, error_handler)
+        second = self.cached_validator.validate_vector(self.hed_tags, error_handler)
+
+        self.assertGreater(len(expected), 0)
+        self.assertEqual(issue_signatures(first, self.SIGNATURE_KEYS), issue_signatures(expected, self.SIGNATURE_KEYS))
+        self.assertEqual(issue_signatures(second, self.SIGNATURE_KEYS), issue_signatures(expected, self.SIGNATURE_KEYS))
+        self.assertEqual(len(self.cache), 4)
+
+    def test_cache_hits_skip_parsing(self):
+        """Test that strings found in the cache are not parsed again."""
+        self.cached_validator.validate_vector(self.hed_tags)
+        with mock.patch("ndx_hed.utils.hed_nwb_validator.HedString", wraps=HedString) as hed_string:
+            HedNWBValidator(self.hed_metadata, cache=self.cache).validate_vector(self.hed_tags)
+        hed_string.assert_not_called()
+
+    def test_cached_warnings_follow_error_handler(self):
+        """Test that cached warnings are only reported when the error handler checks for warnings."""
+        hed_tags = HedTags(data=["Item/Blue-x", "Item/Blue-x"])  # TAG_EXTENDED is a warning
+        for check_for_warnings in (True, False, True):
+            with self.subTest(check_for_warnings=check_for_warnings):
+                expected = self.validator.validate_vector(hed_tags, ErrorHandler(check_for_warnings))
+                issues = self.cached_validator.validate_vector(hed_tags, ErrorHandler(check_for_warnings))
+                self.assertEqual(
+                    issue_signatures(issues, self.SIGNATURE_KEYS), issue_signatures(expected, self.SIGNATURE_KEYS)
+                )
+
+    def test_definition_change_invalidates_entries(self):
+        """Test that entries are keyed by the definitions, so adding one re-validates affected strings."""
+        hed_tags = HedTags(data=["Def/Stop-stimulus"])
+        self.assertEqual(len(self.cached_validator.validate_vector(hed_tags)), 1)
+        self.hed_metadata.add_definitions("(Definition/Stop-stimulus, (Sensory-event, Auditory-presentation))")
+        self.assertEqual(self.cached_validator.validate_vector(hed_tags), [])
+
+    def test_value_vector_uses_cache(self):
+        """Test that suspect HedValueVector values are validated through the cache."""
+        hed_values = HedValueVector(name="label", description="Labels", data=["a,b", "ok", "a,b"], hed="Label/#")
+        expected = self.validator.validate_value_vector(hed_values)
+        self.assertEqual(
+            issue_signatures(self.cached_validator.validate_value_vector(hed_values), self.SIGNATURE_KEYS),
+            issue_signatures(expected, self.SIGNATURE_KEYS),
+        )
+        self.assertEqual(
+            issue_signatures(self.cached_validator.validate_value_vector(hed_values), self.SIGNATURE_KEYS),
+            issue_signatures(expected, self.SIGNATURE_KEYS),
+        )
+
+    def _nwbfile(self):
+        events = EventsTable(
+            name="events",
+            description="Events with direct, categorical, and value HED",
+            columns=[
+                TimestampVectorData(name="timestamp", description="Event timestamps", data=[1.0, 2.0, 2.0, 3.0]),
+                HedTags(data=["Def/Go-stimulus", "InvalidTag123", "(Onset, Def/Go-stimulus)", "Red, (Blue"]),
+            ],
+        )
+        events.add_column(name="condition", description="Conditions", data=["a", "b", "a", "b"])
+        events.add_column(
+            name="count", description="Counts", col_cls=HedValueVector, data=[1, -2, 3, 1], hed="Item-count/#"
+        )
+        meanings = MeaningsTable(target=events["condition"], description="Condition meanings")
+        meanings.add_row(value="a", meaning="Condition A")
+        meanings.add_row(value="b", meaning="Condition B")
+        meanings.add_column(name="HED", description="HED tags", col_cls=HedTags, data=["Green", "InvalidTag2"])
+        events.add_meanings_table(meanings)
+        nwbfile = NWBFile(
+            session_description="Session validated with a cache",
+            identifier="cached_file",
+            session_start_time=datetime.now(tzlocal()),
+        )
+        nwbfile.add_lab_meta_data(self.hed_metadata)
+        nwbfile.add_acquisition(events)
+        return nwbfile
+
+    def test_validate_file_uses_cache(self):
+        """Test that assembled validation of a file stores its cell checks and reuses them on the next run."""
+        nwbfile = self._nwbfile()
+        expected = self.validator.validate_file(nwbfile)
+        first = self.cached_validator.validate_file(nwbfile)
+        self.assertGreater(len(self.cache), 0)
+        with mock.patch.object(
+            HedValidator, "run_basic_checks", autospec=True, side_effect=HedValidator.run_basic_checks
+        ) as run_basic_checks:
+            second = HedNWBValidator(self.hed_metadata, cache=self.cache).validate_file(nwbfile)
+        run_basic_checks.assert_not_called()
+
+        self.assertGreater(len(expected), 0)
+        self.assertEqual(issue_signatures(first, self.SIGNATURE_KEYS), issue_signatures(expected, self.SIGNATURE_KEYS))
+        self.assertEqual(issue_signatures(second, self.SIGNATURE_KEYS), issue_signatures(expected, self.SIGNATURE_KEYS))
+
+    def test_hedtools_internals(self):
+        """Test that the hedtools internals the cached cell checks rely on are there, and the fallback without them."""
+        self.assertTrue(
+            CachedSpreadsheetValidator.supported(),
+            "The SpreadsheetValidator internals used by CachedSpreadsheetValidator have changed.",
+        )
+        nwbfile = self._nwbfile()
+        expected = self.validator.validate_file(nwbfile)
+        with mock.patch.object(CachedSpreadsheetValidator, "supported", return_value=False):
+            issues = self.cached_validator.validate_file(nwbfile)
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(issue_signatures(issues, self.SIGNATURE_KEYS), issue_signatures(expected, self.SIGNATURE_KEYS))
+
+    def test_validate_events_in_blocks_uses_cache(self):
+        """Test that block-wise assembled validation reads the same cell checks from the cache."""
+        events = self._nwbfile().acquisition["events"]
+        expected = self.validator.validate_events(events)
+        self.cached_validator.validate_events(events)
+        size = len(self.cache)
+        issues = self.cached_validator.validate_events(events, chunk_size=2)
+        self.assertEqual(len(self.cache), size)
+        self.assertEqual(issue_signatures(issues, self.SIGNATURE_KEYS), issue_signatures(expected, self.SIGNATURE_KEYS))
+
+
+if __name__ == "__main__":
+    unittest.main()
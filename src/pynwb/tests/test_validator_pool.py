@@ -0,0 +1,162 @@
+"""
+Unit tests for the HedValidatorPool class.
+"""
+
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+from datetime import datetime
+from dateutil.tz import tzlocal
+from pynwb import NWBFile, NWBHDF5IO
+from pynwb.core import DynamicTable
+from hed.errors import HedFileError
+from ndx_hed import HedTags, HedLabMetaData
+from ndx_hed.utils import validator_pool
+from ndx_hed.utils.hed_nwb_validator import HedNWBValidator
+from ndx_hed.utils.validator_pool import HedValidatorPool
+
+
+class TestHedValidatorPool(unittest.TestCase):
+    """Test class for validating files with mixed HED schema versions through a HedValidatorPool."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    @staticmethod
+    def _nwbfile(identifier, schema_version, definitions=None):
+        nwbfile = NWBFile(
+            session_description="Test session for the validator pool",
+            identifier=identifier,
+            session_start_time=datetime.now(tzlocal()),
+        )
+        nwbfile.add_lab_meta_data(HedLabMetaData(hed_schema_version=schema_version, definitions=definitions))
+        nwbfile.add_acquisition(
+            DynamicTable(
+                name="trials",
+                description="Trials",
+                columns=[HedTags(data=["Red", "InvalidTag1", "Def/Go"])],
+            )
+        )
+        return nwbfile
+
+    def _write(self, identifier, schema_version, definitions=None):
+        path = os.path.join(self.temp_dir.name, f"{identifier}.nwb")
+        with NWBHDF5IO(path, "w") as io:
+            io.write(self._nwbfile(identifier, schema_version, definitions))
+        return path
+
+    @staticmethod
+    def _codes(issues):
+        return [issue["code"] for issue in issues]
+
+    def test_mixed_versions(self):
+        """Test that files with different schema versions are each validated with a validator for their version."""
+        versions = ["8.2.0", "8.3.0", "8.4.0", "8.3.0", "8.4.0"]
+        nwbfiles = [self._nwbfile(f"file{index}", version) for index, version in enumerate(versions)]
+        pool = HedValidatorPool()
+        results = pool.validate_files(nwbfiles)
+        self.assertEqual(len(pool), 3)
+        self.assertEqual(pool.schema_versions, ["8.2.0", "8.3.0", "8.4.0"])
+        for nwbfile, issues in zip(nwbfiles, results, strict=True):
+            expected = HedNWBValidator(nwbfile.lab_meta_data["hed_schema"]).validate_file(nwbfile)
+            self.assertEqual(self._codes(issues), self._codes(expected))
+        self.assertIs(pool.get_file_validator(nwbfiles[1]), pool.get_file_validator(nwbfiles[3]))
+        self.assertIs(pool.get_validator("8.4.0"), pool.get_file_validator(nwbfiles[2]))
+
+    def test_definitions_get_their_own_validator(self):
+        """Test that files with the same version but different definitions are validated with their definitions."""
+        with_definition = self._nwbfile("defined", "8.4.0", "(Definition/Go, (Sensory-event))")
+        without_definition = self._nwbfile("undefined", "8.4.0")
+        pool = HedValidatorPool()
+        defined_issues, undefined_issues = pool.validate_files([with_definition, without_definition])
+        self.assertEqual(len(pool), 2)
+        self.assertEqual(pool.schema_versions, ["8.4.0"])
+        self.assertEqual(len(undefined_issues), len(defined_issues) + 1)
+
+    def test_file_validator_copies_metadata(self):
+        """Test that a pooled validator does not hold the file's HedLabMetaData or follow later changes to it."""
+        nwbfile = self._nwbfile("copied", "8.4.0", "(Definition/Go, (Sensory-event))")
+        hed_metadata = nwbfile.lab_meta_data["hed_schema"]
+        pool = HedValidatorPool()
+        validator = pool.get_file_validator(nwbfile)
+        self.assertIsNot(validator._hed_metadata, hed_metadata)
+        self.assertIsNone(validator._hed_metadata.parent)
+        self.assertIs(pool.get_validator("8.4.0", hed_metadata.definitions), validator)
+
+        hed_metadata.add_definitions("(Definition/Stop, (Agent-action))")
+        self.assertEqual(list(validator.def_dict.defs), ["go"])
+        self.assertIsNot(pool.get_file_validator(nwbfile), validator)
+        self.assertEqual(len(pool), 2)
+
+    def test_schema_group_versions(self):
+        """Test that a schema group is one pool entry however its version list is written."""
+        pool = HedValidatorPool()
+        validator = pool.get_validator('["8.4.0","bc:score_2.1.0"]')
+        self.assertIs(pool.get_validator('["8.4.0", "bc:score_2.1.0"]'), validator)
+        self.assertIs(pool.get_validator(["8.4.0", "bc:score_2.1.0"]), validator)
+        self.assertEqual(pool.schema_versions, ['["8.4.0","bc:score_2.1.0"]'])
+        nwbfile = self._nwbfile("group", '["8.4.0", "bc:score_2.1.0"]')
+        self.assertIs(pool.get_file_validator(nwbfile), validator)
+        self.assertEqual(self._codes(pool.validate_file(nwbfile)), ["TAG_INVALID", "DEF_INVALID"])
+
+    def test_validate_paths(self):
+        """Test that files on disk reuse the validator (and its metadata) of their schema version."""
+        paths = [self._write("a", "8.3.0"), self._write("b", "8.4.0"), self._write("c", "8.3.0")]
+        pool = HedValidatorPool()
+        with mock.patch.object(validator_pool, "HedLabMetaData", wraps=HedLabMetaData) as lab_metadata:
+            results = pool.validate_paths(paths)
+        self.assertEqual(lab_metadata.call_count, 2)
+        for path, issues in zip(paths, results, strict=True):
+            self.assertEqual(self._codes(issues), self._codes(HedNWBValidator.validate_path(path)))
+        path = os.path.join(self.temp_dir.name, "no_hed.nwb")
+        with NWBHDF5IO(path, "w") as io:
+            io.write(
+                NWBFile(session_description="No HED", identifier="no_hed", session_start_time=datetime.now(tzlocal()))
+            )
+        with self.assertRaises(HedFileError):
+            pool.validate_path(path)
+
+    def test_concurrent_get_validator(self):
+        """Test that threads asking for the same version share one validator."""
+        pool = HedValidatorPool()
+        validators = []
+        threads = [threading.Thread(target=lambda: validators.append(pool.get_validator("8.4.0"))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len({id(validator) for validator in validators}), 1)
+        pool.clear()
+        self.assertEqual(len(pool), 0)
+
+    def test_pool_is_bounded(self):
+        """Test that the least recently used validators are dropped beyond max_entries, keyed by definitions hash."""
+        pool = HedValidatorPool(max_entries=2)
+        first = pool.get_validator("8.4.0", "(Definition/Go, (Red))")
+        dropped = pool.get_validator("8.3.0")
+        self.assertIs(pool.get_validator("8.4.0", "(Definition/Go, (Red))"), first)
+        pool.get_validator("8.4.0")
+        self.assertEqual(len(pool), 2)
+        self.assertEqual(pool.schema_versions, ["8.4.0"])
+        self.assertIs(pool.get_validator("8.4.0", "(Definition/Go, (Red))"), first)
+        self.assertIsNot(pool.get_validator("8.3.0"), dropped)
+        self.assertNotIn("(Definition/Go, (Red))", [definitions for _, definitions in pool._validators])
+        with self.assertRaises(ValueError):
+            HedValidatorPool(max_entries=0)
+
+    def test_file_without_metadata(self):
+        """Test that a file without HedLabMetaData raises HedFileError."""
+        nwbfile = NWBFile(session_description="No HED", identifier="no_hed", session_start_time=datetime.now(tzlocal()))
+        with self.assertRaises(HedFileError):
+            HedValidatorPool().validate_file(nwbfile)
+        with self.assertRaises(ValueError):
+            HedValidatorPool().get_file_validator(None)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,14 +1,14 @@
 # -*- coding: utf-8 -*-
 import os.path
 
-from pynwb.spec import NWBNamespaceBuilder, export_spec, NWBDatasetSpec, NWBAttributeSpec, NWBGroupSpec
+from pynwb.spec import NWBNamespaceBuilder, export_spec, NWBDatasetSpec, NWBAttributeSpec, NWBGroupSpec, NWBDtypeSpec
 
 
 def main():
     # these arguments were auto-generated from your cookiecutter inputs
     ns_builder = NWBNamespaceBuilder(
         name="""ndx-hed""",
-        version="""1.0.0""",
+        version="""1.1.0""",
         doc="""NWB extension for HED data""",
         author=[
             "Kay Robbins",
@@ -70,6 +70,30 @@ def main():
                 required=False,
             ),
         ],
+        datasets=[
+            NWBDatasetSpec(
+                name="definitions_table",
+                doc="The HED definitions as a table with one row per definition, an alternative to the "
+                "definitions attribute for files with many definitions. New in version 1.1.0. A file with a "
+                "definitions table also stores the same definitions as the definitions attribute, for readers of "
+                "earlier versions; readers that support the table use it and ignore the attribute.",
+                dtype=[
+                    NWBDtypeSpec(name="name", doc="The name of the definition.", dtype="text"),
+                    NWBDtypeSpec(
+                        name="takes_value",
+                        doc="Whether the definition takes a value (Definition/name/#).",
+                        dtype="bool",
+                    ),
+                    NWBDtypeSpec(name="contents", doc="The HED string of the definition's contents.", dtype="text"),
+                    NWBDtypeSpec(
+                        name="content_hash", doc="A SHA-256 hex digest of the serialized definition.", dtype="text"
+                    ),
+                ],
+                shape=[None],
+                dims=["num_definitions"],
+                quantity="?",
+            ),
+        ],
     )
 
     # Add all of new data types to this list